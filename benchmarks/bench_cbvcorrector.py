@@ -0,0 +1,100 @@
+"""Benchmark of the alpha optimization of `CBVCorrector.correct`.
+
+Times the end-to-end ``correct()`` call on a synthetic light curve and design
+matrix, and the share of that time spent in the over-fitting metric.  The
+under-fitting metric is disabled (``target_under_score=-1``), as it needs to
+download the light curves of neighboring targets from MAST.
+
+The optimization is timed with the normal equations shared across the alpha
+values, as ``correct()`` does, and with new normal equations for every fit
+(including the rank check of the design matrix), as before they were shared.
+The script only uses the public API for the end-to-end timing, so it can also
+be run against an older version of lightkurve.  Run from the root of the
+repository with::
+
+    python benchmarks/bench_cbvcorrector.py [--cadences N] [--regressors K]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+import astropy.units as u
+import numpy as np
+import pandas as pd
+
+from lightkurve import TessLightCurve
+from lightkurve.correctors import CBVCorrector, DesignMatrix, RegressionCorrector
+
+
+class UnsharedCBVCorrector(CBVCorrector):
+    """`CBVCorrector` building new normal equations for every alpha value."""
+
+    def _normal_equations(self, X):
+        return RegressionCorrector._normal_equations(self, X)
+
+
+def make_data(n_cadences, n_regressors, seed=42):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_cadences) / 720.0  # 2-minute cadences, in days
+    # Smooth systematics, like the basis vectors of a TESS sector
+    X = np.column_stack(
+        [np.sin(2 * np.pi * t / rng.uniform(1, 30) + rng.uniform(0, 2 * np.pi))
+         for _ in range(n_regressors)]
+    )
+    flux = 1000 + X.dot(rng.normal(0, 5, n_regressors)) + rng.normal(0, 1, n_cadences)
+    lc = TessLightCurve(
+        time=t + 2000,
+        flux=flux,
+        flux_err=np.ones(n_cadences),
+        cadenceno=np.arange(n_cadences),
+        flux_unit=u.Unit("electron / second"),
+    )
+    dm = DesignMatrix(pd.DataFrame(X, columns=["cbv{}".format(i) for i in range(n_regressors)]))
+    return lc, dm
+
+
+def time_correct(cls, lc, dm):
+    """Returns the duration of `correct()`, the time spent in the over-fitting
+    metric, and the optimized alpha."""
+    corrector = cls(lc, do_not_load_cbvs=True)
+    metric_time = [0.0]
+    over_fitting_metric = corrector.over_fitting_metric
+
+    def timed_over_fitting_metric(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return over_fitting_metric(*args, **kwargs)
+        finally:
+            metric_time[0] += time.perf_counter() - start
+
+    corrector.over_fitting_metric = timed_over_fitting_metric
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # silence the scores
+        corrector.correct(cbv_type=None, cbv_indices=None, ext_dm=dm, target_under_score=-1)
+    return time.perf_counter() - start, metric_time[0], corrector.alpha
+
+
+def run(n_cadences, n_regressors, repeat):
+    lc, dm = make_data(n_cadences, n_regressors)
+    print(
+        "CBVCorrector.correct(), {} cadences x {} regressors (best of {}):".format(
+            n_cadences, n_regressors, repeat
+        )
+    )
+    for name, cls in [("shared", CBVCorrector), ("unshared", UnsharedCBVCorrector)]:
+        results = [time_correct(cls, lc, dm) for _ in range(repeat)]
+        total, metric, alpha = min(results)
+        print(
+            "  {:<9s} total {:7.2f} s, over-fitting metric {:7.2f} s, "
+            "other {:6.2f} s (alpha={:.3e})".format(name, total, metric, total - metric, alpha)
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cadences", type=int, default=20000)
+    parser.add_argument("--regressors", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.cadences, args.regressors, args.repeat)
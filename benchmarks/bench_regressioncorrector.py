@@ -0,0 +1,95 @@
+"""Benchmark of the normal equations solved by `RegressionCorrector`.
+
+Compares the previous implementation, which rebuilt and solved the dense
+normal equations from all the cadences at every sigma-clipping iteration,
+with `_NormalEquations`, which updates them with the cadences entering or
+leaving the mask.  Run from the root of the repository with::
+
+    python benchmarks/bench_regressioncorrector.py [--cadences N] [--regressors K]
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse
+
+from lightkurve.correctors.regressioncorrector import _NormalEquations
+
+
+def dense_fit(X, flux, flux_err, cadence_mask, prior_mu, prior_sigma):
+    """The fit of `RegressionCorrector._fit_coefficients` before the normal
+    equations were reused across iterations."""
+    flux_err = flux_err[cadence_mask]
+    X = X[cadence_mask]
+    if isinstance(X, np.ndarray):
+        sigma_w_inv = X.T.dot(X / flux_err[:, None] ** 2)
+        B = np.dot(X.T, flux[cadence_mask] / flux_err ** 2)
+    elif issparse(X):
+        sigma_w_inv = X.T.dot(X.multiply(csr_matrix(1 / flux_err[:, None] ** 2)))
+        B = X.T.dot(flux[cadence_mask] / flux_err ** 2)
+        sigma_w_inv = sigma_w_inv.toarray()
+    sigma_w_inv = sigma_w_inv + np.diag(1.0 / prior_sigma ** 2)
+    B = B + (prior_mu / prior_sigma ** 2)
+    return np.linalg.solve(sigma_w_inv, B)
+
+
+def masks(n_cadences, n_iterations, rng):
+    """Cadence masks losing a few outliers at each iteration, as sigma clipping does."""
+    mask = np.ones(n_cadences, bool)
+    result = [mask]
+    for _ in range(n_iterations - 1):
+        mask = mask & (rng.random(n_cadences) > 0.01)
+        result.append(mask)
+    return result
+
+
+def run(n_cadences, n_regressors, n_iterations, repeat, seed=42):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_cadences, n_regressors))
+    flux = X.dot(rng.normal(size=n_regressors)) + rng.normal(0, 0.1, n_cadences)
+    flux_err = 0.1 * np.ones(n_cadences)
+    prior_mu, prior_sigma = np.zeros(n_regressors), 1e3 * np.ones(n_regressors)
+    cadence_masks = masks(n_cadences, n_iterations, rng)
+
+    def old():
+        return [
+            dense_fit(X, flux, flux_err, mask, prior_mu, prior_sigma)
+            for mask in cadence_masks
+        ]
+
+    def new(solver):
+        normal_equations = _NormalEquations(X, flux, flux_err)
+        result = []
+        for mask in cadence_masks:
+            normal_equations.update(mask)
+            result.append(normal_equations.solve(prior_mu, prior_sigma, solver=solver)[0])
+        return result
+
+    expected = old()
+    print(
+        "{} cadences x {} regressors, {} iterations (best of {}):".format(
+            n_cadences, n_regressors, n_iterations, repeat
+        )
+    )
+    for name, func in [
+        ("previous dense", old),
+        ("updated, dense", lambda: new("dense")),
+        ("updated, cholesky", lambda: new("cholesky")),
+    ]:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+        np.testing.assert_allclose(result, expected, rtol=1e-6, atol=1e-9)
+        print("  {:<20s} {:8.3f} s".format(name, min(timings)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cadences", type=int, default=20000)
+    parser.add_argument("--regressors", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.cadences, args.regressors, args.iterations, args.repeat)
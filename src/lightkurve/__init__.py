@@ -70,6 +70,19 @@ class Conf(_config.ConfigNamespace):
 
     warn_legacy_cache_dir
         If set to True, issue warning if the legacy default cache directory exists. Default is True.
+
+    search_cache_ttl
+        Number of days for which the results of MAST searches and name resolutions
+        are cached on disk, in the ``search_cache`` subdirectory of ``cache_dir``.
+        Default is 0, i.e., search results are not cached.
+
+    search_cache_max_size
+        Maximum size of the on-disk search cache in megabytes. The least recently used
+        entries are removed when it is exceeded. Default is 100.
+
+    search_offline
+        If set to True, searches are served from the on-disk search cache only,
+        regardless of ``search_cache_ttl``, and MAST is never queried. Default is False.
     """
     # Note: when using list or string_list datatype,
     # the behavior of astropy's parsing of the config file value:
@@ -98,6 +111,27 @@ class Conf(_config.ConfigNamespace):
         module="lightkurve.config"
     )
 
+    search_cache_ttl = _config.ConfigItem(
+        0.0,
+        "Number of days for which MAST search results are cached on disk; 0 disables the cache.",
+        cfgtype="float",
+        module="lightkurve.search"
+    )
+
+    search_cache_max_size = _config.ConfigItem(
+        100.0,
+        "Maximum size of the on-disk search cache in megabytes.",
+        cfgtype="float",
+        module="lightkurve.search"
+    )
+
+    search_offline = _config.ConfigItem(
+        False,
+        "If set to True, searches are served from the on-disk search cache only.",
+        cfgtype="boolean",
+        module="lightkurve.search"
+    )
+
 conf = Conf()
 
 
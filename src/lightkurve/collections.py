@@ -6,15 +6,59 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from astropy.table import vstack
+from astropy.units import Quantity
 from astropy.utils.decorators import deprecated
 
 from . import MPLSTYLE
+from .lightcurve import flatten_many
 from .utils import LightkurveWarning, LightkurveDeprecationWarning
 
 
 __all__ = ["LightCurveCollection", "TargetPixelFileCollection"]
 
 
+def _filled_with_nan(values):
+    """Returns ``values`` as a plain array, with masked values replaced by nan."""
+    if hasattr(values, "mask"):
+        values = values.astype(float).filled(np.nan)
+    return np.asarray(values, dtype=float)
+
+
+def _stitch_lightcurves(lcs):
+    """Concatenates a list of light curves into a single `LightCurve`."""
+    # Address issue #954: ignore incompatible columns with the same name
+    columns_to_remove = set()
+    for col in lcs[0].columns:
+        for lc in lcs[1:]:
+            if col in lc.columns:
+                if (
+                    not (
+                     (issubclass(lcs[0][col].__class__, lc[col].__class__)
+                      or issubclass(lc[col].__class__, lcs[0][col].__class__)
+                      or (lcs[0][col].__class__.info is lc[col].__class__.info))
+                     )
+                    or not (
+                     np.can_cast(lcs[0][col].value.dtype, lc[col].value.dtype, "same_kind")
+                     and np.can_cast(lc[col].value.dtype, lcs[0][col].value.dtype, "same_kind"))
+                    ):
+                    columns_to_remove.add(col)
+                    continue
+
+    if len(columns_to_remove) > 0:
+        warnings.warn(
+            f"The following columns will be excluded from stitching because the column types are incompatible: {columns_to_remove}",
+            LightkurveWarning,
+        )
+        lcs = [lc.copy() for lc in lcs]
+        [
+            lc.remove_columns(columns_to_remove.intersection(lc.columns))
+            for lc in lcs
+        ]
+
+    # Need `join_type='inner'` until AstroPy supports masked Quantities
+    return vstack(lcs, join_type="inner", metadata_conflicts="silent")
+
+
 class Collection(object):
     """Base class for `LightCurveCollection` and `TargetPixelFileCollection`.
 
@@ -194,38 +238,99 @@ class LightCurveCollection(Collection):
         with warnings.catch_warnings():  # ignore "already normalized" message
             warnings.filterwarnings("ignore", message=".*already.*")
             lcs = [corrector_func(lc) for lc in self]
+        return _stitch_lightcurves(lcs)
+
+    def flatten(
+        self,
+        window_length=101,
+        polyorder=2,
+        return_trend=False,
+        break_tolerance=5,
+        niters=3,
+        sigma=3,
+        mask=None,
+        **kwargs,
+    ):
+        """Removes the low frequency trend of all the light curves in the collection.
+
+        If all the light curves share the same time stamps, the trends are computed
+        for all of them at once using `~lightkurve.lightcurve.flatten_many`,
+        which is much faster than flattening them one by one. Otherwise,
+        `LightCurve.flatten` is called on each light curve.
 
-        # Address issue #954: ignore incompatible columns with the same name
-        columns_to_remove = set()
-        for col in lcs[0].columns:
-            for lc in lcs[1:]:
-                if col in lc.columns:
-                    if (
-                        not (
-                         (issubclass(lcs[0][col].__class__, lc[col].__class__)
-                          or issubclass(lc[col].__class__, lcs[0][col].__class__)
-                          or (lcs[0][col].__class__.info is lc[col].__class__.info))
-                         )
-                        or not (
-                         np.can_cast(lcs[0][col].value.dtype, lc[col].value.dtype, "same_kind")
-                         and np.can_cast(lc[col].value.dtype, lcs[0][col].value.dtype, "same_kind"))
-                        ):
-                        columns_to_remove.add(col)
-                        continue
-
-        if len(columns_to_remove) > 0:
-            warnings.warn(
-                f"The following columns will be excluded from stitching because the column types are incompatible: {columns_to_remove}",
-                LightkurveWarning,
-            )
-            lcs = [lc.copy() for lc in lcs]
-            [
-                lc.remove_columns(columns_to_remove.intersection(lc.columns))
-                for lc in lcs
-            ]
+        Parameters
+        ----------
+        window_length, polyorder, break_tolerance, niters, sigma
+            See `LightCurve.flatten`.
+        return_trend : bool
+            If `True`, the method will return a tuple of two elements
+            (flattened_lcc, trend_lcc) where trend_lcc is the collection of
+            the removed trends.
+        mask : boolean array with length of the light curves
+            Boolean array to mask data with before flattening, e.g., transits.
+            See `LightCurve.flatten`.
+        **kwargs : dict
+            Dictionary of arguments to be passed to `scipy.signal.savgol_filter`.
+            If specified, each light curve is flattened individually.
 
-        # Need `join_type='inner'` until AstroPy supports masked Quantities
-        return vstack(lcs, join_type="inner", metadata_conflicts="silent")
+        Returns
+        -------
+        flattened_lcc : `LightCurveCollection`
+            Collection of the light curves with long-term trends removed.
+        If ``return_trend`` is set to ``True``, this method will also return:
+        trend_lcc : `LightCurveCollection`
+            Collection of the trends that were removed.
+        """
+        flatten_kwargs = dict(
+            window_length=window_length,
+            polyorder=polyorder,
+            break_tolerance=break_tolerance,
+            niters=niters,
+            sigma=sigma,
+            mask=mask,
+        )
+        if len(kwargs) > 0 or not self._has_shared_time():
+            results = [
+                lc.flatten(return_trend=True, **flatten_kwargs, **kwargs) for lc in self
+            ]
+            flattened_lcs = [flat for flat, _ in results]
+            trend_lcs = [trend for _, trend in results]
+        else:
+            flux = np.array([_filled_with_nan(lc.flux.value) for lc in self])
+            _, trends = flatten_many(
+                self.data[0].time.value, flux, return_trend=True, **flatten_kwargs
+            )
+            flattened_lcs, trend_lcs = [], []
+            for lc, trend in zip(self, trends):
+                trend_signal = Quantity(trend, lc.flux.unit)
+                flatten_lc = lc.copy()
+                with warnings.catch_warnings():
+                    # ignore invalid division warnings
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    flatten_lc.flux = flatten_lc.flux / trend_signal
+                    flatten_lc.flux_err = flatten_lc.flux_err / trend_signal
+                flatten_lc.meta["NORMALIZED"] = True
+                flattened_lcs.append(flatten_lc)
+                if return_trend:
+                    trend_lc = lc.copy()
+                    trend_lc.flux = trend_signal
+                    trend_lcs.append(trend_lc)
+
+        if return_trend:
+            return LightCurveCollection(flattened_lcs), LightCurveCollection(trend_lcs)
+        return LightCurveCollection(flattened_lcs)
+
+    def _has_shared_time(self):
+        """Returns `True` if all the light curves have identical time stamps."""
+        if len(self) == 0:
+            return False
+        time = self.data[0].time
+        return all(
+            len(lc.time) == len(time)
+            and lc.time.format == time.format
+            and np.array_equal(lc.time.value, time.value)
+            for lc in self.data[1:]
+        )
 
     def plot(self, ax=None, offset=0.0, **kwargs) -> matplotlib.axes.Axes:
         """Plots all light curves in the collection on a single plot.
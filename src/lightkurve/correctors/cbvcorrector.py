@@ -2,6 +2,7 @@
 """
 import logging
 import copy
+from functools import lru_cache
 import requests
 import urllib.request
 import glob
@@ -24,13 +25,18 @@ from sklearn import linear_model
 from scipy.optimize import minimize_scalar
 
 from .designmatrix import DesignMatrix, DesignMatrixCollection
-from .. import MPLSTYLE
+from .. import MPLSTYLE, config
 from ..lightcurve import LightCurve
 from ..utils import channel_to_module_output, validate_method, LightkurveDeprecationWarning
-from ..search import search_lightcurve
-from .regressioncorrector import RegressionCorrector
+from ..search import search_lightcurve, _read_manifest, _write_manifest
+from .regressioncorrector import RegressionCorrector, _NormalEquations
 from ..collections import LightCurveCollection
-from .metrics import overfit_metric_lombscargle, underfit_metric_neighbors, MinTargetsError
+from .metrics import (
+    OverfitMetricCache,
+    overfit_metric_lombscargle,
+    underfit_metric_neighbors,
+    MinTargetsError,
+)
 
 
 log = logging.getLogger(__name__)
@@ -217,6 +223,12 @@ class CBVCorrector(RegressionCorrector):
         self.over_fitting_score = None
         self.under_fitting_score = None
         self.alpha = None
+        # Cadence mask and OverfitMetricCache used by over_fitting_metric
+        self._over_fitting_cache = (None, None)
+        # Normal equations and goodness metric penalties shared by all the
+        # alpha values tried by correct
+        self._alpha_normal_equations = None
+        self._goodness_metric_cache = {}
 
     def correct_gaussian_prior(self, cbv_type=['SingleScale'],
             cbv_indices=[np.arange(1,9)], 
@@ -469,16 +481,26 @@ class CBVCorrector(RegressionCorrector):
                                     'cadence_mask': cadence_mask,
                                     'over_metric_nSamples': 1}
 
-        #***
-        # Use scipy.optimize.minimize_scalar
-        # Minimize the introduced metric
-        minimize_result = minimize_scalar(self._goodness_metric_obj_fun, method='Bounded',
-                bounds=alpha_bounds,
-                options={'maxiter':max_iter, 'disp': False})
-
-        # Re-fit with final alpha value
-        # (scipy.optimize.minimize_scalar does not exit with the final fit!)
-        self._goodness_metric_obj_fun(minimize_result.x)
+        # Only the prior width changes with alpha, so the normal equations and
+        # their eigendecomposition are computed once for all alpha values
+        self._alpha_normal_equations = _NormalEquations(
+            self.design_matrix_collection.X, self.lc.flux.value,
+            self.lc.flux_err.value, cache_size=16)
+        self._goodness_metric_cache = {}
+        try:
+            #***
+            # Use scipy.optimize.minimize_scalar
+            # Minimize the introduced metric
+            minimize_result = minimize_scalar(self._goodness_metric_obj_fun, method='Bounded',
+                    bounds=alpha_bounds,
+                    options={'maxiter':max_iter, 'disp': False})
+
+            # Re-fit with final alpha value
+            # (scipy.optimize.minimize_scalar does not exit with the final fit!)
+            # The goodness metrics are computed below, so only fit here
+            self._fit_alpha(minimize_result.x)
+        finally:
+            self._alpha_normal_equations = None
 
         # Only display over- or under-fitting scores if requested to optimize
         # for each
@@ -500,6 +522,13 @@ class CBVCorrector(RegressionCorrector):
 
         return self.corrected_lc
 
+    def _normal_equations(self, X):
+        """Returns the normal equations shared by all alpha values while
+        `correct` optimizes alpha, or new ones otherwise."""
+        if self._alpha_normal_equations is not None:
+            return self._alpha_normal_equations
+        return super(CBVCorrector, self)._normal_equations(X)
+
     def correct_regressioncorrector(self, design_matrix_collection, **kwargs):
         """ Pass-through method to gain access to the superclass 
         RegressionCorrector.correct() method.
@@ -535,17 +564,26 @@ class CBVCorrector(RegressionCorrector):
             return None
 
         # Ignore masked cadences
-        orig_lc         = self.lc.copy()
-        orig_lc         = orig_lc[self.cadence_mask]
         corrected_lc    = self.corrected_lc.copy()
         corrected_lc    = corrected_lc[self.cadence_mask]
 
-        return overfit_metric_lombscargle (orig_lc, corrected_lc, n_samples=n_samples)
+        # The periodograms of the original light curve and of the noise only
+        # depend on the cadence mask, reuse them across calls (e.g. alpha values)
+        cadence_mask, cache = self._over_fitting_cache
+        if cache is None or not np.array_equal(cadence_mask, self.cadence_mask):
+            orig_lc = self.lc.copy()
+            orig_lc = orig_lc[self.cadence_mask]
+            cache = OverfitMetricCache(orig_lc)
+            self._over_fitting_cache = (self.cadence_mask.copy(), cache)
+
+        return overfit_metric_lombscargle (None, corrected_lc,
+                n_samples=n_samples, cache=cache)
 
     def under_fitting_metric(self, 
             radius: float = None, 
             min_targets: int = 30,
-            max_targets: int = 50):
+            max_targets: int = 50,
+            n_workers: int = 4):
         """  Computes the under-fitting metric using 
         metrics.underfit_metric_neighbors
 
@@ -575,6 +613,10 @@ class CBVCorrector(RegressionCorrector):
             Maximum number of targets to use in correlation metric
             Using too many can slow down the metric due to large data
             download. Default = 50
+        n_workers : int
+            Number of neighboring targets to download concurrently. The
+            neighboring targets are kept in the lightkurve cache directory,
+            so they are only downloaded once. Default = 4
 
         Returns
         -------
@@ -622,7 +664,7 @@ class CBVCorrector(RegressionCorrector):
             try:
                 metric = underfit_metric_neighbors (corrected_lc, 
                             dynamic_search_radius, min_targets, max_targets, 
-                            interpolate, extrapolate)
+                            interpolate, extrapolate, n_workers=n_workers)
             except MinTargetsError:
                 # Too few targets found, try increasing search radius
                 if (dynamic_search_radius > max_search_radius):
@@ -785,7 +827,7 @@ class CBVCorrector(RegressionCorrector):
         First sets the alpha regularization penalty then runs
         RegressionCorrector.correct and then computes the over- and
         under-fitting goodness metrics to return a scalar penalty term to
-        minimize.
+        minimize. The penalty of each alpha is memoized.
 
         Uses the parameters in self.optimization_params.
 
@@ -808,13 +850,11 @@ class CBVCorrector(RegressionCorrector):
             Penalty term for minimizer, based on goodness metrics
         """
 
-        # Add in a width to the Gaussian priors
-        # alpha = flux_sigma^2 / sigma^2
-        sigma = np.median(self.lc.flux_err.value) / np.sqrt(np.abs(alpha))
-        self._set_prior_width(sigma)                
-        # Use RegressionCorrector.correct for the actual fitting
-        self.correct_regressioncorrector(self.design_matrix_collection, 
-            cadence_mask=self.optimization_params['cadence_mask'])
+        # The optimizer may try the same alpha twice
+        if alpha in self._goodness_metric_cache:
+            return self._goodness_metric_cache[alpha]
+
+        self._fit_alpha(alpha)
 
         # Do not compute and ignore if target score < 0
         if (self.optimization_params['target_over_score'] > 0):
@@ -850,9 +890,25 @@ class CBVCorrector(RegressionCorrector):
                         self.optimization_params['target_under_score']))
 
         penalty = -(overMetric + underMetric)
+        self._goodness_metric_cache[alpha] = penalty
 
         return penalty
 
+    def _fit_alpha(self, alpha):
+        """ Fits the light curve with the regularization penalty term alpha.
+
+        Every prior is given the same width, so the 'eigh' solver only needs
+        to shift the eigenvalues of the normal matrix for each new alpha.
+        """
+        # Add in a width to the Gaussian priors
+        # alpha = flux_sigma^2 / sigma^2
+        sigma = np.median(self.lc.flux_err.value) / np.sqrt(np.abs(alpha))
+        self._set_prior_width(sigma)
+        # Use RegressionCorrector.correct for the actual fitting
+        self.correct_regressioncorrector(self.design_matrix_collection,
+            cadence_mask=self.optimization_params['cadence_mask'],
+            solver='eigh')
+
     def diagnose(self):
         """ Returns diagnostic plots to assess the most recent correction.
 
@@ -1079,6 +1135,12 @@ class CotrendingBasisVectors(TimeSeries):
     def cadenceno(self, cadenceno):
         self['CADENCENO'] = cadenceno
 
+    def _vectors(self, cbv_indices):
+        """Returns the CBVs in ``cbv_indices`` as a (cadences x CBVs) array."""
+        return np.column_stack([np.asarray(self['VECTOR_{}'.format(idx)], dtype=float)
+                for idx in cbv_indices]) if len(cbv_indices) > 0 \
+                else np.zeros((len(self), 0))
+
     def to_designmatrix(self, cbv_indices='all', name='CBVs'):
         """Returns a `DesignMatrix` where the columns are the
         requested CBVs.
@@ -1221,6 +1283,10 @@ class CotrendingBasisVectors(TimeSeries):
 
         The returned cbvs object is sorted by cadenceno.
 
+        The alignment indices are cached, so that aligning several CBV sets,
+        or the light curves of several targets, with the same cadences only
+        computes them once.
+
         If you wish to interpolate the CBVs to arbitrary light curve cadence
         times then use the interpolate method.
 
@@ -1245,55 +1311,34 @@ class CotrendingBasisVectors(TimeSeries):
 
         if hasattr(lc, 'cadenceno'):
 
-            # Make a deepcopy so we do not just return a modified original
-            cbvs = copy.deepcopy(self)
+            # Keep the CBV cadences that are in the light curve, and add NaN
+            # CBV cadences for the light curve cadences that are not in the
+            # CBVs, sorted by cadenceno
+            keep_indices, nan_indices, order = _align_indices(
+                np.asarray(self.cadenceno, dtype=np.int64).tobytes(),
+                np.asarray(lc.cadenceno, dtype=np.int64).tobytes())
 
-            # NaN any CBV cadences that are in the light curve and not in CBVs
-            # This requires us to add rows to the CBV table
-            lc_nan_mask = np.logical_not(np.isin(lc.cadenceno, cbvs.cadenceno))
             # Determine if the CBVs are poorly aligned to the light curve
-            if ((np.count_nonzero(lc_nan_mask) / len(lc_nan_mask)) >
-                            poorly_aligned_threshold):
+            if ((len(nan_indices) / len(lc.cadenceno)) > poorly_aligned_threshold or
+                    (len(keep_indices) / len(self)) < poorly_aligned_threshold):
                 poorly_aligned_flag = True
 
-            lc_nan_indices = np.nonzero(lc_nan_mask)[0]
-            # Sadly, there is no TimesSeries.add_rows (plural), so we have to
-            # add each row in a for-loop
-            if len(lc_nan_indices) > 0:
-                for idx in lc_nan_indices:
-                    dict_to_add = {}
-                    dict_to_add['time'] = lc.time[idx]
-                    dict_to_add['CADENCENO'] = lc.cadenceno[idx]
-                    dict_to_add['GAP'] = True
-                    for cbvIdx in cbvs.cbv_indices:
-                        dict_to_add['VECTOR_{}'.format(cbvIdx)] = np.nan
-
-                    cbvs.add_row(dict_to_add)
-
-            # There appears to be a bug in astropy.timeseries when using ts[x:y]
-            # in combination with ts.remove_row() or ts.remove_rows.
-            # See LightKurve Issue #836.
-            # To get around the error for now, we will attempt to use
-            # ts[x:y]. If it errors out then revert to remove_rows, which is
-            # REALLY slow.
-            try:
-                # This method is fast but might cause errors
-                keep_indices = np.nonzero(np.isin(cbvs.cadenceno, lc.cadenceno))[0]
-                # Determine if the CBVs are poorly aligned to the light curve
-                if (len(keep_indices) / len(cbvs)) < poorly_aligned_threshold:
-                    poorly_aligned_flag = True
-                cbvs = cbvs[keep_indices]
-            except:
-                # This method is slow but appears to be more robust
-                trim_indices = np.nonzero(np.logical_not(
-                    np.isin(cbvs.cadenceno, lc.cadenceno)))[0]
-                # Determine if the CBVs are poorly aligned to the light curve
-                if (len(trim_indices) / len(cbvs)) > poorly_aligned_threshold:
-                    poorly_aligned_flag = True
-                cbvs.remove_rows(trim_indices)
-
-            # Now sort the CBVs by cadenceno
-            cbvs.sort('CADENCENO')
+            cbv_indices = self.cbv_indices
+            vectors = np.full((len(order), len(cbv_indices)), np.nan)
+            vectors[:len(keep_indices)] = self._vectors(cbv_indices)[keep_indices]
+            dataTbl = Table(
+                [np.concatenate([np.asarray(self.cadenceno)[keep_indices],
+                                 np.asarray(lc.cadenceno)[nan_indices]]
+                               ).astype(self.cadenceno.dtype)[order],
+                 np.concatenate([np.asarray(self.gap_indicators)[keep_indices],
+                                 np.full(len(nan_indices), True)])[order]],
+                names=('CADENCENO', 'GAP'))
+            for col, idx in enumerate(cbv_indices):
+                dataTbl['VECTOR_{}'.format(idx)] = vectors[order, col]
+            dataTbl.meta = copy.deepcopy(self.meta)
+            cbvTime = np.concatenate([self.time[keep_indices],
+                                      lc.time[nan_indices]])[order]
+            cbvs = self.__class__(data=dataTbl, time=cbvTime)
 
         else:
             raise Exception('align requires cadence numbers for the ' + \
@@ -1348,23 +1393,22 @@ class CotrendingBasisVectors(TimeSeries):
         gaps = np.full(len(lc.time), False)
         dataTbl = Table([lc.cadenceno, gaps], names=('CADENCENO', 'GAP'))
 
-        # We are PCHIP interpolating each CBV independently.
+        # We are PCHIP interpolating each CBV independently, all in one pass
+        # over the (cadences x CBVs) array.
         # Do not include gaps when interpolating
-        warning_posted = False
-        for idx in self.cbv_indices:
-            fInterp = PchipInterpolator(
-                    self.time.value[np.logical_not(self.gap_indicators.value)],
-                    self['VECTOR_{}'.format(idx)][np.logical_not(self.gap_indicators.value)], 
-                    extrapolate=extrapolate)
-            dataTbl['VECTOR_{}'.format(idx)] = fInterp(lc.time.value)
-            # Replace NaNs with 0.0
-            if (np.any(np.isnan(dataTbl['VECTOR_{}'.format(idx)]))):
-                dataTbl['VECTOR_{}'.format(idx)][np.isnan(dataTbl['VECTOR_{}'.format(idx)])] = \
-                    np.full(np.count_nonzero(np.isnan(dataTbl['VECTOR_{}'.format(idx)])), 0.0)
-                # Only post this warning once
-                if (not warning_posted):
-                    log.warning('Some interpolated (or extrapolated) CBV values have been set to zero')
-                    warning_posted = True
+        cbv_indices = self.cbv_indices
+        not_gapped = np.logical_not(self.gap_indicators.value)
+        fInterp = PchipInterpolator(self.time.value[not_gapped],
+                self._vectors(cbv_indices)[not_gapped], axis=0,
+                extrapolate=extrapolate)
+        vectors = fInterp(lc.time.value)
+        # Replace NaNs with 0.0
+        nan_mask = np.isnan(vectors)
+        if np.any(nan_mask):
+            vectors[nan_mask] = 0.0
+            log.warning('Some interpolated (or extrapolated) CBV values have been set to zero')
+        for col, idx in enumerate(cbv_indices):
+            dataTbl['VECTOR_{}'.format(idx)] = vectors[:, col]
 
         dataTbl.meta = self.meta.copy()
 
@@ -1735,6 +1779,99 @@ class TessCotrendingBasisVectors(CotrendingBasisVectors):
 
 
 
+@lru_cache(maxsize=32)
+def _align_indices(cbv_cadenceno, lc_cadenceno):
+    """Returns the indices used by `CotrendingBasisVectors.align`.
+
+    The cadence numbers are passed as bytes, so that the indices are cached
+    and reused for all the CBV sets, and all the targets, sharing the same
+    CBV and light curve cadences.
+
+    Returns
+    -------
+    keep_indices : np.ndarray
+        Indices of the CBV cadences which are in the light curve.
+    nan_indices : np.ndarray
+        Indices of the light curve cadences which are not in the CBVs.
+    order : np.ndarray
+        Order of the concatenated kept and NaN cadences, by cadence number.
+    """
+    cbv_cadenceno = np.frombuffer(cbv_cadenceno, dtype=np.int64)
+    lc_cadenceno = np.frombuffer(lc_cadenceno, dtype=np.int64)
+    keep_indices = np.nonzero(np.isin(cbv_cadenceno, lc_cadenceno))[0]
+    nan_indices = np.nonzero(np.logical_not(np.isin(lc_cadenceno, cbv_cadenceno)))[0]
+    order = np.argsort(np.concatenate([cbv_cadenceno[keep_indices],
+            lc_cadenceno[nan_indices]]), kind='stable')
+    for indices in (keep_indices, nan_indices, order):
+        indices.flags.writeable = False
+    return keep_indices, nan_indices, order
+
+
+def _cbv_store_dir():
+    """Returns the directory of the local store of CBV files."""
+    return os.path.join(config.get_cache_dir(), "cbvs")
+
+
+def _cbv_store_path(key, resolve_url):
+    """Returns the local path of the CBV file identified by ``key``.
+
+    The local CBV store holds the CBV files downloaded from MAST, along with
+    an index which maps each key, e.g. 'TESS-s0010-2-4', to a file name.  A
+    file is only downloaded, from the url returned by ``resolve_url()``, if
+    the key is not in the index yet, so that CBVs already in the store are
+    available offline.
+    """
+    store_dir = _cbv_store_dir()
+    index_path = os.path.join(store_dir, "index.json")
+    fname = _read_manifest(index_path).get(key)
+    if fname is not None and os.path.exists(os.path.join(store_dir, fname)):
+        return os.path.join(store_dir, fname)
+
+    url = resolve_url()
+    os.makedirs(store_dir, exist_ok=True)
+    fname = url.split("/")[-1]
+    path = os.path.join(store_dir, fname)
+    if not os.path.exists(path):
+        log.debug("Downloading {} to the CBV store".format(url))
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            with open(tmp_path, "wb") as fp:
+                for chunk in response.iter_content(chunk_size=2**20):
+                    fp.write(chunk)
+        os.replace(tmp_path, path)
+    # Re-read the index, in case it was updated by another process
+    index = _read_manifest(index_path)
+    index[key] = fname
+    _write_manifest(index_path, index)
+    return path
+
+
+@lru_cache(maxsize=64)
+def _read_kepler_cbvs(path, mtime, module, output):
+    """Returns the parsed Kepler/K2 CBVs of module.output in the file ``path``.
+
+    The most recently parsed CBVs are cached in memory, keyed on the path and
+    modification time of the file.  Callers must return a copy.
+    """
+    with pyfits.open(path) as hdu:
+        return KeplerCotrendingBasisVectors.from_hdu(hdu=hdu, module=module, output=output)
+
+
+@lru_cache(maxsize=64)
+def _read_tess_cbvs(path, mtime, cbv_type, band):
+    """Returns the parsed TESS CBVs of ``cbv_type`` and ``band`` in the file ``path``.
+
+    The most recently parsed CBVs are cached in memory, keyed on the path and
+    modification time of the file.  Callers must return a copy.
+    """
+    with pyfits.open(path) as hdu:
+        # Check that this is a TESS CBV FITS file
+        mission = hdu['Primary'].header['TELESCOP']
+        validate_method(mission, ['tess'])
+        return TessCotrendingBasisVectors.from_hdu(hdu=hdu, cbv_type=cbv_type, band=band)
+
+
 @deprecated("2.1", alternative="load_kepler_cbvs", warning_type=LightkurveDeprecationWarning)
 def download_kepler_cbvs(*args, **kwargs):
     return load_kepler_cbvs(*args, **kwargs)
@@ -1804,35 +1941,31 @@ def load_kepler_cbvs(cbv_dir=None,mission=None, quarter=None, campaign=None,
         assert  module is not None, 'module must be passed'
         assert  output is not None, 'output must be passed'
 
-    if cbv_dir:
-        cbvBaseUrl = ""
-    elif (mission == 'Kepler'):
+    if (mission == 'Kepler'):
         cbvBaseUrl = "http://archive.stsci.edu/missions/kepler/cbv/"
+        # For Kepler this extracts the DR25 CBVs
+        searchString = 'q{:02}-d25'.format(quarter)
+        key = 'Kepler-q{:02}'.format(quarter)
     elif (mission == 'K2'):
         cbvBaseUrl = "http://archive.stsci.edu/missions/k2/cbv/"
+        searchString = 'c{:02}'.format(campaign)
+        key = 'K2-c{:02}'.format(campaign)
 
     try:
-        kepler_cbv_fname = None
         if cbv_dir:
             cbv_files = glob.glob(os.path.join(cbv_dir,'*.fits'))
+            path = [cbv_file for cbv_file in cbv_files if searchString in cbv_file][0]
         else:
-            soup = BeautifulSoup(requests.get(cbvBaseUrl).text, 'html.parser')
-            cbv_files = [fn['href'] for fn in soup.find_all('a') if fn['href'].endswith('fits')]
+            def resolve_url():
+                soup = BeautifulSoup(requests.get(cbvBaseUrl).text, 'html.parser')
+                cbv_files = [fn['href'] for fn in soup.find_all('a') if fn['href'].endswith('fits')]
+                return cbvBaseUrl + [cbv_file for cbv_file in cbv_files
+                        if searchString in cbv_file][0]
 
-        if mission == 'Kepler':
-            quarter = 'q{:02}'.format(quarter)
-            for cbv_file in cbv_files:
-                if quarter + '-d25' in cbv_file:
-                    break
-        elif mission == 'K2':
-            campaign = 'c{:02}'.format(campaign)
-            for cbv_file in cbv_files:
-                if campaign in cbv_file:
-                    break
+            path = _cbv_store_path(key, resolve_url)
 
-        kepler_cbv_fname = cbvBaseUrl + cbv_file
-        hdu = pyfits.open(kepler_cbv_fname)
-        return KeplerCotrendingBasisVectors.from_hdu(hdu=hdu, module=module, output=output)
+        cbvs = _read_kepler_cbvs(path, os.path.getmtime(path), module, output)
+        return cbvs.copy()
 
     except Exception as e:
         raise Exception('CBVS were not found') from e
@@ -1925,8 +2058,7 @@ def load_tess_cbvs(cbv_dir=None,sector=None, camera=None,
 
     try:
         if cbv_dir is not None:
-            # Read in the relevant curl script file and find the line for the CBV
-            # data we are looking for
+            # Find the CBV file we are looking for in the directory
             data = glob.glob(os.path.join(cbv_dir,'*.fits'))
             fname = None
             for line in data:
@@ -1937,45 +2069,40 @@ def load_tess_cbvs(cbv_dir=None,sector=None, camera=None,
             if (fname is None):
                 raise Exception('CBV FITS file not found')
 
-            # Extract url from strLine
-
-            hdu = pyfits.open(fname)
-
         else:
-            curlBaseUrl = 'https://archive.stsci.edu/missions/tess/download_scripts/sector/tesscurl_sector_'
+            def resolve_url():
+                curlBaseUrl = 'https://archive.stsci.edu/missions/tess/download_scripts/sector/tesscurl_sector_'
+                if fast_cadence:
+                    curlEndUrl = '_fast-cbv.sh'
+                else:
+                    curlEndUrl = '_cbv.sh'
+                curlUrl = curlBaseUrl + str(sector) + curlEndUrl
+
+                # Read in the relevant curl script file and find the line for the CBV
+                # data we are looking for
+                data = urllib.request.urlopen(curlUrl)
+                foundIndex = None
+                for line in data:
+                    strLine = str(line)
+                    if SearchString in strLine:
+                        foundIndex = strLine.index(SearchString)
+                        break
+                if (foundIndex is None):
+                    raise Exception('CBV FITS file not found')
+
+                # Extract url from strLine
+                htmlStartIndex = strLine.find('https:')
+                htmlEndIndex = strLine.rfind('fits')
+                # Add 4 for length of 'fits' string
+                return strLine[htmlStartIndex:htmlEndIndex+4]
+
+            key = 'TESS-' + SearchString.rstrip('-')
             if fast_cadence:
-                curlEndUrl = '_fast-cbv.sh'
-            else:
-                curlEndUrl = '_cbv.sh'
-            curlUrl = curlBaseUrl + str(sector) + curlEndUrl
+                key += '-fast'
+            fname = _cbv_store_path(key, resolve_url)
 
-            # This is the string to search for in the curl script file
+        cbvs = _read_tess_cbvs(fname, os.path.getmtime(fname), cbv_type, band)
+        return cbvs.copy()
 
-            # Read in the relevant curl script file and find the line for the CBV
-            # data we are looking for
-            data = urllib.request.urlopen(curlUrl)
-            foundIndex = None
-            for line in data:
-                strLine = str(line)
-                if SearchString in strLine:
-                    foundIndex = strLine.index(SearchString)
-                    break
-            if (foundIndex is None):
-                raise Exception('CBV FITS file not found')
-
-            # Extract url from strLine
-            htmlStartIndex = strLine.find('https:')
-            htmlEndIndex = strLine.rfind('fits')
-            # Add 4 for length of 'fits' string
-            tess_cbv_url  = strLine[htmlStartIndex:htmlEndIndex+4]
-
-            hdu = pyfits.open(tess_cbv_url)
-
-        # Check that this is a TESS CBV FITS file
-        mission = hdu['Primary'].header['TELESCOP']
-        validate_method(mission, ['tess'])
-
-        return TessCotrendingBasisVectors.from_hdu(hdu=hdu, cbv_type=cbv_type, band=band)
-
-    except:
-        raise Exception('CBVS were not found')
+    except Exception as e:
+        raise Exception('CBVS were not found') from e
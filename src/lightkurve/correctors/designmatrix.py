@@ -5,12 +5,14 @@ Specifically, this module adds the `DesignMatrix`, `DesignMatrixCollection`,
 are design to work with the `RegressionCorrector` class.
 """
 from copy import deepcopy
+from functools import lru_cache
 import warnings
 
 from astropy import units as u
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from scipy.interpolate import BSpline
 from scipy.sparse import lil_matrix, csr_matrix, hstack, vstack, issparse, find
 
 from .. import MPLSTYLE
@@ -341,7 +343,7 @@ class DesignMatrix:
 
         For `SparseDesignMatrix`, rank checks will be turned off by default.
         """
-        self._validate()
+        self._validate(rank=rank)
 
     @property
     def rank(self):
@@ -532,8 +534,16 @@ class DesignMatrixCollection:
             arg = np.argwhere([m.name == key for m in self.matrices])
             return self.matrices[arg[0][0]]
 
-    def validate(self):
-        [d.validate() for d in self]
+    def validate(self, rank=None):
+        """Validates all the matrices, see `DesignMatrix.validate`.
+
+        If ``rank`` is None, the rank of each matrix is checked or not
+        according to its own default.
+        """
+        if rank is None:
+            [d.validate() for d in self]
+        else:
+            [d.validate(rank=rank) for d in self]
 
     def __repr__(self):
         return "DesignMatrixCollection:\n" + "".join(
@@ -850,47 +860,27 @@ class SparseDesignMatrixCollection(DesignMatrixCollection):
 # Functions to create commonly-used design matrices.
 ####################################################
 
-def _spline_basis_vector(x, degree, i, knots):
-    """Recursive function to create a single spline basis vector for an input x,
-    for the ith knot.
-
-    See https://en.wikipedia.org/wiki/B-spline for a definition of B-spline
-    basis vectors
+@lru_cache(maxsize=32)
+def _spline_basis(x_bytes, knots, degree):
+    """Returns the B-spline basis vectors of ``degree`` over ``knots``, evaluated at x.
 
-    Parameters
-    ----------
-    x : np.ndarray
-        Input x
-    degree : int
-        Degree of spline to calculate basis for
-    i : int
-        The index of the knot to calculate the basis for
-    knots : np.ndarray
-        Array of all knots
+    The basis is evaluated with `scipy.interpolate.BSpline.design_matrix`,
+    with the end knots repeated ``degree`` times, and the vectors which are
+    zero everywhere are dropped.  ``x`` is passed as the bytes of a float64
+    array and ``knots`` as a tuple so that the result can be cached, e.g.
+    for repeated corrections of light curves sharing the same time stamps.
 
     Returns
     -------
-    B : np.ndarray
-        A vector of same length as x containing the spline basis for the ith knot
+    basis : `scipy.sparse.csr_matrix`
+        Matrix of shape (len(x), number of basis vectors).
     """
-    if degree == 0:
-        B = np.zeros(len(x))
-        B[(x >= knots[i]) & (x <= knots[i + 1])] = 1
-    else:
-        da = knots[degree + i] - knots[i]
-        db = knots[i + degree + 1] - knots[i + 1]
-        if (knots[degree + i] - knots[i]) != 0:
-            alpha1 = (x - knots[i]) / da
-        else:
-            alpha1 = np.zeros(len(x))
-        if (knots[i + degree + 1] - knots[i + 1]) != 0:
-            alpha2 = (knots[i + degree + 1] - x) / db
-        else:
-            alpha2 = np.zeros(len(x))
-        B = (_spline_basis_vector(x, (degree - 1), i, knots)) * (alpha1) + (
-            _spline_basis_vector(x, (degree - 1), (i + 1), knots)
-        ) * (alpha2)
-    return B
+    x = np.frombuffer(x_bytes, dtype=np.float64)
+    knots = np.asarray(knots)
+    t = np.concatenate([[knots[0]] * degree, knots, [knots[-1]] * degree])
+    basis = csr_matrix(BSpline.design_matrix(x, t, degree))
+    basis.eliminate_zeros()
+    return basis[:, np.asarray(basis.sum(axis=0)).ravel() != 0]
 
 
 def create_sparse_spline_matrix(x, n_knots=20, knots=None, degree=3, name="spline"):
@@ -898,8 +888,10 @@ def create_sparse_spline_matrix(x, n_knots=20, knots=None, degree=3, name="splin
 
     See https://en.wikipedia.org/wiki/B-spline for the definitions of Basis Splines
 
-    B-spline vectors of degree higher than 0 are created using recursion, using the
-    `_spline_basis_vector` function to evaluate the basis vectors for x, for each knot.
+    The B-spline basis vectors are evaluated at once with De Boor's algorithm,
+    as implemented by `scipy.interpolate.BSpline.design_matrix`.  The most
+    recently created bases are cached, keyed on the values of x, the knots
+    and the degree.
 
     Parameters
     ----------
@@ -921,8 +913,7 @@ def create_sparse_spline_matrix(x, n_knots=20, knots=None, degree=3, name="splin
     dm: `.SparseDesignMatrix`
         Design matrix object with shape (len(x), n_knots*degree).
     """
-    # To use jit we have to use float64
-    x = np.asarray(x, np.float64)
+    x = np.ascontiguousarray(x, np.float64)
 
     if not isinstance(n_knots, int):
         raise ValueError("`n_knots` must be an integer.")
@@ -937,16 +928,9 @@ def create_sparse_spline_matrix(x, n_knots=20, knots=None, degree=3, name="splin
         raise ValueError("Pass either `n_knots` or `knots`.")
     knots = np.append(np.append(x.min(), knots), x.max())
     knots = np.unique(knots)
-    knots_wbounds = np.append(
-        np.append([x.min()] * (degree - 1), knots), [x.max()] * (degree)
-    )
-
-    matrices = [
-        csr_matrix(_spline_basis_vector(x, degree, idx, knots_wbounds))
-        for idx in np.arange(-1, len(knots_wbounds) - degree - 1)
-    ]
-    spline_dm = vstack([m for m in matrices if (m.sum() != 0)], format="csr").T
-    return SparseDesignMatrix(spline_dm, name=name)
+
+    spline_dm = _spline_basis(x.tobytes(), tuple(knots.tolist()), degree)
+    return SparseDesignMatrix(spline_dm.copy(), name=name)
 
 
 def create_spline_matrix(
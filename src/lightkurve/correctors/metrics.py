@@ -5,23 +5,93 @@ which enable users to assess whether the noise in a systematics-corrected light
 under- or over-fitted.  These features were contributed by Jeff Smith (cf. https://github.com/lightkurve/lightkurve/pull/855)
 and are in turn inspired by similar metrics in use by the PDC module of the official Kepler/TESS pipeline.
 """
+import hashlib
+import json
 import logging
-import copy
+import os
+import re
 
 import numpy as np
 from scipy.interpolate import PchipInterpolator
 from memoization import cached
 from astropy import units as u
+from astropy.time import Time
 from typing import Union
 
-from .. import LightCurve
+from .. import LightCurve, config
 
 
 log = logging.getLogger(__name__)
 
 
+class OverfitMetricCache:
+    """Holds the parts of `overfit_metric_lombscargle` which do not depend on
+    the corrected light curve.
+
+    The periodogram of the original light curve, its frequency grid, and the
+    mean power of white noise realizations sampled at the same times are
+    computed once, then reused for every corrected light curve which is
+    compared to the same original light curve, e.g. for every value of the
+    regularization term tried by `CBVCorrector.correct`.
+
+    The noise periodograms are computed for a unit standard deviation and
+    rescaled to the uncertainties of each corrected light curve.  The same
+    noise realizations are thus reused across calls, which makes the metric
+    a deterministic function of the corrected light curve.
+
+    Parameters
+    ----------
+    original_lc : LightCurve
+        Uncorrected light curve.
+    """
+
+    def __init__(self, original_lc: LightCurve):
+        # The fit can sometimes result in NaNs
+        # Also median normalize the original LC
+        orig_lc = original_lc.copy()
+        orig_lc = orig_lc.remove_nans().normalize()
+        orig_lc -= 1.0
+        self.orig_lc = orig_lc
+        self.pg_orig = orig_lc.to_periodogram()
+        self._noise_power = np.zeros(0)
+
+    def noise_power(self, n_samples: int) -> np.ndarray:
+        """Returns the mean periodogram power of ``n_samples`` realizations of
+        white Gaussian noise with unit standard deviation.
+
+        The realizations are evaluated in a single batch on the frequency grid
+        of the original light curve, and are reused by subsequent calls.
+        """
+        n_new = n_samples - len(self._noise_power)
+        if n_new > 0:
+            from ..periodogram import LombScarglePeriodogram
+
+            try:
+                import nifty_ls  # noqa: F401
+
+                ls_method = "fastnifty"  # Batch all realizations in one call
+            except ImportError:
+                ls_method = "fast"
+            time = self.orig_lc.time
+            noise = np.random.randn(n_new, len(time))
+            noise_lcs = [
+                LightCurve(time=time, flux=flux, flux_err=np.zeros(len(time)))
+                for flux in noise
+            ]
+            batch = LombScarglePeriodogram.from_lightcurves(
+                noise_lcs, frequency=self.pg_orig.frequency, ls_method=ls_method
+            )
+            self._noise_power = np.append(
+                self._noise_power, np.nanmean(batch.power.value, axis=1)
+            )
+        return self._noise_power[:n_samples]
+
+
 def overfit_metric_lombscargle(
-    original_lc: LightCurve, corrected_lc: LightCurve, n_samples: int = 10
+    original_lc: LightCurve,
+    corrected_lc: LightCurve,
+    n_samples: int = 10,
+    cache: OverfitMetricCache = None,
 ) -> float:
     """Uses a LombScarglePeriodogram to assess the change in broad-band
     power in a corrected light curve to measure the degree of over-fitting.
@@ -36,79 +106,67 @@ def overfit_metric_lombscargle(
     Parameters
     ----------
     original_lc : LightCurve
-        Uncorrected light curve.
+        Uncorrected light curve. Ignored if ``cache`` is given.
     corrected_lc : LightCurve
         Light curve from which systematics have been removed.
     n_samples : int
         The number of times to compute and average the metric
         This can stabilize the value, default = 10
+    cache : OverfitMetricCache
+        The periodograms of ``original_lc`` and of the noise realizations,
+        to reuse them across calls. If None, they are computed for this call.
 
     Returns
     -------
     overfit_metric : float
         A float in the range [0,1] where 0 => Bad, 1 => Good
     """
-    # The fit can sometimes result in NaNs
-    # Also median normalize original and correctod LCs
-    orig_lc = original_lc.copy()
-    orig_lc = orig_lc.remove_nans().normalize()
-    orig_lc -= 1.0
+    if cache is None:
+        cache = OverfitMetricCache(original_lc)
+    # Median normalize the corrected LC
     corrected_lc = corrected_lc.copy()
     corrected_lc = corrected_lc.remove_nans().normalize()
     corrected_lc -= 1.0
     if len(corrected_lc) == 0:
         return 1.0
 
-    # Perform the measurement multiple times and average to stabilize the metric
-    metric_per_iter = []
-    for idx in np.arange(n_samples):
-        pgOrig = orig_lc.to_periodogram()
-        # Use the same periods in the corrected flux as just used in the
-        # original flux
-        pgCorrected = corrected_lc.to_periodogram(frequency=pgOrig.frequency)
-
-        # Get an estimate of the PSD at the uncertainties limit
-        # The raw and corrected uncertainties should be essentially identical so
-        # use the corrected
-        # TODO: the periodogram of WGN should be analytical to compute!
-        nNonGappedCadences = len(orig_lc)
-        meanCorrectedUncertainties = np.nanmean(corrected_lc.flux_err)
-        WGNCorrectedUncert = (
-            np.random.randn(nNonGappedCadences, 1) * meanCorrectedUncertainties
-        ).T[0]
-        model_err = np.zeros(nNonGappedCadences)
-        noise_lc = LightCurve(
-            time=orig_lc.time, flux=WGNCorrectedUncert, flux_err=model_err
-        )
-        pgCorrectedUncert = noise_lc.to_periodogram()
-        meanCorrectedUncertPower = np.nanmean(np.array(pgCorrectedUncert.power))
-
-        # Compute the change in power
-        pgChange = np.array(pgCorrected.power) - np.array(pgOrig.power)
-
-        # Ignore nans
-        pgChange = pgChange[~np.isnan(pgChange)]
-
-        # If no increase in power in ANY bands then return a perfect loss
-        # function
-        if len(np.nonzero(pgChange > 0.0)[0]) == 0:
-            metric_per_iter.append(0.0)
-        else:
-            # We are only concerned with bands where the power increased so
-            # when(pgCorrected - pgOrig) > 0
-            # Normalize by the noise in the uncertainty
-            # We want the goodness to begin to degrade when the introduced
-            # noise is greater than the uncertainties.
-            # So, when Sigmoid > 0.5 (given twiceSigmoidInv defn.)
-            denominator = (
-                len(np.nonzero(pgChange > 0.0)[0])
-            ) * meanCorrectedUncertPower
-            if denominator == 0:
-                # Suppress divide by zero warning
-                result = np.inf
-            else:
-                result = np.sum(pgChange[pgChange > 0.0]) / denominator
-            metric_per_iter.append(result)
+    pgOrig = cache.pg_orig
+    # Use the same periods in the corrected flux as just used in the
+    # original flux
+    pgCorrected = corrected_lc.to_periodogram(frequency=pgOrig.frequency)
+
+    # Get an estimate of the PSD at the uncertainties limit
+    # The raw and corrected uncertainties should be essentially identical so
+    # use the corrected.  The periodogram power scales with the standard
+    # deviation of the noise.
+    # TODO: the periodogram of WGN should be analytical to compute!
+    meanCorrectedUncertainties = np.nanmean(corrected_lc.flux_err.value)
+    meanCorrectedUncertPower = cache.noise_power(n_samples) * meanCorrectedUncertainties
+
+    # Compute the change in power
+    pgChange = np.array(pgCorrected.power) - np.array(pgOrig.power)
+
+    # Ignore nans
+    pgChange = pgChange[~np.isnan(pgChange)]
+
+    # Average the measurement over the noise realizations to stabilize the metric
+    # If no increase in power in ANY bands then return a perfect loss
+    # function
+    if len(np.nonzero(pgChange > 0.0)[0]) == 0:
+        metric_per_iter = np.zeros(n_samples)
+    else:
+        # We are only concerned with bands where the power increased so
+        # when(pgCorrected - pgOrig) > 0
+        # Normalize by the noise in the uncertainty
+        # We want the goodness to begin to degrade when the introduced
+        # noise is greater than the uncertainties.
+        # So, when Sigmoid > 0.5 (given twiceSigmoidInv defn.)
+        denominator = (
+            len(np.nonzero(pgChange > 0.0)[0])
+        ) * meanCorrectedUncertPower
+        with np.errstate(divide="ignore"):
+            # Suppress divide by zero warning, yielding np.inf
+            metric_per_iter = np.sum(pgChange[pgChange > 0.0]) / denominator
 
     metric = np.mean(metric_per_iter)
 
@@ -131,6 +189,7 @@ def underfit_metric_neighbors(
     interpolate: bool = False,
     extrapolate: bool = False,
     quality_bitmask: Union[int, str] = "default",
+    n_workers: int = 4,
 ):
     """This goodness metric measures the degree of under-fitting of the
     CBVs to the light curve. It does so by measuring the mean residual target to
@@ -168,6 +227,11 @@ def underfit_metric_neighbors(
         If `True`, the flux values of the neighboring light curves will be
         interpolated to match the times of the `corrected_lc`.
         If `False`, the flux values will simply be aligned by time where possible.
+    n_workers : int
+        Number of neighboring light curves to download concurrently.
+        The preprocessed neighboring light curves are kept in the
+        ``neighbors`` subdirectory of the lightkurve cache directory, so that
+        only the ones which were never used before are downloaded.
 
     Returns
     -------
@@ -180,8 +244,10 @@ def underfit_metric_neighbors(
     corrected_lc -= 1.0
     corrected_lc_flux = corrected_lc.flux.value
 
-    # Download and pre-process neighboring light curves
-    lc_neighborhood, lc_neighborhood_flux = _download_and_preprocess_neighbors(
+    # Download and pre-process neighboring light curves, and normalize their
+    # flux.  These are cached for the target, e.g. for every alpha value
+    # tried by CBVCorrector.correct
+    mask, unitNormFlux = _normalize_neighbors(
         corrected_lc=corrected_lc,
         radius=radius,
         min_targets=min_targets,
@@ -190,27 +256,16 @@ def underfit_metric_neighbors(
         extrapolate=extrapolate,
         flux_column="sap_flux",
         quality_bitmask=quality_bitmask,
+        n_workers=n_workers,
     )
-
-    # Create fluxMatrix. The last entry is the target under study
-    # Check that all neighboring targets have similar shape
-    if not np.all([len(lc_neighborhood_flux[0]) == len(l) for l in lc_neighborhood_flux]):
+    if len(mask) != len(corrected_lc_flux):
         raise Exception('Neighbroing targets do not all have the same shape')
-    fluxMatrix = np.zeros((len(lc_neighborhood_flux[0]), len(lc_neighborhood_flux) + 1))
-    for idx in np.arange(len(fluxMatrix[0, :]) - 1):
-        fluxMatrix[:, idx] = lc_neighborhood_flux[idx]
-    # Add in the trimmed target under study
-    fluxMatrix[:, -1] = corrected_lc_flux
-
-    # Remove NaNs from any flux column
-    mask = np.zeros(fluxMatrix.shape[0], dtype=bool)
-    for i in range(fluxMatrix.shape[1]):
-        mask |= np.isnan(fluxMatrix[:, i])
-    fluxMatrix = fluxMatrix[~mask, :]
 
     # Determine the target-target correlation between target and
-    # neighborhood
-    correlationMatrix = _compute_correlation(fluxMatrix)
+    # neighborhood, ignoring the cadences where any target has a NaN
+    # Only the correlations of the target under study are needed, the
+    # correlations between two neighbors are not.
+    correlation = _compute_correlation_with(unitNormFlux, corrected_lc_flux[mask])
 
     # The selection basis for targets used for the PDC-MAP SVD  uses median
     # absolute correlation per star.  However, here we wish to overemphasize
@@ -221,7 +276,7 @@ def underfit_metric_neighbors(
     # to mean a meaningful correlation. The median Pearson correlation of
     # WGN of nCadences is approximated by the equation:
     # 0.0010288 + 0.80304 nCadences^ -0.50128
-    nCadences = len(fluxMatrix[:, 0])
+    nCadences = np.count_nonzero(mask)
     beta = [0.0007, 0.8083, -0.5023]
     WGNCorrelation = beta[0] + beta[1] * (nCadences ** (beta[2]))
 
@@ -234,16 +289,11 @@ def underfit_metric_neighbors(
     # Over-emphasize any individual correlation groups. Note the power of
     # three after taking the absolute value
     # of the correlation. Also, the mean is used so that outliers are *not* ignored.
-    # Zero diagonal elements
-    correlationMatrix = np.tril(correlationMatrix, k=-1) + np.triu(
-        correlationMatrix, k=+1
-    )
+    # The correlation of the target with itself (the diagonal) is zeroed
+    correlation = np.append(correlation, 0.0)
 
     # Add up the correlation over all targets ignoring NaNs (no corrected fit)
-    correlation = correlationScale * np.nanmean(np.abs(correlationMatrix) ** 3, axis=0)
-
-    # We only want the last entry, which is for the target under study
-    correlation = correlation[-1]
+    correlation = correlationScale * np.nanmean(np.abs(correlation) ** 3)
 
     # We want the goodness to span (0,1]
     # Use twice a reversed sigmoid to get a [0,1] range mapped from a [0,inf) range
@@ -270,10 +320,15 @@ def _unique_key_for_processing_neighbors(
     author: tuple = ("Kepler", "K2", "SPOC"),
     flux_column: str = "sap_flux",
     quality_bitmask: Union[str,int] = "default",
+    n_workers: int = 4,
 ):
     """Returns a unique key that will determine whether a cached version of a
     call to `_download_and_preprocess_neighbors` can be re-used."""
-    return f"{corrected_lc.ra}{corrected_lc.dec}{corrected_lc.cadenceno}{radius}{min_targets}{max_targets}{author}{flux_column}{interpolate}{quality_bitmask}"
+    # Hash all the cadence numbers, the string of a long array is abbreviated
+    cadenceno = hashlib.sha1(
+        np.ascontiguousarray(corrected_lc.cadenceno, dtype=np.int64)
+    ).hexdigest()
+    return f"{corrected_lc.ra}{corrected_lc.dec}{cadenceno}{radius}{min_targets}{max_targets}{author}{flux_column}{interpolate}{extrapolate}{quality_bitmask}"
 
 
 @cached(custom_key_maker=_unique_key_for_processing_neighbors)
@@ -287,6 +342,7 @@ def _download_and_preprocess_neighbors(
     author: tuple = ("Kepler", "K2", "SPOC"),
     flux_column: str = "sap_flux",
     quality_bitmask: Union[str, int] = "default",
+    n_workers: int = 4,
 ):
     """Returns a collection of neighboring light curves.
 
@@ -312,6 +368,8 @@ def _download_and_preprocess_neighbors(
     extrapolate : bool
         If `True`, the  flux values of the neighboring light curves will be
         also be extrapolated. Note: extrapolated values can be unstable.
+    n_workers : int
+        Number of neighboring light curves to download concurrently.
 
     Returns
     -------
@@ -331,20 +389,12 @@ def _download_and_preprocess_neighbors(
         raise MinTargetsError(
             f"Unable to find at least {min_targets} neighbors within {radius} arcseconds radius."
         )
-    log.info(
-        f"Downloading {len(search)} neighboring light curves. This might take a while."
-    )
-    lcfCol = search.download_all(flux_column=flux_column, quality_bitmask=quality_bitmask)
+    lcfCol = _load_neighbors(search, flux_column, quality_bitmask, n_workers)
 
-    # Pre-process the neighboring light curves
     # Align or interpolate to the corrected light curve
     lc_neighborhood = []
     lc_neighborhood_flux = []
-    # Extract SAP light curves
-    # We want zero-centered median normalized light curves
-    for lc in lcfCol:
-        lcSAP = lc.remove_nans(column=flux_column).normalize()
-        lcSAP.flux -= 1.0
+    for lcSAP in lcfCol:
         # Align or interpolate the neighboring target with the target under study
         if interpolate:
             # Interpolate to corrected_lc cadence times
@@ -357,8 +407,7 @@ def _download_and_preprocess_neighbors(
         else:
             # The CBVs were aligned so also align the neighboring
             # lightcurves
-            aligned_lcSAP = _align_to_lc(lcSAP, corrected_lc)
-            lc_neighborhood_flux.append(aligned_lcSAP.flux.value)
+            lc_neighborhood_flux.append(_align_flux_to_lc(lcSAP, corrected_lc))
 
         lc_neighborhood.append(lcSAP)
 
@@ -375,77 +424,148 @@ def _download_and_preprocess_neighbors(
 
     return lc_neighborhood, lc_neighborhood_flux
 
-def _align_to_lc(lc, ref_lc):
-    """ Aligns a light curve to a reference light curve.
 
-    This method will use the cadence number (lc.cadenceno) to
-    perform the synchronization. Only cadence numbers that exist in both
-    the lc and the ref_lc will have values in the returned lc. All
-    cadence numbers that exist in ref_lc but not in lc will
-    have NaNs returned for those cadences.
+@cached(custom_key_maker=_unique_key_for_processing_neighbors)
+def _normalize_neighbors(
+    corrected_lc: LightCurve,
+    radius: float = 6000.0,
+    min_targets: int = 30,
+    max_targets: int = 50,
+    interpolate: bool = False,
+    extrapolate: bool = False,
+    author: tuple = ("Kepler", "K2", "SPOC"),
+    flux_column: str = "sap_flux",
+    quality_bitmask: Union[str, int] = "default",
+    n_workers: int = 4,
+):
+    """Returns the flux matrix of the neighboring light curves returned by
+    `_download_and_preprocess_neighbors`, normalized by `_unit_norm_flux`.
 
-    Any cadences in the lc not in ref_lc will be removed from the returned lc.
+    Returns
+    -------
+    mask : np.ndarray of bools
+        True for the cadences of ``corrected_lc`` where no neighbor has a NaN.
+    unit_norm_flux : np.ndarray
+        The (cadences x neighbors) normalized flux matrix on those cadences.
+    """
+    _, lc_neighborhood_flux = _download_and_preprocess_neighbors(
+        corrected_lc, radius, min_targets, max_targets, interpolate,
+        extrapolate, author, flux_column, quality_bitmask, n_workers,
+    )
+    # Check that all neighboring targets have similar shape
+    if not np.all([len(lc_neighborhood_flux[0]) == len(l) for l in lc_neighborhood_flux]):
+        raise Exception('Neighbroing targets do not all have the same shape')
+    fluxMatrix = np.column_stack(lc_neighborhood_flux)
+    # Remove NaNs from any flux column
+    mask = ~np.isnan(fluxMatrix).any(axis=1)
+    return mask, _unit_norm_flux(fluxMatrix[mask])
 
-    The returned lc is sorted by cadenceno.
 
-    Parameters
-    ----------
-    lc : LightCurve object
-        The light curve to align
-    ref_lc : LightCurve object
-        The reference light curve to align to
+def _neighbor_store_dir():
+    """Returns the directory of the local store of preprocessed neighboring
+    light curves."""
+    return os.path.join(config.get_cache_dir(), "neighbors")
 
-    Returns
-    -------
-    lc : LightCurve object
-        The light curve aligned to ref_lc
+
+def _neighbor_store_path(row, flux_column, quality_bitmask):
+    """Returns the path of the preprocessed light curve of the search result
+    ``row`` in the neighbor store.
+
+    The file name is the name of the product file, which is unique for each
+    product, including its data release, followed by the preprocessing
+    options, e.g.
+    'tess2019058134432-s0009-0000000261136679-0139-s_lc_sap_flux_default.npz'.
     """
+    name = "{}_{}_{}".format(
+        os.path.splitext(str(row["productFilename"]))[0], flux_column, quality_bitmask
+    )
+    return os.path.join(_neighbor_store_dir(), re.sub(r"[^\w.-]+", "_", name) + ".npz")
 
-    if not isinstance(lc, LightCurve):
-        raise Exception('<lc> must be a LightCurve class')
-    if not isinstance(ref_lc, LightCurve):
-        raise Exception('<ref_lc> must be a LightCurve class')
-
-    if hasattr(lc, 'cadenceno'):
-
-        # Make a deepcopy so we do not just return a modified original
-        aligned_lc = copy.deepcopy(lc)
-
-        # NaN any cadences in ref_lc and not lc
-        # This requires us to add rows to the lc table
-        lc_nan_mask = np.logical_not(np.isin(ref_lc.cadenceno, aligned_lc.cadenceno))
-        lc_nan_indices = np.nonzero(lc_nan_mask)[0]
-        if len(lc_nan_indices) > 0:
-            row_to_add = LightCurve(aligned_lc[0:len(lc_nan_indices)])
-            row_to_add['time'] = ref_lc.time[lc_nan_indices]
-            row_to_add['cadenceno'] = ref_lc.cadenceno[lc_nan_indices]
-            row_to_add['flux'] = np.nan
-            aligned_lc = aligned_lc.append(row_to_add)
-
-        # There appears to be a bug in astropy.timeseries when using ts[x:y]
-        # in combination with ts.remove_row() or ts.remove_rows.
-        # See LightKurve Issue #836.
-        # To get around the error for now, we will attempt to use
-        # ts[x:y]. If it errors out then revert to remove_rows, which is
-        # REALLY slow.
-        try:
-            # This method is fast but might cause errors
-            keep_indices = np.nonzero(np.isin(aligned_lc.cadenceno, ref_lc.cadenceno))[0]
-            aligned_lc = aligned_lc[keep_indices]
-        except:
-            # This method is slow but appears to be more robust
-            trim_indices = np.nonzero(np.logical_not(
-                np.isin(aligned_lc.cadenceno, ref_lc.cadenceno)))[0]
-            aligned_lc.remove_rows(trim_indices)
-
-        # Now sort the lc by cadenceno
-        aligned_lc.sort('cadenceno')
 
-    else:
-        raise Exception('align requires cadence numbers for the ' + \
-                'light curve. NO ALIGNMENT OCCURRED')
+def _load_neighbors(search, flux_column, quality_bitmask, n_workers=4):
+    """Returns the zero-centered, median normalized light curves of all the
+    products of the search result ``search``.
+
+    The light curves are read from the neighbor store.  Those missing from
+    it are downloaded concurrently by ``n_workers`` threads, normalized, and
+    added to the store, which is safe to share between processes: each entry
+    is written atomically, and a target can be the neighbor of many targets.
+    """
+    paths = [_neighbor_store_path(row, flux_column, quality_bitmask)
+             for row in search.table]
+    missing = [idx for idx, path in enumerate(paths) if not os.path.exists(path)]
+    if len(missing) > 0:
+        log.info(
+            f"Downloading {len(missing)} neighboring light curves. This might take a while."
+        )
+        lcfCol = search[missing].download_all(
+            flux_column=flux_column, quality_bitmask=quality_bitmask,
+            n_workers=n_workers,
+        )
+        os.makedirs(_neighbor_store_dir(), exist_ok=True)
+        for idx, lc in zip(missing, lcfCol):
+            # Extract SAP light curves
+            # We want zero-centered median normalized light curves
+            lcSAP = lc.remove_nans(column=flux_column).normalize()
+            lcSAP.flux -= 1.0
+            _write_neighbor(paths[idx], lcSAP)
+    return [_read_neighbor(path) for path in paths]
+
+
+def _write_neighbor(path, lc):
+    """Atomically writes the light curve ``lc`` to the neighbor store."""
+    meta = {key: value for key, value in lc.meta.items()
+            if key in ("LABEL", "TARGETID", "MISSION", "SECTOR", "QUARTER",
+                       "CAMPAIGN", "CAMERA", "CCD", "CHANNEL")}
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as fp:
+        np.savez(
+            fp,
+            time=lc.time.value,
+            time_format=lc.time.format,
+            time_scale=lc.time.scale,
+            flux=lc.flux.value,
+            flux_err=lc.flux_err.value,
+            cadenceno=np.asarray(lc.cadenceno),
+            meta=json.dumps(meta, default=str),
+            lc_class=lc.__class__.__name__,
+        )
+    os.replace(tmp_path, path)
+
+
+def _read_neighbor(path):
+    """Returns the light curve stored by `_write_neighbor` at ``path``."""
+    from .. import lightcurve  # local import to avoid circular import
+
+    with np.load(path) as data:
+        lc_class = getattr(lightcurve, str(data["lc_class"]), LightCurve)
+        lc = lc_class(
+            time=Time(data["time"], format=str(data["time_format"]),
+                      scale=str(data["time_scale"])),
+            flux=data["flux"],
+            flux_err=data["flux_err"],
+            cadenceno=data["cadenceno"],
+            meta=json.loads(str(data["meta"])),
+        )
+    return lc
 
-    return aligned_lc
+
+def _align_flux_to_lc(lc, ref_lc):
+    """Returns the flux of ``lc`` aligned to the reference light curve ``ref_lc``.
+
+    The cadence numbers (``cadenceno``) are used to perform the synchronization.
+    Cadences of ``ref_lc`` missing from ``lc`` are NaN, cadences of ``lc``
+    missing from ``ref_lc`` are removed, and the flux is sorted by cadence
+    number.
+    """
+    lc_cadenceno = np.asarray(lc.cadenceno)
+    ref_cadenceno = np.asarray(ref_lc.cadenceno)
+    keep_indices = np.nonzero(np.isin(lc_cadenceno, ref_cadenceno))[0]
+    nan_indices = np.nonzero(np.logical_not(np.isin(ref_cadenceno, lc_cadenceno)))[0]
+    order = np.argsort(np.concatenate([lc_cadenceno[keep_indices],
+            ref_cadenceno[nan_indices]]), kind='stable')
+    flux = np.concatenate([lc.flux.value[keep_indices], np.full(len(nan_indices), np.nan)])
+    return flux[order]
 
 
 def _compute_correlation(fluxMatrix):
@@ -462,14 +582,30 @@ def _compute_correlation(fluxMatrix):
         The target-target correlation
     """
 
+    nCadences = len(fluxMatrix[:, 0])
+    unitNormFlux = _unit_norm_flux(fluxMatrix)
+
+    correlation_matrix = unitNormFlux.T.dot(unitNormFlux) / nCadences
+
+    return correlation_matrix
+
+
+def _unit_norm_flux(fluxMatrix):
+    """Returns the flux matrix with each target scaled by its RMS flux."""
     nCadences = len(fluxMatrix[:, 0])
 
     # Scale each flux value by the RMS flux for the given target.
     rmsFlux = np.sqrt(np.sum(fluxMatrix ** 2.0, axis=0) / nCadences)
     # If RMS is zero then set to Inf so that we don't get a divide by zero warning
     rmsFlux[np.nonzero(rmsFlux == 0.0)[0]] = np.inf
-    unitNormFlux = fluxMatrix / np.tile(rmsFlux, (nCadences, 1))
+    return fluxMatrix / rmsFlux
 
-    correlation_matrix = unitNormFlux.T.dot(unitNormFlux) / nCadences
 
-    return correlation_matrix
+def _compute_correlation_with(unitNormFlux, flux):
+    """Returns the Pearson correlation of a target's flux with each target of
+    a flux matrix normalized by `_unit_norm_flux`.
+
+    This is the last column of `_compute_correlation` of the flux matrix with
+    ``flux`` appended, without the correlations between the other targets.
+    """
+    return unitNormFlux.T.dot(_unit_norm_flux(flux[:, None])[:, 0]) / len(flux)
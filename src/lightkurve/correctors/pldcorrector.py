@@ -361,10 +361,12 @@ class PLDCorrector(RegressionCorrector):
             Standard deviation at which to remove outliers from fitting
         niters : int (default 5)
             Number of iterations to fit and remove outliers
-        propagate_errors : bool (default False)
+        propagate_errors : bool or str (default False)
             Whether to propagate the uncertainties from the regression. Default is False.
-            Setting to True will increase run time, but will sample from multivariate normal
-            distribution of weights.
+            Setting to True or 'analytic' will compute the model uncertainty from the
+            covariance matrix of the weights; 'sampling' will estimate it from samples
+            of the multivariate normal distribution of weights. See
+            `RegressionCorrector.correct`.
         use_gp, gp_timescale : DEPRECATED
             As of Lightkurve v2.0 PLDCorrector uses splines instead of Gaussian Processes.
         aperture_mask : DEPRECATED
@@ -3,6 +3,7 @@ with user-defined Gaussian priors in a fast, analytical way.
 """
 import logging
 import warnings
+from collections import OrderedDict
 
 from astropy.stats import sigma_clip
 from astropy import units as u
@@ -10,7 +11,9 @@ from astropy.utils.exceptions import AstropyUserWarning
 from astropy.utils.masked import Masked
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.sparse import issparse, csr_matrix
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+from scipy.sparse import csc_matrix, diags, issparse
+from scipy.sparse.linalg import splu
 
 from .corrector import Corrector
 from .designmatrix import (
@@ -20,6 +23,7 @@ from .designmatrix import (
     SparseDesignMatrixCollection,
 )
 from ..lightcurve import LightCurve, MPLSTYLE
+from ..utils import validate_method
 
 
 __all__ = ["RegressionCorrector"]
@@ -28,6 +32,219 @@ __all__ = ["RegressionCorrector"]
 log = logging.getLogger(__name__)
 
 
+def _model_error(X, covariance, max_chunk_size=2 ** 22):
+    """Returns the uncertainty of the model ``X.dot(w)`` given the covariance of ``w``.
+
+    This is the square root of the diagonal of ``X covariance X^T``, which
+    is computed over chunks of at most ``max_chunk_size`` elements of ``X``
+    so that the (time x time) matrix is never built.  ``X`` may be sparse.
+    """
+    if issparse(X):
+        X = X.tocsr()
+    n_rows = max(1, max_chunk_size // max(1, X.shape[1]))
+    variance = np.empty(X.shape[0])
+    for start in range(0, X.shape[0], n_rows):
+        chunk = X[start : start + n_rows]
+        if issparse(chunk):
+            product = chunk.multiply(chunk.dot(covariance)).sum(axis=1)
+            variance[start : start + n_rows] = np.asarray(product).ravel()
+        else:
+            variance[start : start + n_rows] = np.einsum(
+                "ij,ij->i", chunk, chunk.dot(covariance)
+            )
+    # Rounding errors may yield tiny negative variances
+    return np.sqrt(np.clip(variance, 0, None))
+
+
+class _NormalEquations(object):
+    """Normal equations of the weighted linear regression of a light curve.
+
+    The normal matrix ``X^T cov^-1 X`` and vector ``X^T cov^-1 y`` are built
+    once for a cadence mask.  When the mask changes, e.g. between two sigma
+    clipping iterations, only the contribution of the cadences which enter
+    or leave the fit is added or subtracted, rather than rebuilding them
+    from all the cadences.  The normal matrix stays sparse if ``X`` is sparse.
+
+    Parameters
+    ----------
+    X : np.ndarray or scipy.sparse matrix
+        The design matrix, of shape (time, regressors).
+    flux : np.ndarray
+        The flux values.
+    flux_err : np.ndarray
+        The flux uncertainties. If they are all NaN, they default to one.
+    cache_size : int
+        Number of cadence masks for which the normal equations, and their
+        eigendecomposition if the 'eigh' solver is used, are kept in memory.
+        This avoids rebuilding them when the same light curve is fitted many
+        times with different prior widths, e.g. by `CBVCorrector.correct`.
+    max_updates : int
+        Number of successive incremental updates after which the normal
+        equations are rebuilt from all the cadences, so that rounding errors
+        do not accumulate over a long sequence of masks.
+    """
+
+    def __init__(self, X, flux, flux_err, cache_size=0, max_updates=20):
+        self.X = X.tocsr() if issparse(X) else X
+        self.flux = flux
+        if np.all(~np.isfinite(flux_err)):
+            self.weights = np.ones(len(flux))
+        else:
+            self.weights = 1 / flux_err ** 2
+        self.mask = None
+        self.cache_size = cache_size
+        self.max_updates = max_updates
+        self._n_updates = 0
+        self._cache = OrderedDict()
+        self._key = None
+        self._eigh = None
+
+    def _contribution(self, rows):
+        """Returns the normal matrix and vector of the cadences in ``rows``."""
+        X = self.X[rows]
+        weights = self.weights[rows]
+        if issparse(X):
+            A = X.T.dot(X.multiply(weights[:, None]).tocsr())
+        else:
+            A = X.T.dot(X * weights[:, None])
+        B = X.T.dot(self.flux[rows] * weights)
+        return A, B
+
+    def update(self, cadence_mask):
+        """Updates the normal equations to use the cadences in ``cadence_mask``."""
+        if self.cache_size > 0:
+            self._key = np.packbits(cadence_mask).tobytes()
+            if self._key in self._cache:
+                self.A, self.B, self._eigh, self._n_updates = self._cache[self._key]
+                self._cache.move_to_end(self._key)
+                self.mask = cadence_mask.copy()
+                return
+        self._eigh = None
+        self._update(cadence_mask)
+        if self.cache_size > 0:
+            self._cache[self._key] = (self.A, self.B, None, self._n_updates)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _update(self, cadence_mask):
+        if self.mask is not None and self._n_updates < self.max_updates:
+            added = cadence_mask & ~self.mask
+            removed = self.mask & ~cadence_mask
+            # Only update if it touches fewer cadences than rebuilding
+            if added.sum() + removed.sum() < cadence_mask.sum():
+                for rows, sign in [(added, 1), (removed, -1)]:
+                    if rows.any():
+                        A, B = self._contribution(rows)
+                        self.A = self.A + sign * A
+                        self.B = self.B + sign * B
+                self.mask = cadence_mask.copy()
+                self._n_updates += 1
+                return
+        self.A, self.B = self._contribution(cadence_mask)
+        self.mask = cadence_mask.copy()
+        self._n_updates = 0
+
+    def _solve_eigh(self, prior_mu, prior_sigma, propagate_errors):
+        """Solves the normal equations using the eigendecomposition of the
+        normal matrix, which is computed once per cadence mask.
+
+        Adding a prior of the same width to all the coefficients only shifts
+        the eigenvalues, so that solving again for a new width only takes a
+        change of basis, in O(k^2) rather than O(k^3) operations.  Returns
+        None if the prior widths differ or the system is singular.
+        """
+        if issparse(self.A):
+            return None
+        if prior_sigma is None:
+            precision = 0.0
+            B = self.B
+        else:
+            if not np.all(prior_sigma == prior_sigma[0]):
+                return None
+            precision = 1.0 / prior_sigma[0] ** 2
+            B = self.B + (prior_mu / prior_sigma ** 2)
+        if self._eigh is None:
+            self._eigh = np.linalg.eigh(self.A)
+            if self._key in self._cache:
+                self._cache[self._key] = (self.A, self.B, self._eigh, self._n_updates)
+        eigvals, eigvecs = self._eigh
+        eigvals = eigvals + precision
+        if np.any(eigvals <= eigvals.max() * len(eigvals) * np.finfo(float).eps):
+            return None
+        w = eigvecs.dot(eigvecs.T.dot(B) / eigvals)
+        if propagate_errors:
+            w_err = (eigvecs / eigvals).dot(eigvecs.T)
+        else:
+            w_err = np.zeros(len(w)) * np.nan
+        return w, w_err
+
+    def solve(self, prior_mu=None, prior_sigma=None, propagate_errors=False, solver="auto"):
+        """Returns the coefficients and, if requested, their covariance matrix.
+
+        Parameters
+        ----------
+        solver : str, one of 'auto', 'dense', 'cholesky', 'sparse' or 'eigh'
+            'dense' solves the dense normal equations with `numpy.linalg.solve`
+            and `numpy.linalg.inv`.  'cholesky' uses a Cholesky factorization of
+            the dense normal matrix, which is symmetric positive-definite, and
+            falls back to 'dense' if the factorization fails.  'sparse' uses a
+            sparse LU factorization of the sparse normal matrix.  'eigh' uses
+            an eigendecomposition of the normal matrix, which is reused by
+            subsequent solves with a different prior width; it falls back to
+            'cholesky' unless all the prior widths are equal.  'auto' uses
+            'sparse' for sparse design matrices and 'cholesky' otherwise.
+        """
+        solver = validate_method(
+            solver, ["auto", "dense", "cholesky", "sparse", "eigh"]
+        )
+        if solver == "auto":
+            solver = "sparse" if issparse(self.A) else "cholesky"
+        if solver == "eigh":
+            result = self._solve_eigh(prior_mu, prior_sigma, propagate_errors)
+            if result is not None:
+                return result
+            log.debug("Eigendecomposition not applicable, using the Cholesky solver.")
+            solver = "sparse" if issparse(self.A) else "cholesky"
+
+        A, B = self.A, self.B
+        if prior_sigma is not None:
+            if issparse(A):
+                A = A + diags(1.0 / prior_sigma ** 2)
+            else:
+                A = A + np.diag(1.0 / prior_sigma ** 2)
+            B = B + (prior_mu / prior_sigma ** 2)
+
+        if solver == "sparse":
+            try:
+                lu = splu(csc_matrix(A))
+            except RuntimeError:  # The matrix is singular
+                log.debug("Sparse factorization failed, using the dense solver.")
+                solver = "dense"
+            else:
+                w = lu.solve(B)
+                if propagate_errors:
+                    w_err = lu.solve(np.eye(len(w)))
+        if solver in ("cholesky", "dense") and issparse(A):
+            A = A.toarray()
+        if solver == "cholesky":
+            try:
+                factor = cho_factor(A)
+            except LinAlgError:  # The matrix is not positive-definite
+                log.debug("Cholesky factorization failed, using the dense solver.")
+                solver = "dense"
+            else:
+                w = cho_solve(factor, B)
+                if propagate_errors:
+                    w_err = cho_solve(factor, np.eye(len(w)))
+        if solver == "dense":
+            w = np.linalg.solve(A, B)
+            if propagate_errors:
+                w_err = np.linalg.inv(A)
+        if not propagate_errors:
+            w_err = np.zeros(len(w)) * np.nan
+        return w, w_err
+
+
 class RegressionCorrector(Corrector):
     r"""Remove noise using linear regression against a `.DesignMatrix`.
 
@@ -124,8 +341,18 @@ class RegressionCorrector(Corrector):
         """Shorthand for self.design_matrix_collection."""
         return self.design_matrix_collection
 
+    def _normal_equations(self, X):
+        """Returns the `_NormalEquations` used by `correct` to fit ``X``."""
+        return _NormalEquations(X, self.lc.flux.value, self.lc.flux_err.value)
+
     def _fit_coefficients(
-        self, cadence_mask=None, prior_mu=None, prior_sigma=None, propagate_errors=False
+        self,
+        cadence_mask=None,
+        prior_mu=None,
+        prior_sigma=None,
+        propagate_errors=False,
+        solver="auto",
+        normal_equations=None,
     ):
         """Fit the linear regression coefficients.
 
@@ -136,6 +363,11 @@ class RegressionCorrector(Corrector):
         ----------
         cadence_mask : np.ndarray of bool
             Mask, where True indicates a cadence that should be used.
+        solver : str
+            Linear solver, see `RegressionCorrector.correct`.
+        normal_equations : `_NormalEquations`
+            Normal equations of a previous fit of the same light curve and
+            design matrix, which are updated rather than rebuilt.
 
         Returns
         -------
@@ -153,40 +385,17 @@ class RegressionCorrector(Corrector):
         if cadence_mask is None:
             cadence_mask = np.ones(len(self.lc.flux.value), bool)
 
-        # If flux errors are not all finite numbers, then default to array of ones
-        if np.all(~np.isfinite(self.lc.flux_err.value)):
-            flux_err = np.ones(cadence_mask.sum())
-        else:
-            flux_err = self.lc.flux_err.value[cadence_mask]
-
-        # Retrieve the design matrix (X) as a numpy array
-        X = self.dmc.X[cadence_mask]
-        if isinstance(X, np.ndarray):
-            # Compute `X^T cov^-1 X + 1/prior_sigma^2`
-            sigma_w_inv = X.T.dot(X / flux_err[:, None] ** 2)
-            # Compute `X^T cov^-1 y + prior_mu/prior_sigma^2`
-            B = np.dot(X.T, self.lc.flux.value[cadence_mask] / flux_err ** 2)
-
-        elif issparse(X):
-            sigma_f_inv = csr_matrix(1 / flux_err[:, None] ** 2)
-            # Compute `X^T cov^-1 X + 1/prior_sigma^2`
-            sigma_w_inv = X.T.dot(X.multiply(sigma_f_inv))
-            # Compute `X^T cov^-1 y + prior_mu/prior_sigma^2`
-            B = X.T.dot((self.lc.flux[cadence_mask] / flux_err ** 2))
-            sigma_w_inv = sigma_w_inv.toarray()
-
-        if prior_sigma is not None:
-            sigma_w_inv = sigma_w_inv + np.diag(1.0 / prior_sigma ** 2)
-            B = B + (prior_mu / prior_sigma ** 2)
-
-        # Solve for weights w
-        w = np.linalg.solve(sigma_w_inv, B).T
-        if propagate_errors:
-            w_err = np.linalg.inv(sigma_w_inv)
-        else:
-            w_err = np.zeros(len(w)) * np.nan
-
-        return w, w_err
+        if normal_equations is None:
+            normal_equations = _NormalEquations(
+                self.dmc.X, self.lc.flux.value, self.lc.flux_err.value
+            )
+        normal_equations.update(cadence_mask)
+        return normal_equations.solve(
+            prior_mu=prior_mu,
+            prior_sigma=prior_sigma,
+            propagate_errors=propagate_errors,
+            solver=solver,
+        )
 
     def correct(
         self,
@@ -195,6 +404,7 @@ class RegressionCorrector(Corrector):
         sigma=5,
         niters=5,
         propagate_errors=False,
+        solver="auto",
     ):
         """Find the best fit correction for the light curve.
 
@@ -211,10 +421,23 @@ class RegressionCorrector(Corrector):
             Standard deviation at which to remove outliers from fitting
         niters : int (default 5)
             Number of iterations to fit and remove outliers
-        propagate_errors : bool (default False)
+        propagate_errors : bool or str (default False)
             Whether to propagate the uncertainties from the regression. Default is False.
-            Setting to True will increase run time, but will sample from multivariate normal
-            distribution of weights.
+            If True or 'analytic', the uncertainty of the model is computed from the
+            covariance matrix of the weights. If 'sampling', it is estimated from 100
+            samples of the multivariate normal distribution of the weights, drawn
+            with a fixed seed. Either option will increase run time.
+        solver : str, one of 'auto', 'dense', 'cholesky', 'sparse' or 'eigh'
+            Linear solver used to fit the coefficients. 'dense' solves the
+            normal equations with `numpy.linalg.solve`. 'cholesky' uses a
+            Cholesky factorization, and 'sparse' a sparse LU factorization
+            which keeps the normal matrix of a sparse design matrix sparse.
+            'eigh' uses an eigendecomposition of the normal matrix, which is
+            only worthwhile if it is reused for several prior widths, and
+            requires all the prior widths to be equal.
+            The default, 'auto', uses 'sparse' for sparse design matrices and
+            'cholesky' otherwise. With all solvers, the normal equations are
+            updated between iterations with the outliers only.
 
         Returns
         -------
@@ -231,9 +454,17 @@ class RegressionCorrector(Corrector):
                     [design_matrix_collection]
                 )
 
-        # Validate the design matrix. Emits a warning if the matrix has low rank.
-        design_matrix_collection.validate()
         self.design_matrix_collection = design_matrix_collection
+        X = self.dmc.X
+        normal_equations = self._normal_equations(X)
+
+        # Validate the design matrix. Emits a warning if the matrix has low rank.
+        # Normal equations reused from a previous fit were built from the same
+        # matrix, whose rank has already been checked.
+        if normal_equations.mask is None:
+            design_matrix_collection.validate()
+        else:
+            design_matrix_collection.validate(rank=False)
 
         if cadence_mask is None:
             self.cadence_mask = np.ones(len(self.lc.time), bool)
@@ -242,16 +473,25 @@ class RegressionCorrector(Corrector):
 
         # Create an outlier mask using iterative sigma clipping
         self.outlier_mask = np.zeros_like(self.cadence_mask)
+        if isinstance(propagate_errors, str):
+            propagate_errors = validate_method(
+                propagate_errors, ["analytic", "sampling"]
+            )
+        else:
+            propagate_errors = "analytic" if propagate_errors else False
+
         for count in range(niters):
             tmp_cadence_mask = self.cadence_mask & ~self.outlier_mask
             coefficients, coefficients_err = self._fit_coefficients(
                 cadence_mask=tmp_cadence_mask,
                 prior_mu=self.dmc.prior_mu,
                 prior_sigma=self.dmc.prior_sigma,
-                propagate_errors=propagate_errors,
+                propagate_errors=bool(propagate_errors),
+                solver=solver,
+                normal_equations=normal_equations,
             )
             model = np.ma.masked_array(
-                data=self.dmc.X.dot(coefficients), mask=~tmp_cadence_mask
+                data=X.dot(coefficients), mask=~tmp_cadence_mask
             )
             model = u.Quantity(model, unit=self.lc.flux.unit)
             residuals = self.lc.flux - model
@@ -275,22 +515,18 @@ class RegressionCorrector(Corrector):
         self.coefficients = coefficients
         self.coefficients_err = coefficients_err
 
-        model_flux = self.dmc.X.dot(coefficients)
+        model_flux = X.dot(coefficients)
         model_flux -= np.median(model_flux)
-        if propagate_errors:
+        if propagate_errors == "analytic":
+            model_err = _model_error(X, coefficients_err)
+        elif propagate_errors == "sampling":
+            rng = np.random.default_rng(0)
             with warnings.catch_warnings():
                 # ignore "RuntimeWarning: covariance is not symmetric positive-semidefinite."
                 warnings.simplefilter("ignore", RuntimeWarning)
-                samples = np.asarray(
-                    [
-                        self.dmc.X.dot(
-                            np.random.multivariate_normal(
-                                coefficients, coefficients_err
-                            )
-                        )
-                        for idx in range(100)
-                    ]
-                ).T
+                samples = X.dot(
+                    rng.multivariate_normal(coefficients, coefficients_err, size=100).T
+                )
             model_err = np.abs(
                 np.percentile(samples, [16, 84], axis=1)
                 - np.median(samples, axis=1)[:, None].T
@@ -116,10 +116,12 @@ class SFFCorrector(RegressionCorrector):
             Number of iterations to fit and remove outliers
         restore_trend : bool (default False)
             Whether to restore the long term spline trend to the light curve
-        propagate_errors : bool (default False)
+        propagate_errors : bool or str (default False)
             Whether to propagate the uncertainties from the regression. Default is False.
-            Setting to True will increase run time, but will sample from multivariate normal
-            distribution of weights.
+            Setting to True or 'analytic' will compute the model uncertainty from the
+            covariance matrix of the weights; 'sampling' will estimate it from samples
+            of the multivariate normal distribution of weights. See
+            `RegressionCorrector.correct`.
         additional_design_matrix : `~lightkurve.lightcurve.Correctors.DesignMatrix` (optional)
             Additional design matrix to remove, e.g. containing background vectors.
         polyorder : int
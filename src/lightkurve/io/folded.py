@@ -24,8 +24,8 @@ def read_folded_lightcurve(
     
     lc = read_generic_lightcurve(filename, flux_column='FLUX', time_format=time_format)
 
-    if isinstance(lc.filename, fits.HDUList):
-        hdu = lc.filename
+    if isinstance(filename, fits.HDUList):
+        hdu = filename
     else: 
         hdu = fits.open(lc.filename)
 
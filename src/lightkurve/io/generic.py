@@ -1,9 +1,11 @@
 """Read a generic FITS table containing a light curve."""
+import functools
 import logging
+import re
 import warnings
 
 from astropy.io import fits
-from astropy.table import Table
+from astropy.table import Column, MaskedColumn, Table
 from astropy.time import Time, TimeDelta
 from astropy.units import UnitsWarning
 import astropy.units as u
@@ -16,6 +18,134 @@ from ..units import ppm
 
 log = logging.getLogger(__name__)
 
+try:
+    # Private AstroPy helper translating TDISPn into a Python format string;
+    # if it ever moves, `_read_fits_table` falls back to `Table.read`.
+    from astropy.io.fits.column import _fortran_to_python_format
+except ImportError:  # pragma: no cover
+    _fortran_to_python_format = None
+
+# Header keywords which `Table.read` leaves out of the table meta data
+# (mirrors ``astropy.io.fits.connect``)
+_REMOVE_KEYWORDS = (
+    "XTENSION", "BITPIX", "NAXIS", "NAXIS1", "NAXIS2",
+    "PCOUNT", "GCOUNT", "TFIELDS", "THEAP",
+)
+_COLUMN_KEYWORD_REGEXP = re.compile(
+    "(TTYPE|TFORM|TUNIT|TNULL|TSCAL|TZERO|TDISP|TBCOL|TDIM|TCTYP|TCUNI|TCRPX|TCRVL|TCDLT|TRPOS)[0-9]+$"
+)
+
+
+def _fix_unit(unit):
+    """Corrects the non-standard units commonly found in archived data products."""
+    # Speed-up: comparing units by their string representation is 1000x
+    # faster than performing full-blown unit comparison
+    unitstr = str(unit)
+    # Fixes issue #1504: lightcurve.to_fits() saves "electron / s"
+    if unitstr in ("e-/s", "electron / s"):
+        return u.Unit("electron/s")
+    elif unitstr == "pixels":
+        return u.pixel
+    elif unitstr == "ppm" and repr(unit).startswith("Unrecognized"):
+        # Workaround for issue #956
+        return ppm
+    elif unitstr == "ADU":
+        return u.adu
+    elif unitstr.lower() == "unitless":
+        return u.dimensionless_unscaled
+    elif unitstr.lower() == "degcelcius":
+        # CDIPS has non-astropy units
+        return u.deg_C
+    return unit
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_units(tunits):
+    """Returns the units for a tuple of TUNITn values.
+
+    Files from the same pipeline share their column units, so the result is
+    cached on the whole tuple to parse each set of units only once.
+    """
+    with warnings.catch_warnings():
+        # By default, AstroPy emits noisy warnings about units commonly used
+        # in archived TESS data products (e.g., "e-/s" and "pixels").
+        # We ignore them here because they don't affect Lightkurve's features.
+        # Inconsistencies between TESS data products and the FITS standard
+        # out to be addressed at the archive level. (See issue #1216.)
+        warnings.simplefilter("ignore", category=UnitsWarning)
+        return tuple(
+            None if tunit is None else _fix_unit(u.Unit(tunit, format="fits", parse_strict="warn"))
+            for tunit in tunits
+        )
+
+
+def _read_fits_table(hdu):
+    """Reads a binary table HDU into a `~astropy.table.Table` with lowercase
+    column names and corrected units.
+
+    This is a faster equivalent of ``Table.read(hdu, format="fits")`` for the
+    numeric tables found in light curve files: columns are views on the
+    FITS data rather than copies and units are parsed once per file layout.
+    Tables containing strings, variable-length arrays, or serialized mixin
+    columns are read using `~astropy.table.Table.read`.
+    """
+    columns = hdu.columns
+    header = hdu.header
+    if (
+        _fortran_to_python_format is None
+        or any(col.dtype.base.kind not in "biuf" or col.format.p_format for col in columns)
+        or "ASTROPY-SERIALIZED" in str(header.get("COMMENT", ""))
+    ):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UnitsWarning)
+            tab = Table.read(hdu, format="fits")
+        for colname in tab.colnames:
+            if getattr(tab[colname], "unit", None) is not None:
+                tab[colname].unit = _fix_unit(tab[colname].unit)
+            tab.rename_column(colname, colname.lower())
+        return tab
+
+    data = hdu.data
+    units = _parse_units(tuple(col.unit for col in columns))
+    tab_columns = []
+    for col, unit in zip(columns, units):
+        arr = data[col.name]
+        kwargs = dict(name=col.name.lower(), unit=unit)
+        if col.disp is not None:
+            kwargs["format"] = _fortran_to_python_format(col.disp)
+        # Mask values as `Table.read` does: TNULL if set, NaN for floats
+        if col.null is not None:
+            mask = arr == col.null
+            tab_columns.append(MaskedColumn(arr, mask=mask, fill_value=col.null, copy=False, **kwargs))
+        elif arr.dtype.kind == "f" and np.isnan(arr).any():
+            tab_columns.append(
+                MaskedColumn(arr, mask=np.isnan(arr), fill_value=np.nan, copy=False, **kwargs)
+            )
+        else:
+            tab_columns.append(Column(arr, copy=False, **kwargs))
+    tab = Table(tab_columns, copy=False)
+
+    # Copy the header cards into the meta data, as `Table.read` does
+    for key, value, comment in header.cards:
+        if key in ["COMMENT", "HISTORY"]:
+            # Convert to io.ascii format
+            if key == "COMMENT":
+                key = "comments"
+            if key in tab.meta:
+                tab.meta[key].append(value)
+            else:
+                tab.meta[key] = [value]
+        elif key in tab.meta:  # key is duplicate
+            if isinstance(tab.meta[key], list):
+                tab.meta[key].append(value)
+            else:
+                tab.meta[key] = [tab.meta[key], value]
+        elif key in _REMOVE_KEYWORDS or _COLUMN_KEYWORD_REGEXP.match(key):
+            pass
+        else:
+            tab.meta[key] = value
+    return tab
+
 
 def read_generic_lightcurve(
     filename,
@@ -46,45 +176,13 @@ def read_generic_lightcurve(
         # Raise an exception if the requested extension is invalid
         if isinstance(ext, str):
             validate_method(ext, supported_methods=[hdu.name.lower() for hdu in hdulist])
-        with warnings.catch_warnings():
-            # By default, AstroPy emits noisy warnings about units commonly used
-            # in archived TESS data products (e.g., "e-/s" and "pixels").
-            # We ignore them here because they don't affect Lightkurve's features.
-            # Inconsistencies between TESS data products and the FITS standard
-            # out to be addressed at the archive level. (See issue #1216.)
-            warnings.simplefilter("ignore", category=UnitsWarning)
-            tab = Table.read(hdulist[ext], format="fits")
+        tab = _read_fits_table(hdulist[ext])
 
         # Make sure the meta data also includes header fields from extension #0
         tab.meta.update(hdulist[0].header)
 
         tab.meta = {k: v for k, v in tab.meta.items()}
 
-        for colname in tab.colnames:
-            # Ensure units have the correct astropy format
-            # Speed-up: comparing units by their string representation is 1000x
-            # faster than performing full-blown unit comparison
-            unitstr = str(tab[colname].unit)
-            if unitstr == "e-/s":
-                tab[colname].unit = "electron/s"
-            # Fixes issue #1504
-            if unitstr == "electron / s": #lightcurve.to_fits() saves as this string
-                tab[colname].unit = "electron/s"
-            elif unitstr == "pixels":
-                tab[colname].unit = "pixel"
-            elif unitstr == "ppm" and repr(tab[colname].unit).startswith("Unrecognized"):
-                # Workaround for issue #956
-                tab[colname].unit = ppm
-            elif unitstr == "ADU":
-                tab[colname].unit = "adu"
-            elif unitstr.lower() == "unitless":
-                tab[colname].unit = ""
-            elif unitstr.lower() == "degcelcius":
-                # CDIPS has non-astropy units
-                tab[colname].unit = "deg_C"
-            # Rename columns to lowercase
-            tab.rename_column(colname, colname.lower())
-
         # Some KEPLER files used to have a T column instead of TIME.
         if time_column == "time" and "time" not in tab.columns and "t" in tab.colnames:
             tab.rename_column("t", "time")
@@ -177,7 +275,8 @@ def read_generic_lightcurve(
         )
         tab.meta["RA"] = hdulist[0].header.get("RA_OBJ")
         tab.meta["DEC"] = hdulist[0].header.get("DEC_OBJ")
-        tab.meta["FILENAME"] = filename
+        # Record the file name rather than an HDUList, which is expensive to copy
+        tab.meta["FILENAME"] = filename.filename() if isinstance(filename, fits.HDUList) else filename
         # issue 1371 - 
         # When reading in a file saved with to_fits, the flux source is not known
         # We could save the flux_origin keyword, but that is an incomplete story, 
@@ -1,5 +1,10 @@
 """Functions for reading light curve data."""
+import contextlib
+import functools
 import logging
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from astropy.io import fits
 from astropy.utils import deprecated
@@ -7,7 +12,7 @@ from astropy.utils import deprecated
 from lightkurve.targetpixelfile import TargetPixelFile
 
 from ..lightcurve import KeplerLightCurve, TessLightCurve, LightCurve
-from ..collections import LightCurveCollection, TargetPixelFileCollection
+from ..collections import LightCurveCollection, TargetPixelFileCollection, _stitch_lightcurves
 from ..utils import LightkurveDeprecationWarning, LightkurveError
 from .generic import read_generic_lightcurve
 from .folded import read_folded_lightcurve
@@ -85,6 +90,9 @@ def read(path_or_url, **kwargs):
         >>> tpf = lk.read("mytpf.fits")  # doctest: +SKIP
     """
     log.debug("Opening {}.".format(path_or_url))
+    # Local files are opened only once: the HDUList used to detect the file type
+    # is handed on to the reader, which avoids parsing the headers twice.
+    hdulist = None
     # pass header into `detect_filetype()`
     try:
         if (isinstance(path_or_url, str) and path_or_url.startswith('s3://')):
@@ -93,16 +101,24 @@ def read(path_or_url, **kwargs):
                 filetype = detect_filetype(temp)
         elif isinstance(path_or_url, fits.HDUList):
             filetype = detect_filetype(path_or_url)
+        elif isinstance(path_or_url, (str, os.PathLike)) and os.path.isfile(path_or_url):
+            hdulist = fits.open(path_or_url)
+            filetype = detect_filetype(hdulist)
         else:
             with fits.open(path_or_url) as temp:
                 filetype = detect_filetype(temp)
         log.debug("Detected filetype: '{}'.".format(filetype))
     except OSError as e:
         filetype = None
+        if hdulist is not None:
+            hdulist.close()
+            hdulist = None
         # Raise an explicit FileNotFoundError if file not found
         if "No such file" in str(e):
             raise e
     except Exception as exc2:
+        if hdulist is not None:
+            hdulist.close()
         # case unexpected error during detection, e.g., if a file is corrupted such that FITS headers are truncated
         raise LightkurveError(
             f"Unexpected error in detecting the type of the data product: '{type(exc2).__name__}: {exc2}'\n"
@@ -111,33 +127,12 @@ def read(path_or_url, **kwargs):
             "Please remove it from your disk and try again."
         ) from exc2
 
+    if filetype in _TPF_FILETYPES:
+        return _read_tpf(path_or_url, filetype, hdulist, **kwargs)
+
+    source = path_or_url if hdulist is None else hdulist
     try:
-        if filetype == "KeplerLightCurve":
-            return KeplerLightCurve.read(path_or_url, format="kepler", **kwargs)
-        elif filetype == "TessLightCurve":
-            return TessLightCurve.read(path_or_url, format="tess", **kwargs)
-        elif filetype == "QLP":
-            return TessLightCurve.read(path_or_url, format="qlp", **kwargs)
-        elif filetype == "ELEANOR":
-            return TessLightCurve.read(path_or_url, format="eleanor", **kwargs)
-        elif filetype == "PATHOS":
-            return TessLightCurve.read(path_or_url, format="pathos", **kwargs)
-        elif filetype == "CDIPS":
-            return TessLightCurve.read(path_or_url, format="cdips", **kwargs)
-        elif filetype == "TASOC":
-            return TessLightCurve.read(path_or_url, format="tasoc", **kwargs)
-        elif filetype == "K2SFF":
-            return KeplerLightCurve.read(path_or_url, format="k2sff", **kwargs)
-        elif filetype == "EVEREST":
-            return KeplerLightCurve.read(path_or_url, format="everest", **kwargs)
-        elif filetype == "KEPSEISMIC":
-            return KeplerLightCurve.read(path_or_url, format="kepseismic", **kwargs)
-        elif filetype == "TGLC":
-            return TessLightCurve.read(path_or_url, format="tglc", **kwargs)
-        elif filetype == "Folded":
-            return read_folded_lightcurve(path_or_url, **kwargs)
-        elif filetype == "generic":
-            return read_generic_lightcurve(path_or_url, **kwargs)
+        lc = _read_lightcurve(source, filetype, **kwargs)
     except BaseException as exc:
         # ensure path_or_url is in the error
         raise LightkurveError(
@@ -145,25 +140,20 @@ def read(path_or_url, **kwargs):
             "This file may be corrupt due to an interrupted download. "
             "Please remove it from your disk and try again."
         ) from exc
+    finally:
+        if hdulist is not None:
+            hdulist.close()
+
+    if lc is not None:
+        if hdulist is not None:
+            # The readers record whatever they were given; report the path instead
+            lc.meta["FILENAME"] = path_or_url
+        return lc
 
     # Official data products;
     # if the filetype is recognized, instantiate a class of that name
     if filetype is not None:
-        try:
-            return getattr(__import__("lightkurve"), filetype)(path_or_url, **kwargs)
-        except AttributeError as exc:
-            raise LightkurveError(
-                f"Data product f{path_or_url} of type {filetype} is not supported "
-                "in this version of Lightkurve."
-            ) from exc
-        except Exception as exc2:
-            # case the FITS has enough info from header to pass detection, but cannot be fully opened
-            raise LightkurveError(
-                f"Unexpected error in reading data product: '{type(exc2).__name__}: {exc2}'\n"
-                f"{path_or_url}\n"
-                "This file may be corrupt due to an interrupted download. "
-                "Please remove it from your disk and try again."
-            ) from exc2
+        return _read_tpf(path_or_url, filetype, None, **kwargs)
     else:
         # if these keywords don't exist, raise `ValueError`
         raise LightkurveError(
@@ -173,22 +163,139 @@ def read(path_or_url, **kwargs):
             "Please remove it from your disk and try again."
         )
 
-def _read_collection(path_list, product, *, stitch=False, **kwargs):
-    """Read multiple product files into a collection"""
-    prod_list = []
-    for path in path_list:
+
+# File types which are read by instantiating the class of the same name
+_TPF_FILETYPES = ("KeplerTargetPixelFile", "TessTargetPixelFile")
+# Keyword arguments understood by the TargetPixelFile constructors; anything
+# else is passed on to `fits.open` and requires the file to be re-opened.
+_TPF_KWARGS = {"quality_bitmask", "targetid"}
+
+
+def _read_lightcurve(source, filetype, **kwargs):
+    """Reads a light curve product of a detected type; returns None for other types."""
+    if filetype == "KeplerLightCurve":
+        return KeplerLightCurve.read(source, format="kepler", **kwargs)
+    elif filetype == "TessLightCurve":
+        return TessLightCurve.read(source, format="tess", **kwargs)
+    elif filetype == "QLP":
+        return TessLightCurve.read(source, format="qlp", **kwargs)
+    elif filetype == "ELEANOR":
+        return TessLightCurve.read(source, format="eleanor", **kwargs)
+    elif filetype == "PATHOS":
+        return TessLightCurve.read(source, format="pathos", **kwargs)
+    elif filetype == "CDIPS":
+        return TessLightCurve.read(source, format="cdips", **kwargs)
+    elif filetype == "TASOC":
+        return TessLightCurve.read(source, format="tasoc", **kwargs)
+    elif filetype == "K2SFF":
+        return KeplerLightCurve.read(source, format="k2sff", **kwargs)
+    elif filetype == "EVEREST":
+        return KeplerLightCurve.read(source, format="everest", **kwargs)
+    elif filetype == "KEPSEISMIC":
+        return KeplerLightCurve.read(source, format="kepseismic", **kwargs)
+    elif filetype == "TGLC":
+        return TessLightCurve.read(source, format="tglc", **kwargs)
+    elif filetype == "Folded":
+        return read_folded_lightcurve(source, **kwargs)
+    elif filetype == "generic":
+        return read_generic_lightcurve(source, **kwargs)
+    return None
+
+
+def _read_tpf(path_or_url, filetype, hdulist, **kwargs):
+    """Instantiates the class named ``filetype``, reusing ``hdulist`` if possible."""
+    source = path_or_url
+    if hdulist is not None:
+        if set(kwargs) <= _TPF_KWARGS:
+            # The TargetPixelFile takes ownership of the open HDUList
+            source = hdulist
+        else:
+            hdulist.close()
+    try:
+        tpf = getattr(__import__("lightkurve"), filetype)(source, **kwargs)
+    except AttributeError as exc:
+        raise LightkurveError(
+            f"Data product f{path_or_url} of type {filetype} is not supported "
+            "in this version of Lightkurve."
+        ) from exc
+    except Exception as exc2:
+        if source is hdulist:
+            hdulist.close()
+        # case the FITS has enough info from header to pass detection, but cannot be fully opened
+        raise LightkurveError(
+            f"Unexpected error in reading data product: '{type(exc2).__name__}: {exc2}'\n"
+            f"{path_or_url}\n"
+            "This file may be corrupt due to an interrupted download. "
+            "Please remove it from your disk and try again."
+        ) from exc2
+    tpf.path = path_or_url
+    return tpf
+
+def _read_collection_item(path, product, stitch, record_warnings, kwargs):
+    """Reads one file of a collection.
+
+    Returns the product (or None), the message to log, and the warnings
+    emitted if ``record_warnings`` is set, so that the caller can report them
+    in the same way for files read in worker processes.
+    """
+    context = warnings.catch_warnings(record=True) if record_warnings else contextlib.nullcontext()
+    with context as caught:
+        if record_warnings:
+            warnings.simplefilter("always")
+        prod, message = None, None
         try:
             new_prod = read(path, **kwargs)
 
             if isinstance(new_prod, product):
-                prod_list.append(new_prod)
+                # Normalize in the worker, ahead of stitching
+                prod = new_prod.normalize() if stitch else new_prod
             else:
-                log.debug(f'Unable to read {path}: The file is not a TESS or Kepler {product.__name__}.')
+                message = (
+                    logging.DEBUG,
+                    f'Unable to read {path}: The file is not a TESS or Kepler {product.__name__}.',
+                )
 
         except Exception as e:
-            log.warning(
-                f'Unable to read {path}: {e}. This file will not be added to the collection.'
+            message = (
+                logging.WARNING,
+                f'Unable to read {path}: {e}. This file will not be added to the collection.',
             )
+    return prod, message, caught or []
+
+
+def _read_collection(path_list, product, *, stitch=False, n_workers=1, use_threads=False, **kwargs):
+    """Read multiple product files into a collection"""
+    if n_workers < 1:
+        raise ValueError("`n_workers` must be at least 1.")
+    path_list = list(path_list)
+    read_item = functools.partial(
+        _read_collection_item,
+        product=product,
+        stitch=stitch,
+        record_warnings=n_workers > 1 and not use_threads,
+        kwargs=kwargs,
+    )
+
+    with warnings.catch_warnings():
+        if stitch:
+            # ignore "already normalized" message
+            warnings.filterwarnings("ignore", message=".*already.*")
+        if n_workers > 1 and len(path_list) > 1:
+            pool = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+            with pool(max_workers=min(n_workers, len(path_list))) as executor:
+                # `map` returns the results in the order of `path_list`
+                results = list(executor.map(read_item, path_list))
+        else:
+            results = [read_item(path) for path in path_list]
+
+        prod_list = []
+        for prod, message, caught in results:
+            for w in caught:
+                warnings.warn_explicit(w.message, w.category, w.filename, w.lineno)
+            if message is not None:
+                log.log(*message)
+            if prod is not None:
+                prod_list.append(prod)
 
     if not prod_list:
         log.warning(
@@ -197,11 +304,11 @@ def _read_collection(path_list, product, *, stitch=False, **kwargs):
     
     if product is LightCurve:
         # stitch into single LightCurve if indicated
-        return LightCurveCollection(prod_list).stitch() if stitch else LightCurveCollection(prod_list)
+        return _stitch_lightcurves(prod_list) if stitch else LightCurveCollection(prod_list)
     else:
         return TargetPixelFileCollection(prod_list)
     
-def read_lc_collection(path_list, *, stitch=False, **kwargs):
+def read_lc_collection(path_list, *, stitch=False, n_workers=1, use_threads=False, **kwargs):
     """Reads a list of valid Kepler or TESS light curve(s) and returns an instance of
     `~lightkurve.collections.LightCurveCollection`.
 
@@ -215,7 +322,14 @@ def read_lc_collection(path_list, *, stitch=False, **kwargs):
         List of paths to light curve FITS files. Can be a filepath, URL, or S3 URI.
     stitch : bool, optional
         Whether to stitch the `~lightkurve.collections.LightCurveCollection` into a single
-        `~lightkurve.lightcurve.LightCurve`.
+        `~lightkurve.lightcurve.LightCurve`. The light curves are normalized as they are
+        read, as in `~lightkurve.collections.LightCurveCollection.stitch`.
+    n_workers : int, optional
+        Number of files to read in parallel. By default, the files are read one at a time.
+    use_threads : bool, optional
+        If `True`, the files are read in a thread pool rather than a process pool.
+        Threads avoid copying the data between processes but only help when
+        the time is spent waiting for the files.
     **kwargs : dict
         Dictionary of arguments to be passed to underlying data product type specific reader.
 
@@ -225,9 +339,11 @@ def read_lc_collection(path_list, *, stitch=False, **kwargs):
                  from ``path_list`` or a single stitched `~lightkurve.lightcurve.LightCurve` if
                  parameter ``stitch=True``.
     """
-    return _read_collection(path_list, LightCurve, stitch=stitch, **kwargs)
+    return _read_collection(
+        path_list, LightCurve, stitch=stitch, n_workers=n_workers, use_threads=use_threads, **kwargs
+    )
 
-def read_tpf_collection(path_list, **kwargs):
+def read_tpf_collection(path_list, *, n_workers=1, use_threads=False, **kwargs):
     """Reads a list of valid Kepler or TESS target pixel files (TPFs) and returns an instance of
     `~lightkurve.collections.TargetPixelFileCollection`.
 
@@ -239,6 +355,11 @@ def read_tpf_collection(path_list, **kwargs):
     ----------
     path_list : list
         List of paths to TPF FITS files. Can be a filepath, URL, or S3 URI.
+    n_workers : int, optional
+        Number of files to read in parallel. By default, the files are read one at a time.
+    use_threads : bool, optional
+        If `True`, the files are read in a thread pool rather than a process pool.
+        Target pixel files read in worker processes are loaded into memory.
     **kwargs : dict
         Dictionary of arguments to be passed to underlying data product type specific reader.
 
@@ -247,4 +368,6 @@ def read_tpf_collection(path_list, **kwargs):
     collection : a `~lightkurve.collections.TargetPixelFileCollection` containing all valid TPFs
                  from ``path_list``.
     """
-    return _read_collection(path_list, TargetPixelFile, stitch=False, **kwargs)
+    return _read_collection(
+        path_list, TargetPixelFile, stitch=False, n_workers=n_workers, use_threads=use_threads, **kwargs
+    )
@@ -1,4 +1,6 @@
 """Reader for official TESS light curve FITS files produced by the Ames SPOC pipeline."""
+from astropy.io import fits
+
 from ..lightcurve import TessLightCurve
 from ..utils import TessQualityFlags
 
@@ -47,7 +49,8 @@ def read_tess_lightcurve(
     )
     lc = lc[quality_mask]
 
-    if 'tess-spoc' in filename:
+    fname = filename.filename() if isinstance(filename, fits.HDUList) else filename
+    if 'tess-spoc' in str(fname):
         lc.meta["AUTHOR"] = "TESS-SPOC"
     else:
         lc.meta["AUTHOR"] = "SPOC"
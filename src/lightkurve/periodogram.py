@@ -6,6 +6,7 @@ import logging
 import math
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from matplotlib import pyplot as plt
@@ -17,7 +18,7 @@ from astropy.units import cds
 from astropy.convolution import convolve, Box1DKernel
 from astropy.time import Time
 
-from astropy.timeseries import BoxLeastSquares, LombScargle
+from astropy.timeseries import BoxLeastSquares, BoxLeastSquaresResults, LombScargle
 from astropy.timeseries.periodograms.lombscargle import implementations  # for .main._is_regular
 
 
@@ -27,7 +28,535 @@ from .lightcurve import LightCurve
 
 log = logging.getLogger(__name__)
 
-__all__ = ["Periodogram", "LombScarglePeriodogram", "BoxLeastSquaresPeriodogram"]
+__all__ = [
+    "Periodogram",
+    "LombScarglePeriodogram",
+    "LombScarglePeriodogramBatch",
+    "BoxLeastSquaresPeriodogram",
+]
+
+
+def _logmedian_windows(frequency, filter_width):
+    """Returns the windows used by `_logmedian_smooth` on the ``frequency`` grid.
+
+    The windows are centered on log10(frequency[0]) + k * filter_width / 2,
+    up to log10(frequency[-1]), and contain the frequencies within
+    ``filter_width`` of their center.  They only depend on the frequency
+    grid, so they can be computed once and reused for many power spectra.
+
+    Returns
+    -------
+    order : array or None
+        The permutation which sorts ``frequency``, or None if it is sorted.
+    lo, hi : arrays
+        The bounds of the windows, as slices of the sorted frequencies.
+    """
+    log_frequency = np.log10(frequency)
+    x_start, x_stop = log_frequency[0], log_frequency[-1]
+    order = None
+    if np.any(log_frequency[1:] < log_frequency[:-1]):
+        order = np.argsort(log_frequency, kind="stable")
+        log_frequency = log_frequency[order]
+
+    def in_window(i, x0):
+        return np.abs(log_frequency[i] - x0) < filter_width
+
+    n = len(log_frequency)
+    windows = []
+    x0 = x_start
+    while x0 < x_stop:
+        # Locate the window by bisection, then correct the edges so that
+        # rounding matches the `abs(log_frequency - x0) < filter_width` test
+        lo = np.searchsorted(log_frequency, x0 - filter_width, side="right")
+        hi = np.searchsorted(log_frequency, x0 + filter_width, side="left")
+        while lo > 0 and in_window(lo - 1, x0):
+            lo -= 1
+        while lo < hi and not in_window(lo, x0):
+            lo += 1
+        while hi < n and in_window(hi, x0):
+            hi += 1
+        while hi > lo and not in_window(hi - 1, x0):
+            hi -= 1
+        if hi > lo:
+            windows.append((lo, hi))
+        x0 += 0.5 * filter_width
+    lo, hi = np.array(windows, dtype=int).reshape(-1, 2).T
+    return order, lo, hi
+
+
+def _logmedian_smooth(frequency, power, filter_width, windows=None):
+    """Returns the moving median of ``power`` in log10(frequency) space.
+
+    Each value of the result is the mean of the medians of the windows
+    returned by `_logmedian_windows` which contain it.  Because each window
+    is a contiguous slice of the sorted arrays, this avoids masking the full
+    arrays for every window, while yielding the same result.  The
+    ``windows`` may be passed to smooth many spectra on the same grid.
+    """
+    if windows is None:
+        windows = _logmedian_windows(frequency, filter_width)
+    order, lo, hi = windows
+    if order is not None:
+        power = power[order]
+
+    count = np.zeros(len(power), dtype=int)
+    bkg = np.zeros(len(power))
+    corr_factor = (8.0 / 9.0) ** 3
+    for start, stop in zip(lo, hi):
+        bkg[start:stop] += np.nanmedian(power[start:stop]) / corr_factor
+        count[start:stop] += 1
+    bkg /= count
+    if order is not None:
+        unsorted_bkg = np.empty_like(bkg)
+        unsorted_bkg[order] = bkg
+        bkg = unsorted_bkg
+    return bkg
+
+
+def _remove_nans(lc):
+    """Returns ``lc`` without the cadences where the flux is NaN."""
+    if np.isnan(lc.flux).any() or (hasattr(lc.flux, 'unmasked') and np.isnan(lc.flux.unmasked).any()):
+        lc = lc.remove_nans()
+        log.debug(
+            "Lightcurve contains NaN values."
+            "These are removed before creating the periodogram."
+        )
+    return lc
+
+
+def _lombscargle_sampling(lc, oversample_factor, freq_unit):
+    """Returns the approximate Nyquist frequency and the frequency spacing of ``lc``."""
+    time = lc.time
+    # Approximate Nyquist Frequency and frequency bin width in terms of days
+    nyquist = 0.5 * (1.0 / (np.median(np.diff(time.value)))) * (1 / cds.d)
+    fs = (1.0 / (time[-1] - time[0])) / oversample_factor
+
+    # Convert these values to requested frequency unit
+    return nyquist.to(freq_unit), fs.to(freq_unit)
+
+
+def _lombscargle_frequency_grid(
+    lc,
+    minimum_frequency,
+    maximum_frequency,
+    minimum_period,
+    maximum_period,
+    frequency,
+    period,
+    nyquist_factor,
+    oversample_factor,
+    freq_unit,
+    kwargs,
+):
+    """Returns the frequency grid and default view of a Lomb-Scargle periodogram.
+
+    See `LombScarglePeriodogram.from_lightcurve` for the meaning of the
+    parameters.  Deprecated keywords are popped from ``kwargs``.
+    """
+    if "min_period" in kwargs:
+        warnings.warn(
+            "`min_period` keyword is deprecated, "
+            "please use `minimum_period` instead.",
+            LightkurveWarning,
+        )
+        minimum_period = kwargs.pop("min_period", None)
+    if "max_period" in kwargs:
+        warnings.warn(
+            "`max_period` keyword is deprecated, "
+            "please use `maximum_period` instead.",
+            LightkurveWarning,
+        )
+        maximum_period = kwargs.pop("max_period", None)
+    if "min_frequency" in kwargs:
+        warnings.warn(
+            "`min_frequency` keyword is deprecated, "
+            "please use `minimum_frequency` instead.",
+            LightkurveWarning,
+        )
+        minimum_frequency = kwargs.pop("min_frequency", None)
+    if "max_frequency" in kwargs:
+        warnings.warn(
+            "`max_frequency` keyword is deprecated, "
+            "please use `maximum_frequency` instead.",
+            LightkurveWarning,
+        )
+        maximum_frequency = kwargs.pop("max_frequency", None)
+
+    # Check if any values of period have been passed and set format accordingly
+    if not all(b is None for b in [period, minimum_period, maximum_period]):
+        default_view = "period"
+    else:
+        default_view = "frequency"
+
+    # If period and frequency keywords have both been set, throw an error
+    if (not all(b is None for b in [period, minimum_period, maximum_period])) & (
+        not all(
+            b is None for b in [frequency, minimum_frequency, maximum_frequency]
+        )
+    ):
+        raise ValueError(
+            "You have input keyword arguments for both frequency and period. "
+            "Please only use one."
+        )
+
+    nyquist, fs = _lombscargle_sampling(lc, oversample_factor, freq_unit)
+
+    # Warn if there is confusing input
+    if (frequency is not None) & (
+        any([a is not None for a in [minimum_frequency, maximum_frequency]])
+    ):
+        log.warning(
+            "You have passed both a grid of frequencies "
+            "and min_frequency/maximum_frequency arguments; "
+            "the latter will be ignored."
+        )
+    if (period is not None) & (
+        any([a is not None for a in [minimum_period, maximum_period]])
+    ):
+        log.warning(
+            "You have passed a grid of periods "
+            "and minimum_period/maximum_period arguments; "
+            "the latter will be ignored."
+        )
+
+    # Tidy up the period stuff...
+    if maximum_period is not None:
+        # minimum_frequency MUST be none by this point.
+        minimum_frequency = 1.0 / maximum_period
+    if minimum_period is not None:
+        # maximum_frequency MUST be none by this point.
+        maximum_frequency = 1.0 / minimum_period
+    # If the user specified a period, copy it into the frequency.
+    if period is not None:
+        frequency = 1.0 / period
+
+    # Do unit conversions if user input min/max frequency or period
+    if frequency is None:
+        if minimum_frequency is not None:
+            minimum_frequency = u.Quantity(minimum_frequency, freq_unit)
+        if maximum_frequency is not None:
+            maximum_frequency = u.Quantity(maximum_frequency, freq_unit)
+        if (minimum_frequency is not None) & (maximum_frequency is not None):
+            if minimum_frequency > maximum_frequency:
+                if default_view == "frequency":
+                    raise ValueError(
+                        "minimum_frequency cannot be larger than maximum_frequency"
+                    )
+                if default_view == "period":
+                    raise ValueError(
+                        "minimum_period cannot be larger than maximum_period"
+                    )
+        # If nothing has been passed in, set them to the defaults
+        if minimum_frequency is None:
+            minimum_frequency = fs
+        if maximum_frequency is None:
+            maximum_frequency = nyquist * nyquist_factor
+
+        # Create frequency grid evenly spaced in frequency
+        frequency = np.arange(
+            minimum_frequency.value, maximum_frequency.value, fs.value
+        )
+
+    # Convert to desired units
+    return u.Quantity(frequency, freq_unit), default_view
+
+
+def _validate_ls_method(frequency, ls_method, nterms):
+    """Returns the Lomb-Scargle method and number of terms usable for ``frequency``."""
+    # Fall back to astropy's methods if nifty-ls is not installed
+    if ls_method[:9] == 'fastnifty': # nifty-ls
+        try:
+            import nifty_ls
+        except ImportError:
+            oldmethod = ls_method
+            ls_method = {"fastnifty": "fast", "fastnifty_chi2": "fastchi2"}[ls_method]
+            log.warning(
+                "nifty_ls is not available.\n"
+                "Method has been changed from '{}' to '{}'.".format(
+                    oldmethod, ls_method
+                )
+            )
+
+    # Change to compatible ls method if sampling not even in frequency
+    if not implementations.main._is_regular(frequency) and ls_method in [
+        "fastchi2",
+        "fast",
+        "fastnifty_chi2",
+        "fastnifty",
+    ]:
+        oldmethod = ls_method
+        ls_method = {"fastchi2": "chi2", "fast": "slow", "fastnifty_chi2": "chi2", "fastnifty": "slow"}[ls_method]
+        log.warning(
+            "The requested periodogram is not evenly sampled in frequency.\n"
+            "Method has been changed from '{}' to '{}' to allow for this.".format(
+                oldmethod, ls_method
+            )
+        )
+
+    if (nterms > 1) and (ls_method not in ["fastchi2", "chi2", "fastnifty_chi2"]):
+        warnings.warn(
+            "Building a Lomb Scargle Periodogram using the `slow` method. "
+            "`nterms` has been set to >1, however this is not supported under the `{}` method. "
+            "To run with higher nterms, set `ls_method` to either 'fastchi2', 'chi2', or 'fastnifty_chi2. "
+            "Please refer to the `astropy.timeseries.periodogram.LombScargle` documentation.".format(
+                ls_method
+            ),
+            LightkurveWarning,
+        )
+        nterms = 1
+    return ls_method, nterms
+
+
+def _lombscargle_object(time, flux, nterms, ls_method, kwargs):
+    """Returns the `LombScargle` object of a light curve."""
+    if ls_method[:9] == 'fastnifty':
+        # If using nifty_ls, flux must be float64
+        flux = flux.value.astype('float64')*flux.unit
+
+    if float(astropy.__version__[0]) >= 3:
+        return LombScargle(
+            time, flux, nterms=nterms, normalization="psd", **kwargs
+        )
+    return LombScargle(time, flux, nterms=nterms, **kwargs)
+
+
+def _lombscargle_power(time, flux, frequency, nterms, ls_method, kwargs):
+    """Returns the `LombScargle` object and its unnormalized ("psd") power."""
+    LS = _lombscargle_object(time, flux, nterms, ls_method, kwargs)
+    if float(astropy.__version__[0]) >= 3:
+        power = LS.power(frequency, method=ls_method)
+    else:
+        power = LS.power(frequency, method=ls_method, normalization="psd")
+    return LS, power
+
+
+def _normalize_lombscargle_power(power, n_time, oversample_factor, fs, normalization):
+    """Normalizes the "psd" power of `LombScargle` to ``normalization``."""
+    if normalization == "psd":  # Power spectral density
+        # Rescale from the unnormalized power output by Astropy's
+        # Lomb-Scargle function to units of flux_variance / [frequency unit]
+        # that may be of more interest for asteroseismology.
+        power = power * (2.0 / (n_time * oversample_factor * fs))
+    elif normalization == "amplitude":
+        power = np.sqrt(power) * np.sqrt(4.0 / n_time)
+    return power
+
+
+def _lombscargle_batch_power(args):
+    """Returns the unnormalized power of one light curve of a batch."""
+    time, flux, frequency, nterms, ls_method, kwargs = args
+    return _lombscargle_power(time, flux, frequency, nterms, ls_method, kwargs)[1]
+
+
+def _nifty_batch_power(time, fluxes, frequency, nterms):
+    """Returns the unnormalized powers of ``fluxes`` sharing the same ``time``.
+
+    This is the batched equivalent of `LombScargle.power` with the 'fastnifty'
+    methods: the times are taken relative to the first one, in days, and the
+    frequency grid is expressed in 1/day.
+    """
+    import nifty_ls
+
+    t = (time - time[0]).to_value(u.day)
+    f = frequency.to_value(1 / u.day)
+    return nifty_ls.lombscargle(
+        t,
+        fluxes.astype("float64"),
+        fmin=f[0],
+        fmax=f[0] + (f[1] - f[0]) * (len(f) - 1),
+        Nf=len(f),
+        normalization="psd",
+        nterms=nterms,
+    ).power
+
+
+def _bls_power_chunk(args):
+    """Runs `BoxLeastSquares.power` over a part of the period grid."""
+    data, period, duration, kwargs = args
+    return BoxLeastSquares(*data).power(period, duration, **kwargs)
+
+
+def _concatenate_bls_results(results):
+    """Concatenates `BoxLeastSquaresResults` computed over parts of a period grid."""
+    keys = list(results[0].keys())
+    return BoxLeastSquaresResults(
+        results[0]["objective"],
+        *[np.concatenate([r[key] for r in results]) for key in keys[1:]]
+    )
+
+
+def _take_bls_results(result, indices):
+    """Returns the `BoxLeastSquaresResults` at ``indices`` of the period grid."""
+    keys = list(result.keys())
+    return BoxLeastSquaresResults(
+        result["objective"], *[result[key][indices] for key in keys[1:]]
+    )
+
+
+def _bls_power(data, period, duration, n_workers, kwargs):
+    """Computes the BLS power over ``period``, split across ``n_workers`` processes.
+
+    The power at each period is computed independently, so the result is
+    the same as that of a single call to `BoxLeastSquares.power`.
+    """
+    if n_workers == 1 or len(period) < 2:
+        return _bls_power_chunk((data, period, duration, kwargs))
+    chunks = np.array_split(np.arange(len(period)), min(n_workers, len(period)))
+    args = [(data, period[chunk], duration, kwargs) for chunk in chunks]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        return _concatenate_bls_results(list(executor.map(_bls_power_chunk, args)))
+
+
+def _bls_coarse_to_fine(run, n_period, coarse_factor, top_k):
+    """Evaluates the BLS power on a coarse period grid, then around its top peaks.
+
+    ``run(indices)`` must return the `BoxLeastSquaresResults` at ``indices``
+    of the full period grid.  The results of both passes are returned in
+    the order of the period grid.
+    """
+    coarse = np.unique(np.r_[np.arange(0, n_period, coarse_factor), n_period - 1])
+    coarse_result = run(coarse)
+
+    # Find the highest local maxima of the coarse power
+    power = u.Quantity(coarse_result.power).value
+    padded = np.r_[-np.inf, power, -np.inf]
+    peaks = np.flatnonzero((power >= padded[:-2]) & (power > padded[2:]))
+    peaks = peaks[np.argsort(power[peaks])[::-1][:top_k]]
+
+    # Refine between the coarse neighbours of each peak
+    fine = [
+        np.arange(coarse[max(p - 1, 0)], coarse[min(p + 1, len(coarse) - 1)] + 1)
+        for p in peaks
+    ]
+    fine = np.setdiff1d(np.concatenate(fine), coarse) if fine else coarse[:0]
+    if len(fine) == 0:
+        return coarse_result
+    result = _concatenate_bls_results([coarse_result, run(fine)])
+    return _take_bls_results(result, np.argsort(np.r_[coarse, fine]))
+
+
+class _BoxLeastSquaresSearch(object):
+    """Validated settings of a BLS search, see `BoxLeastSquaresPeriodogram.from_lightcurve`.
+
+    The period grid is computed once, from the light curve ``lc`` (without
+    NaNs), so that the search can be repeated on a subset of its cadences.
+    The settings are popped from ``kwargs``; the remaining keywords are
+    passed to `BoxLeastSquares.power`.
+    """
+
+    def __init__(self, lc, dy, kwargs):
+        # Validate user input for `duration`
+        duration = kwargs.pop("duration", [0.05, 0.10, 0.15, 0.20, 0.25, 0.33])
+        if duration is not None and ~np.all(np.isfinite(duration)):
+            raise ValueError(
+                "`duration` parameter contains illegal nan or inf value(s)"
+            )
+
+        # Validate user input for `period`
+        period = kwargs.pop("period", None)
+        minimum_period = kwargs.pop("minimum_period", None)
+        maximum_period = kwargs.pop("maximum_period", None)
+        if period is not None and ~np.all(np.isfinite(period)):
+            raise ValueError("`period` parameter contains illegal nan or inf value(s)")
+        if minimum_period is None:
+            if period is None:
+                minimum_period = np.max(
+                    [
+                        np.median(np.diff(lc.time.value)) * 4,
+                        np.max(duration) + np.median(np.diff(lc.time.value)),
+                    ]
+                )
+            else:
+                minimum_period = np.min(period)
+        if maximum_period is None:
+            if period is None:
+                maximum_period = (np.max(lc.time.value) - np.min(lc.time.value)) / 3.0
+            else:
+                maximum_period = np.max(period)
+
+        # Validate user input for `time_unit`
+        time_unit = kwargs.pop("time_unit", "day")
+        if time_unit not in dir(u):
+            raise ValueError(
+                "{} is not a valid value for `time_unit`".format(time_unit)
+            )
+
+        # Validate user input for the search engine
+        n_workers = kwargs.pop("n_workers", 1)
+        if n_workers < 1:
+            raise ValueError("`n_workers` must be at least 1.")
+        strategy = validate_method(
+            kwargs.pop("strategy", "full"), ["full", "coarse-to-fine"]
+        )
+        coarse_factor = kwargs.pop("coarse_factor", 10)
+        top_k = kwargs.pop("top_k", 5)
+        if coarse_factor < 1 or top_k < 1:
+            raise ValueError("`coarse_factor` and `top_k` must be at least 1.")
+
+        # Validate user input for `frequency_factor`
+        frequency_factor = kwargs.pop("frequency_factor", 10)
+        df = (
+            frequency_factor
+            * np.min(duration)
+            / (np.max(lc.time.value) - np.min(lc.time.value)) ** 2
+        )
+        npoints = int(((1 / minimum_period) - (1 / maximum_period)) / df)
+        if npoints > 1e7:
+            raise ValueError(
+                "`period` contains {} points."
+                "Periodogram is too large to evaluate. "
+                "Consider setting `frequency_factor` to a higher value."
+                "".format(np.round(npoints, 4))
+            )
+        elif npoints > 1e5:
+            log.warning(
+                "`period` contains {} points."
+                "Periodogram is likely to be large, and slow to evaluate. "
+                "Consider setting `frequency_factor` to a higher value."
+                "".format(np.round(npoints, 4))
+            )
+
+        if period is None:
+            period = BoxLeastSquares(lc.time, lc.flux, dy).autoperiod(
+                duration,
+                minimum_period=minimum_period,
+                maximum_period=maximum_period,
+                frequency_factor=frequency_factor,
+            )
+        if not isinstance(period, u.Quantity):
+            period = np.asarray(period)
+
+        self.period = period
+        self.duration = duration
+        self.time_unit = time_unit
+        self.n_workers = n_workers
+        self.strategy = strategy
+        self.coarse_factor = coarse_factor
+        self.top_k = top_k
+        self.kwargs = kwargs
+
+    def power(self, data):
+        """Returns the `BoxLeastSquaresResults` of ``data = (time, flux, flux_err)``."""
+        period = self.period
+
+        def run(indices):
+            return _bls_power(
+                data, period[indices], self.duration, self.n_workers, self.kwargs
+            )
+
+        if self.strategy == "full":
+            result = run(np.arange(len(period)))
+        else:
+            result = _bls_coarse_to_fine(
+                run, len(period), self.coarse_factor, self.top_k
+            )
+        if not isinstance(result.period, u.quantity.Quantity):
+            result.period = u.Quantity(result.period, self.time_unit)
+        if not isinstance(result.power, u.quantity.Quantity):
+            result.power = result.power * u.dimensionless_unscaled
+        if not isinstance(result.duration, u.quantity.Quantity):
+            result.duration = u.Quantity(result.duration, self.time_unit)
+        return result
 
 
 class Periodogram(object):
@@ -268,17 +797,9 @@ class Periodogram(object):
                     "the 'logmedian' method requires a dimensionless "
                     "value for `filter_width` in log10(frequency) space."
                 )
-            count = np.zeros(len(self.frequency.value), dtype=int)
-            bkg = np.zeros_like(self.frequency.value)
-            x0 = np.log10(self.frequency[0].value)
-            corr_factor = (8.0 / 9.0) ** 3
-            while x0 < np.log10(self.frequency[-1].value):
-                m = np.abs(np.log10(self.frequency.value) - x0) < filter_width
-                if len(bkg[m] > 0):
-                    bkg[m] += np.nanmedian(self.power[m].value) / corr_factor
-                    count[m] += 1
-                x0 += 0.5 * filter_width
-            bkg /= count
+            bkg = _logmedian_smooth(
+                self.frequency.value, self.power.value, filter_width
+            )
             smooth_pg = self.copy()
             smooth_pg.power = u.Quantity(bkg, self.power.unit)
             return smooth_pg
@@ -782,12 +1303,7 @@ class LombScarglePeriodogram(Periodogram):
         """
         # Input validation
         normalization = validate_method(normalization, ["psd", "amplitude"])
-        if np.isnan(lc.flux).any() or (hasattr(lc.flux, 'unmasked') and np.isnan(lc.flux.unmasked).any()):
-            lc = lc.remove_nans()
-            log.debug(
-                "Lightcurve contains NaN values."
-                "These are removed before creating the periodogram."
-            )
+        lc = _remove_nans(lc)
 
         # Setting default frequency units
         if freq_unit is None:
@@ -797,195 +1313,181 @@ class LombScarglePeriodogram(Periodogram):
         if oversample_factor is None:
             oversample_factor = 5.0 if normalization == "amplitude" else 1.0
 
-        if "min_period" in kwargs:
-            warnings.warn(
-                "`min_period` keyword is deprecated, "
-                "please use `minimum_period` instead.",
-                LightkurveWarning,
-            )
-            minimum_period = kwargs.pop("min_period", None)
-        if "max_period" in kwargs:
-            warnings.warn(
-                "`max_period` keyword is deprecated, "
-                "please use `maximum_period` instead.",
-                LightkurveWarning,
-            )
-            maximum_period = kwargs.pop("max_period", None)
-        if "min_frequency" in kwargs:
-            warnings.warn(
-                "`min_frequency` keyword is deprecated, "
-                "please use `minimum_frequency` instead.",
-                LightkurveWarning,
-            )
-            minimum_frequency = kwargs.pop("min_frequency", None)
-        if "max_frequency" in kwargs:
-            warnings.warn(
-                "`max_frequency` keyword is deprecated, "
-                "please use `maximum_frequency` instead.",
-                LightkurveWarning,
-            )
-            maximum_frequency = kwargs.pop("max_frequency", None)
+        frequency, default_view = _lombscargle_frequency_grid(
+            lc,
+            minimum_frequency=minimum_frequency,
+            maximum_frequency=maximum_frequency,
+            minimum_period=minimum_period,
+            maximum_period=maximum_period,
+            frequency=frequency,
+            period=period,
+            nyquist_factor=nyquist_factor,
+            oversample_factor=oversample_factor,
+            freq_unit=freq_unit,
+            kwargs=kwargs,
+        )
+        nyquist, fs = _lombscargle_sampling(lc, oversample_factor, freq_unit)
+        ls_method, nterms = _validate_ls_method(frequency, ls_method, nterms)
 
-        # Check if any values of period have been passed and set format accordingly
-        if not all(b is None for b in [period, minimum_period, maximum_period]):
-            default_view = "period"
-        else:
-            default_view = "frequency"
+        LS, power = _lombscargle_power(
+            lc.time.copy(), lc.flux.copy(), frequency, nterms, ls_method, kwargs
+        )
+        power = _normalize_lombscargle_power(
+            power, len(lc.time), oversample_factor, fs, normalization
+        )
 
-        # If period and frequency keywords have both been set, throw an error
-        if (not all(b is None for b in [period, minimum_period, maximum_period])) & (
-            not all(
-                b is None for b in [frequency, minimum_frequency, maximum_frequency]
-            )
-        ):
-            raise ValueError(
-                "You have input keyword arguments for both frequency and period. "
-                "Please only use one."
-            )
+        # Periodogram needs properties
+        return LombScarglePeriodogram(
+            frequency=frequency,
+            power=power,
+            nyquist=nyquist,
+            targetid=lc.meta.get("TARGETID"),
+            label=lc.meta.get("LABEL"),
+            default_view=default_view,
+            ls_obj=LS,
+            nterms=nterms,
+            ls_method=ls_method,
+            meta=lc.meta,
+        )
 
-        time = lc.time.copy()
-        flux = lc.flux.copy()
+    @staticmethod
+    def from_lightcurves(
+        lcs,
+        minimum_frequency=None,
+        maximum_frequency=None,
+        minimum_period=None,
+        maximum_period=None,
+        frequency=None,
+        period=None,
+        nterms=1,
+        nyquist_factor=1,
+        oversample_factor=None,
+        freq_unit=None,
+        normalization="amplitude",
+        ls_method="fast",
+        n_workers=1,
+        **kwargs
+    ):
+        """Creates the Lomb-Scargle periodograms of many light curves on one frequency grid.
 
-        # Approximate Nyquist Frequency and frequency bin width in terms of days
-        nyquist = 0.5 * (1.0 / (np.median(np.diff(time.value)))) * (1 / cds.d)
-        fs = (1.0 / (time[-1] - time[0])) / oversample_factor
+        The frequency grid is built once, from the ``frequency`` or ``period``
+        grid if given, or else from the limits and the time sampling of the
+        first light curve as in `LombScarglePeriodogram.from_lightcurve`.
+        Row ``i`` of the result is then the same as
+        ``LombScarglePeriodogram.from_lightcurve(lcs[i], frequency=batch.frequency, ...)``.
 
-        # Convert these values to requested frequency unit
-        nyquist = nyquist.to(freq_unit)
-        fs = fs.to(freq_unit)
+        With ``ls_method='fastnifty'`` or ``'fastnifty_chi2'``, the light curves
+        which share the same time stamps (e.g. the targets of a TESS sector
+        observed at the same cadence) are transformed in a single batched
+        call to nifty-ls.  The other light curves are processed one at a time,
+        or in ``n_workers`` processes.
 
-        # Warn if there is confusing input
-        if (frequency is not None) & (
-            any([a is not None for a in [minimum_frequency, maximum_frequency]])
-        ):
-            log.warning(
-                "You have passed both a grid of frequencies "
-                "and min_frequency/maximum_frequency arguments; "
-                "the latter will be ignored."
-            )
-        if (period is not None) & (
-            any([a is not None for a in [minimum_period, maximum_period]])
-        ):
-            log.warning(
-                "You have passed a grid of periods "
-                "and minimum_period/maximum_period arguments; "
-                "the latter will be ignored."
-            )
+        Parameters
+        ----------
+        lcs : `~lightkurve.collections.LightCurveCollection` or list of `LightCurve`
+            The light curves from which to compute the periodograms.  Their
+            flux units must be convertible to the units of the first one.
+        n_workers : int
+            Default 1. Number of processes used to compute the periodograms
+            which are not batched through nifty-ls.
+        kwargs : dict
+            See `LombScarglePeriodogram.from_lightcurve` for the other parameters.
 
-        # Tidy up the period stuff...
-        if maximum_period is not None:
-            # minimum_frequency MUST be none by this point.
-            minimum_frequency = 1.0 / maximum_period
-        if minimum_period is not None:
-            # maximum_frequency MUST be none by this point.
-            maximum_frequency = 1.0 / minimum_period
-        # If the user specified a period, copy it into the frequency.
-        if period is not None:
-            frequency = 1.0 / period
-
-        # Do unit conversions if user input min/max frequency or period
-        if frequency is None:
-            if minimum_frequency is not None:
-                minimum_frequency = u.Quantity(minimum_frequency, freq_unit)
-            if maximum_frequency is not None:
-                maximum_frequency = u.Quantity(maximum_frequency, freq_unit)
-            if (minimum_frequency is not None) & (maximum_frequency is not None):
-                if minimum_frequency > maximum_frequency:
-                    if default_view == "frequency":
-                        raise ValueError(
-                            "minimum_frequency cannot be larger than maximum_frequency"
-                        )
-                    if default_view == "period":
-                        raise ValueError(
-                            "minimum_period cannot be larger than maximum_period"
-                        )
-            # If nothing has been passed in, set them to the defaults
-            if minimum_frequency is None:
-                minimum_frequency = fs
-            if maximum_frequency is None:
-                maximum_frequency = nyquist * nyquist_factor
-
-            # Create frequency grid evenly spaced in frequency
-            frequency = np.arange(
-                minimum_frequency.value, maximum_frequency.value, fs.value
-            )
+        Returns
+        -------
+        batch : `LombScarglePeriodogramBatch`
+            The periodograms, with one row of ``batch.power`` per light curve.
+        """
+        if n_workers < 1:
+            raise ValueError("`n_workers` must be at least 1.")
+        lcs = [_remove_nans(lc) for lc in lcs]
+        if len(lcs) == 0:
+            raise ValueError("`lcs` must contain at least one light curve.")
+        normalization = validate_method(normalization, ["psd", "amplitude"])
 
-        # Convert to desired units
-        frequency = u.Quantity(frequency, freq_unit)
+        if freq_unit is None:
+            freq_unit = 1 / u.day if normalization == "amplitude" else u.microhertz
+        if oversample_factor is None:
+            oversample_factor = 5.0 if normalization == "amplitude" else 1.0
 
-        # Slight tweaks to support nifty-ls implementation
-        if ls_method[:9] == 'fastnifty': # nifty-ls
-            try:
-                import nifty_ls
-                # If using nifty_ls, flux must be float64
-                flux = flux.value.astype('float64')*flux.unit
-            except ImportError:
-                oldmethod = ls_method
-                ls_method = {"fastnifty": "fast", "fastnifty_chi2": "fastchi2"}[ls_method]
-                log.warning(
-                    "nifty_ls is not available.\n"
-                    "Method has been changed from '{}' to '{}'.".format(
-                        oldmethod, ls_method
-                    )
-                )
+        frequency, default_view = _lombscargle_frequency_grid(
+            lcs[0],
+            minimum_frequency=minimum_frequency,
+            maximum_frequency=maximum_frequency,
+            minimum_period=minimum_period,
+            maximum_period=maximum_period,
+            frequency=frequency,
+            period=period,
+            nyquist_factor=nyquist_factor,
+            oversample_factor=oversample_factor,
+            freq_unit=freq_unit,
+            kwargs=kwargs,
+        )
+        ls_method, nterms = _validate_ls_method(frequency, ls_method, nterms)
 
-        # Change to compatible ls method if sampling not even in frequency
-        if not implementations.main._is_regular(frequency) and ls_method in [
-            "fastchi2",
-            "fast",
-            "fastnifty_chi2",
-            "fastnifty",
-        ]:
-            oldmethod = ls_method
-            ls_method = {"fastchi2": "chi2", "fast": "slow", "fastnifty_chi2": "chi2", "fastnifty": "slow"}[ls_method]
-            log.warning(
-                "The requested periodogram is not evenly sampled in frequency.\n"
-                "Method has been changed from '{}' to '{}' to allow for this.".format(
-                    oldmethod, ls_method
+        flux_unit = lcs[0].flux.unit
+        try:
+            fluxes = [lc.flux.to(flux_unit) for lc in lcs]
+        except u.UnitConversionError:
+            raise ValueError(
+                "the flux units of all light curves must be convertible to {}.".format(
+                    flux_unit
                 )
             )
 
-        if (nterms > 1) and (ls_method not in ["fastchi2", "chi2", "fastnifty_chi2"]):
-            warnings.warn(
-                "Building a Lomb Scargle Periodogram using the `slow` method. "
-                "`nterms` has been set to >1, however this is not supported under the `{}` method. "
-                "To run with higher nterms, set `ls_method` to either 'fastchi2', 'chi2', or 'fastnifty_chi2. "
-                "Please refer to the `astropy.timeseries.periodogram.LombScargle` documentation.".format(
-                    ls_method
-                ),
-                LightkurveWarning,
-            )
-            nterms = 1
-
-        if float(astropy.__version__[0]) >= 3:
-            LS = LombScargle(
-                time, flux, nterms=nterms, normalization="psd", **kwargs
-            )
-            power = LS.power(frequency, method=ls_method)
+        power = [None] * len(lcs)
+        if ls_method[:9] == "fastnifty" and not kwargs:
+            # Transform the light curves sharing the same time stamps at once
+            groups = {}
+            for idx, lc in enumerate(lcs):
+                key = (len(lc.time), lc.time.value.tobytes())
+                groups.setdefault(key, []).append(idx)
+            for indices in groups.values():
+                if len(indices) > 1:
+                    batch_power = _nifty_batch_power(
+                        lcs[indices[0]].time,
+                        np.array([fluxes[idx].value for idx in indices]),
+                        frequency,
+                        nterms,
+                    )
+                    for row, idx in zip(batch_power, indices):
+                        power[idx] = row * flux_unit**2
+
+        todo = [idx for idx in range(len(lcs)) if power[idx] is None]
+        args = [
+            (lcs[idx].time.copy(), fluxes[idx].copy(), frequency, nterms, ls_method, kwargs)
+            for idx in todo
+        ]
+        if n_workers > 1 and len(todo) > 1:
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(todo))) as executor:
+                results = list(executor.map(_lombscargle_batch_power, args))
         else:
-            LS = LombScargle(time, flux, nterms=nterms, **kwargs)
-            power = LS.power(frequency, method=ls_method, normalization="psd")
-
-        if normalization == "psd":  # Power spectral density
-            # Rescale from the unnormalized power output by Astropy's
-            # Lomb-Scargle function to units of flux_variance / [frequency unit]
-            # that may be of more interest for asteroseismology.
-            power *= 2.0 / (len(time) * oversample_factor * fs)
-        elif normalization == "amplitude":
-            power = np.sqrt(power) * np.sqrt(4.0 / len(lc.time))
+            results = [_lombscargle_batch_power(arg) for arg in args]
+        for idx, result in zip(todo, results):
+            power[idx] = result
+
+        nyquist, rows = [], []
+        for lc, lc_power in zip(lcs, power):
+            lc_nyquist, fs = _lombscargle_sampling(lc, oversample_factor, freq_unit)
+            nyquist.append(lc_nyquist)
+            rows.append(
+                _normalize_lombscargle_power(
+                    lc_power, len(lc.time), oversample_factor, fs, normalization
+                )
+            )
 
-        # Periodogram needs properties
-        return LombScarglePeriodogram(
+        return LombScarglePeriodogramBatch(
             frequency=frequency,
-            power=power,
-            nyquist=nyquist,
-            targetid=lc.meta.get("TARGETID"),
-            label=lc.meta.get("LABEL"),
+            power=u.Quantity(rows),
+            nyquist=u.Quantity(nyquist),
+            targetid=[lc.meta.get("TARGETID") for lc in lcs],
+            label=[lc.meta.get("LABEL") for lc in lcs],
+            meta=[lc.meta for lc in lcs],
             default_view=default_view,
-            ls_obj=LS,
             nterms=nterms,
             ls_method=ls_method,
-            meta=lc.meta,
+            lightcurves=lcs,
+            ls_kwargs=kwargs,
         )
 
     def model(self, time, frequency=None):
@@ -1018,6 +1520,139 @@ class LombScarglePeriodogram(Periodogram):
         return lc.normalize()
 
 
+class LombScarglePeriodogramBatch(object):
+    """Lomb-Scargle periodograms of many light curves on a common frequency grid.
+
+    The powers are stored in a single two-dimensional array with one row per
+    light curve.  Indexing the batch with an integer returns the
+    `LombScarglePeriodogram` of one light curve, created on demand as a view
+    of its row.  Indexing with a slice or an array returns a smaller batch.
+    The batch keeps references to the light curves, so that the `LombScargle`
+    object needed by `LombScarglePeriodogram.model` is only built for the
+    periodograms which are actually indexed.
+
+    Batches are created with `LombScarglePeriodogram.from_lightcurves`.
+
+    Attributes
+    ----------
+    frequency : `~astropy.units.Quantity`
+        The frequency grid shared by all periodograms.
+    power : `~astropy.units.Quantity`
+        Array of shape (n_lightcurves, n_frequencies) with the powers.
+    nyquist : `~astropy.units.Quantity`
+        The Nyquist frequency of each light curve.
+    targetid : list
+        Identifier of the target of each light curve.
+    label : list
+        Label of each light curve.
+    meta : list of dict
+        Metadata of each light curve.
+    lightcurves : list of `LightCurve`
+        The light curves, without NaNs, from which the periodograms were
+        computed.  If None, the periodograms have no `model`.
+    """
+
+    def __init__(
+        self,
+        frequency,
+        power,
+        nyquist,
+        targetid=None,
+        label=None,
+        meta=None,
+        default_view="frequency",
+        nterms=1,
+        ls_method="fast",
+        lightcurves=None,
+        ls_kwargs=None,
+    ):
+        if power.ndim != 2 or power.shape[1] != frequency.shape[0]:
+            raise ValueError(
+                "power must have a shape of (n_lightcurves, n_frequencies)."
+            )
+        n = power.shape[0]
+        self.frequency = frequency
+        self.power = power
+        self.nyquist = nyquist
+        self.targetid = list(targetid) if targetid is not None else [None] * n
+        self.label = list(label) if label is not None else [None] * n
+        self.meta = list(meta) if meta is not None else [{} for _ in range(n)]
+        self.default_view = default_view
+        self.nterms = nterms
+        self.ls_method = ls_method
+        self.lightcurves = list(lightcurves) if lightcurves is not None else None
+        self.ls_kwargs = ls_kwargs if ls_kwargs is not None else {}
+
+    def __len__(self):
+        return self.power.shape[0]
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            LS = None
+            if self.lightcurves is not None:
+                lc = self.lightcurves[key]
+                LS = _lombscargle_object(
+                    lc.time.copy(), lc.flux.copy(), self.nterms, self.ls_method, self.ls_kwargs
+                )
+            return LombScarglePeriodogram(
+                frequency=self.frequency,
+                power=self.power[key],
+                nyquist=self.nyquist[key],
+                targetid=self.targetid[key],
+                label=self.label[key],
+                default_view=self.default_view,
+                ls_obj=LS,
+                nterms=self.nterms,
+                ls_method=self.ls_method,
+                meta=self.meta[key],
+            )
+        indices = np.arange(len(self))[key]
+        return LombScarglePeriodogramBatch(
+            frequency=self.frequency,
+            power=self.power[indices],
+            nyquist=self.nyquist[indices],
+            targetid=[self.targetid[idx] for idx in indices],
+            label=[self.label[idx] for idx in indices],
+            meta=[self.meta[idx] for idx in indices],
+            default_view=self.default_view,
+            nterms=self.nterms,
+            ls_method=self.ls_method,
+            lightcurves=(
+                [self.lightcurves[idx] for idx in indices]
+                if self.lightcurves is not None
+                else None
+            ),
+            ls_kwargs=self.ls_kwargs,
+        )
+
+    def __repr__(self):
+        return "LombScarglePeriodogramBatch({} periodograms)".format(len(self))
+
+    @property
+    def period(self):
+        """The array of periods, i.e. 1/frequency."""
+        return 1.0 / self.frequency
+
+    @property
+    def max_power(self):
+        """Power of the highest peak in each periodogram."""
+        return np.nanmax(self.power, axis=1)
+
+    @property
+    def frequency_at_max_power(self):
+        """Frequency of the highest peak in each periodogram."""
+        return self.frequency[np.nanargmax(self.power.value, axis=1)]
+
+    @property
+    def period_at_max_power(self):
+        """Period of the highest peak in each periodogram."""
+        return 1.0 / self.frequency_at_max_power
+
+
 class BoxLeastSquaresPeriodogram(Periodogram):
     """Subclass of :class:`Periodogram <lightkurve.periodogram.Periodogram>`
     representing a power spectrum generated using the Box Least Squares (BLS) method.
@@ -1061,6 +1696,20 @@ class BoxLeastSquaresPeriodogram(Periodogram):
         frequency_factor : float, optional
             If ``period`` is not provided, a factor to control the frequency spacing of periods
             to be considered.
+        n_workers : int, optional
+            Number of processes across which the period grid is split. Default 1.
+        strategy : 'full' or 'coarse-to-fine', optional
+            If 'full' (default), the power is computed at every period.
+            If 'coarse-to-fine', the power is first computed at every
+            ``coarse_factor``-th period, then at every period around the
+            ``top_k`` highest peaks of this coarse pass.  The periodogram then
+            contains the periods of both passes only.
+        coarse_factor : int, optional
+            With ``strategy='coarse-to-fine'``, the subsampling of the period
+            grid in the coarse pass. Default 10.
+        top_k : int, optional
+            With ``strategy='coarse-to-fine'``, the number of coarse peaks
+            around which the full period grid is evaluated. Default 5.
         kwargs : dict
             Keyword arguments passed to
             `BoxLeastSquares.power() <astropy.timeseries.BoxLeastSquares.power>`
@@ -1098,81 +1747,12 @@ class BoxLeastSquaresPeriodogram(Periodogram):
         else:
             dy = None
 
-        # Validate user input for `duration`
-        duration = kwargs.pop("duration", [0.05, 0.10, 0.15, 0.20, 0.25, 0.33])
-        if duration is not None and ~np.all(np.isfinite(duration)):
-            raise ValueError(
-                "`duration` parameter contains illegal nan or inf value(s)"
-            )
-
-        # Validate user input for `period`
-        period = kwargs.pop("period", None)
-        minimum_period = kwargs.pop("minimum_period", None)
-        maximum_period = kwargs.pop("maximum_period", None)
-        if period is not None and ~np.all(np.isfinite(period)):
-            raise ValueError("`period` parameter contains illegal nan or inf value(s)")
-        if minimum_period is None:
-            if period is None:
-                minimum_period = np.max(
-                    [
-                        np.median(np.diff(lc.time.value)) * 4,
-                        np.max(duration) + np.median(np.diff(lc.time.value)),
-                    ]
-                )
-            else:
-                minimum_period = np.min(period)
-        if maximum_period is None:
-            if period is None:
-                maximum_period = (np.max(lc.time.value) - np.min(lc.time.value)) / 3.0
-            else:
-                maximum_period = np.max(period)
-
-        # Validate user input for `time_unit`
-        time_unit = kwargs.pop("time_unit", "day")
-        if time_unit not in dir(u):
-            raise ValueError(
-                "{} is not a valid value for `time_unit`".format(time_unit)
-            )
-
-        # Validate user input for `frequency_factor`
-        frequency_factor = kwargs.pop("frequency_factor", 10)
-        df = (
-            frequency_factor
-            * np.min(duration)
-            / (np.max(lc.time.value) - np.min(lc.time.value)) ** 2
+        search = _BoxLeastSquaresSearch(lc, dy, kwargs)
+        result = search.power(
+            (lc.time.copy(), lc.flux.copy(), None if dy is None else dy.copy())
         )
-        npoints = int(((1 / minimum_period) - (1 / maximum_period)) / df)
-        if npoints > 1e7:
-            raise ValueError(
-                "`period` contains {} points."
-                "Periodogram is too large to evaluate. "
-                "Consider setting `frequency_factor` to a higher value."
-                "".format(np.round(npoints, 4))
-            )
-        elif npoints > 1e5:
-            log.warning(
-                "`period` contains {} points."
-                "Periodogram is likely to be large, and slow to evaluate. "
-                "Consider setting `frequency_factor` to a higher value."
-                "".format(np.round(npoints, 4))
-            )
-
-        # Create BLS object and run the BLS search
         bls = BoxLeastSquares(lc.time, lc.flux, dy)
-        if period is None:
-            period = bls.autoperiod(
-                duration,
-                minimum_period=minimum_period,
-                maximum_period=maximum_period,
-                frequency_factor=frequency_factor,
-            )
-        result = bls.power(period, duration, **kwargs)
-        if not isinstance(result.period, u.quantity.Quantity):
-            result.period = u.Quantity(result.period, time_unit)
-        if not isinstance(result.power, u.quantity.Quantity):
-            result.power = result.power * u.dimensionless_unscaled
-        if not isinstance(result.duration, u.quantity.Quantity):
-            result.duration = u.Quantity(result.duration, time_unit)
+        time_unit = search.time_unit
 
         return BoxLeastSquaresPeriodogram(
             frequency=1.0 / result.period,
@@ -2,16 +2,23 @@
 from __future__ import division
 
 import glob
+import hashlib
+import inspect
+import json
 import logging
 import os
+import pickle
 import re
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import wraps
 
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import ascii
-from astropy.table import Row, Table, join
+from astropy.table import Row, Table, join, vstack
 from astropy.time import Time
 from astropy.utils import deprecated
 from memoization import cached
@@ -35,6 +42,9 @@ __all__ = [
     "search_lightcurve",
     "search_lightcurvefile",
     "search_tesscut",
+    "search_targetpixelfile_many",
+    "search_lightcurve_many",
+    "search_tesscut_many",
     "SearchResult",
 ]
 
@@ -57,8 +67,13 @@ AUTHOR_LINKS = {
     "KBONUS-BKG":"https://archive.stsci.edu/hlsp/kbonus-bkg",
 }
 
+# Delay in seconds before the first retry of a failed download in
+# `SearchResult.download_all()`; it doubles after each subsequent failure.
+DOWNLOAD_RETRY_DELAY = 1.0
+
 REPR_COLUMNS_BASE = [
     "#",
+    "target_index",
     "mission",
     "year",
     "author",
@@ -143,7 +158,11 @@ class SearchResult(object):
         # We need all three columns because:
         # - year + mission would fail for TESS sectors 99 and 100 (both in yr 2026, 100 would be ahead)
         # - year + sequence_number would fail for Kepler (which has no value for sequence_number)
-        self.table.sort(["distance", "sort_order", "author", "year", "sequence_number", "mission", "exptime"])
+        sort_keys = ["distance", "sort_order", "author", "year", "sequence_number", "mission", "exptime"]
+        # Keep the products of the different targets of a batch search together
+        if "target_index" in self.table.colnames:
+            sort_keys = ["target_index"] + sort_keys
+        self.table.sort(sort_keys)
 
 
     def _add_columns(self):
@@ -279,11 +298,44 @@ class SearchResult(object):
     def _download_one(
         self, table, quality_bitmask, download_dir, cutout_size, **kwargs
     ):
-        """Private method used by `download()` and `download_all()` to download
-        exactly one file from the MAST archive.
+        """Private method used by `download()` to download exactly one file
+        from the MAST archive.
 
         Always returns a `TargetPixelFile` or `LightCurve` object.
         """
+        path = self._fetch_one(table, download_dir, cutout_size)
+        return self._read_one(table, path, quality_bitmask, **kwargs)
+
+    def _read_one(self, table, path, quality_bitmask, **kwargs):
+        """Opens the file at ``path`` downloaded for the one-row ``table``."""
+        if "FFI Cutout" in table[0]["description"]:
+            return read(
+                path, quality_bitmask=quality_bitmask, targetid=table[0]["targetid"]
+            )
+        return read(path, quality_bitmask=quality_bitmask, **kwargs)
+
+    def _fetch_one(self, table, download_dir, cutout_size, max_retries=0):
+        """Downloads the file described by the one-row ``table``, unless it is
+        found in the local cache, and returns its local path.
+
+        Failed downloads are retried up to ``max_retries`` times, waiting
+        ``DOWNLOAD_RETRY_DELAY * 2**attempt`` seconds between attempts.
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return self._fetch_one_path(table, download_dir, cutout_size)
+            except (HTTPError, LightkurveError, OSError) as exc:
+                if attempt == max_retries:
+                    raise
+                delay = DOWNLOAD_RETRY_DELAY * 2**attempt
+                log.debug(
+                    "Download attempt {} failed ({}); retrying in {} s."
+                    "".format(attempt + 1, exc, delay)
+                )
+                time.sleep(delay)
+
+    def _fetch_one_path(self, table, download_dir, cutout_size):
+        """Helper method for `_fetch_one()`, performing a single attempt."""
         # Make sure astroquery uses the same level of verbosity
         logging.getLogger("astropy").setLevel(log.getEffectiveLevel())
 
@@ -297,7 +349,7 @@ class SearchResult(object):
                     "Started downloading TESSCut for '{}' sector {}."
                     "".format(table[0]["target_name"], table[0]["sequence_number"])
                 )
-                path = self._fetch_tesscut_path(
+                return self._fetch_tesscut_path(
                     table[0]["target_name"],
                     table[0]["sequence_number"],
                     download_dir,
@@ -320,10 +372,6 @@ class SearchResult(object):
                         "Error: {}".format(exc)
                     )
 
-            return read(
-                path, quality_bitmask=quality_bitmask, targetid=table[0]["targetid"]
-            )
-
         else:
             if cutout_size is not None:
                 warnings.warn(
@@ -363,7 +411,7 @@ class SearchResult(object):
                     )
                 path = download_response["Local Path"]
                 log.debug("Finished downloading.")
-            return read(path, quality_bitmask=quality_bitmask, **kwargs)
+            return path
 
     @suppress_stdout
     def download(
@@ -442,7 +490,14 @@ class SearchResult(object):
 
     @suppress_stdout
     def download_all(
-        self, quality_bitmask="default", download_dir=None, cutout_size=None, **kwargs
+        self,
+        quality_bitmask="default",
+        download_dir=None,
+        cutout_size=None,
+        n_workers=1,
+        max_retries=0,
+        manifest=None,
+        **kwargs,
     ):
         """Download and open all data products in the search result.
 
@@ -473,6 +528,17 @@ class SearchResult(object):
         cutout_size : int, float or tuple, optional
             Side length of cutout in pixels. Tuples should have dimensions (y, x).
             Default size is (5, 5)
+        n_workers : int, optional
+            Number of files to download concurrently.  Defaults to 1, i.e. the
+            files are downloaded one after another.
+        max_retries : int, optional
+            Number of times a failed download is retried, with an exponentially
+            increasing delay between attempts.  Defaults to 0.
+        manifest : str, optional
+            Path of a JSON file in which the local paths of the completed
+            downloads are recorded.  If the same manifest is passed again,
+            e.g. after an interrupted bulk download, the files listed in it are
+            opened directly and only the missing files are downloaded.
         flux_column : str, optional
             The column in the FITS file to be read as `flux`. Defaults to 'pdcsap_flux'.
             Typically 'pdcsap_flux' or 'sap_flux'.
@@ -500,17 +566,54 @@ class SearchResult(object):
             return None
         log.debug("{} files will be downloaded.".format(len(self.table)))
 
-        products = []
-        for idx in range(len(self.table)):
-            products.append(
-                self._download_one(
-                    table=self.table[idx : idx + 1],
-                    quality_bitmask=quality_bitmask,
-                    download_dir=download_dir,
-                    cutout_size=cutout_size,
-                    **kwargs,
+        tables = [self.table[idx : idx + 1] for idx in range(len(self.table))]
+        keys = [_manifest_key(table, cutout_size) for table in tables]
+        completed = _read_manifest(manifest) if manifest is not None else {}
+        paths = [completed.get(key) for key in keys]
+        paths = [path if path and os.path.exists(path) else None for path in paths]
+        missing = [idx for idx, path in enumerate(paths) if path is None]
+        if len(missing) < len(tables):
+            log.debug(
+                "{} files found in the download manifest.".format(
+                    len(tables) - len(missing)
                 )
             )
+
+        def fetch(idx):
+            return self._fetch_one(
+                tables[idx], download_dir, cutout_size, max_retries=max_retries
+            )
+
+        def record(idx, path):
+            paths[idx] = path
+            if manifest is not None:
+                completed[keys[idx]] = path
+                _write_manifest(manifest, completed)
+
+        if n_workers > 1 and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = {executor.submit(fetch, idx): idx for idx in missing}
+                try:
+                    for future in as_completed(futures):
+                        record(futures[future], future.result())
+                except BaseException:
+                    # do not start new downloads once one has failed, but
+                    # record those which were already running and complete
+                    for future in futures:
+                        future.cancel()
+                    for future, idx in futures.items():
+                        if paths[idx] is None and not future.cancelled():
+                            if future.exception() is None:
+                                record(idx, future.result())
+                    raise
+        else:
+            for idx in missing:
+                record(idx, fetch(idx))
+
+        products = [
+            self._read_one(table, path, quality_bitmask, **kwargs)
+            for table, path in zip(tables, paths)
+        ]
         if isinstance(products[0], TargetPixelFile):
             return TargetPixelFileCollection(products)
         else:
@@ -889,6 +992,261 @@ def search_tesscut(target, sector=None):
         return SearchResult(None)
 
 
+def search_lightcurve_many(
+    targets,
+    radius=None,
+    exptime=None,
+    cadence=None,
+    mission=("Kepler", "K2", "TESS"),
+    author=None,
+    quarter=None,
+    month=None,
+    campaign=None,
+    sector=None,
+    limit=None,
+    n_workers=4,
+    batch_size=100,
+):
+    """Search the `MAST data archive <https://archive.stsci.edu>`_ for the light
+    curves of many targets at once.
+
+    This is equivalent to calling `search_lightcurve()` for every target, but
+    requires far fewer queries: Kepler, K2, and TESS identifiers (e.g. "KIC 11904151"
+    or "TIC 261136679") are searched for in batches of ``batch_size`` targets,
+    and the data products of all observations are requested in batches as well.
+    Other targets, e.g. names or coordinates, require one query each.
+    Up to ``n_workers`` queries are sent to MAST concurrently.
+
+    Parameters
+    ----------
+    targets : list of str, int, or `astropy.coordinates.SkyCoord` objects
+        Targets around which to search; see `search_lightcurve()` for the
+        valid inputs.
+    radius, exptime, cadence, mission, author, quarter, month, campaign, sector
+        See `search_lightcurve()`.
+    limit : int
+        Maximum number of products to return for each target.
+    n_workers : int
+        Maximum number of concurrent queries. Defaults to 4.
+    batch_size : int
+        Number of targets or observations included in a single query.
+        Defaults to 100.
+
+    Returns
+    -------
+    result : :class:`SearchResult` object
+        Object detailing the data products found.  The ``target_index`` column
+        of ``result.table`` gives the index in ``targets`` of the target of each
+        product, and ``result.table.meta["failures"]`` maps the indices of the
+        targets for which the search failed to the error message.
+
+    Examples
+    --------
+    Search for the Kepler long cadence light curves of three targets at once::
+
+        >>> result = search_lightcurve_many(["KIC 11904151", "KIC 8462852", "Kepler-10"],
+        ...                                 author="Kepler", exptime=1800)  # doctest: +SKIP
+        >>> result[result.table["target_index"] == 1].download_all()  # doctest: +SKIP
+    """
+    return _search_products_many(
+        targets,
+        radius=radius,
+        filetype="Lightcurve",
+        exptime=exptime or cadence,
+        mission=mission,
+        provenance_name=author,
+        quarter=quarter,
+        month=month,
+        campaign=campaign,
+        sector=sector,
+        limit=limit,
+        n_workers=n_workers,
+        batch_size=batch_size,
+    )
+
+
+def search_targetpixelfile_many(
+    targets,
+    radius=None,
+    exptime=None,
+    cadence=None,
+    mission=("Kepler", "K2", "TESS"),
+    author=None,
+    quarter=None,
+    month=None,
+    campaign=None,
+    sector=None,
+    limit=None,
+    n_workers=4,
+    batch_size=100,
+):
+    """Search the `MAST data archive <https://archive.stsci.edu>`_ for the target
+    pixel files of many targets at once.
+
+    See `search_lightcurve_many()` for details on the parameters and the result.
+    """
+    return _search_products_many(
+        targets,
+        radius=radius,
+        filetype="Target Pixel",
+        exptime=exptime or cadence,
+        mission=mission,
+        provenance_name=author,
+        quarter=quarter,
+        month=month,
+        campaign=campaign,
+        sector=sector,
+        limit=limit,
+        n_workers=n_workers,
+        batch_size=batch_size,
+    )
+
+
+def search_tesscut_many(targets, sector=None, n_workers=4):
+    """Search the `MAST TESSCut service <https://mast.stsci.edu/tesscut/>`_ for
+    TESS Full Frame Image cutouts of many targets at once.
+
+    See `search_tesscut()` and `search_lightcurve_many()` for details on the
+    parameters and the result.
+    """
+    return _search_products_many(
+        targets, filetype="ffi", mission="TESS", sector=sector, n_workers=n_workers
+    )
+
+
+def _search_cache_dir(namespace):
+    """Returns the directory of the on-disk search cache for ``namespace``."""
+    return os.path.join(config.get_cache_dir(), "search_cache", namespace)
+
+
+def _search_cache_key(value):
+    """Returns a stable string representation of the arguments of a search,
+    used to derive the file name of a search cache entry."""
+    if isinstance(value, SkyCoord):
+        return "SkyCoord({!r}, {!r})".format(value.icrs.ra.deg, value.icrs.dec.deg)
+    if isinstance(value, u.Quantity):
+        return str(value)
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return "[{}]".format(", ".join(_search_cache_key(v) for v in value))
+    if isinstance(value, dict):
+        return "{{{}}}".format(
+            ", ".join(
+                "{!r}: {}".format(k, _search_cache_key(v))
+                for k, v in sorted(value.items())
+            )
+        )
+    return repr(value)
+
+
+def _search_cache_get(namespace, key):
+    """Returns the cached value stored under ``key``, or `None` if there is
+    no such entry or if it is older than ``conf.search_cache_ttl`` days.
+    In offline mode, entries never expire."""
+    path = os.path.join(_search_cache_dir(namespace), key + ".pickle")
+    try:
+        with open(path, "rb") as fp:
+            created, value = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        log.debug("Ignoring unreadable search cache entry {}.".format(path))
+        return None
+    if not conf.search_offline:
+        if time.time() - created > conf.search_cache_ttl * 86400:
+            return None
+    # mark the entry as recently used for the LRU eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return value
+
+
+def _search_cache_put(namespace, key, value):
+    """Stores ``value`` in the on-disk search cache, then removes the least
+    recently used entries if the cache exceeds ``conf.search_cache_max_size``."""
+    cache_dir = _search_cache_dir(namespace)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, key + ".pickle")
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "wb") as fp:
+            pickle.dump((time.time(), value), fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        log.debug("Unable to write to the search cache: {}".format(exc))
+        return
+    _search_cache_evict()
+
+
+def _search_cache_evict():
+    """Removes the least recently used search cache entries until the cache
+    is smaller than ``conf.search_cache_max_size`` megabytes."""
+    entries = []
+    root = os.path.join(config.get_cache_dir(), "search_cache")
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith(".pickle"):
+                try:
+                    stat = os.stat(os.path.join(dirpath, filename))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(dirpath, filename)))
+    total_size = sum(entry[1] for entry in entries)
+    max_size = conf.search_cache_max_size * 1e6
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total_size -= size
+
+
+def _search_cached(namespace):
+    """Decorator which caches the return value of a search function on disk.
+
+    The cache is enabled if ``conf.search_cache_ttl`` is positive or if
+    ``conf.search_offline`` is True.  In offline mode, a `SearchError` is raised
+    for searches which are not found in the cache.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (conf.search_offline or conf.search_cache_ttl > 0):
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = hashlib.sha1(
+                _search_cache_key(dict(bound.arguments)).encode()
+            ).hexdigest()
+            value = _search_cache_get(namespace, key)
+            if value is not None:
+                log.debug("Found {} in the search cache.".format(func.__name__))
+                return value
+            if conf.search_offline:
+                raise SearchError(
+                    "Offline mode is enabled (`lk.conf.search_offline`) and the "
+                    "search {} is not available in the local search cache."
+                    "".format(_search_cache_key(dict(bound.arguments)))
+                )
+            value = func(*args, **kwargs)
+            if value is not None:
+                _search_cache_put(namespace, key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@_search_cached("products")
 def _search_products(
     target,
     radius=None,
@@ -943,58 +1301,13 @@ def _search_products(
     -------
     SearchResult : :class:`SearchResult` object.
     """
-    if isinstance(target, int):
-        # see: https://archive.stsci.edu/search_fields.php?mission=kic10
-        if (0 < target) and (target < 13161030):
-            log.warning(
-                "Warning: {} may refer to a different Kepler or TESS target. "
-                "Please add the prefix 'KIC' or 'TIC' to disambiguate."
-                "".format(target)
-            )
-            target = str(target)
-        # see: https://archive.stsci.edu/k2/manuals/KSCI-19082-021.pdf
-        elif (target > 200000000) and (target < 252090718):
-            log.warning(
-                "Warning: {} may refer to a different K2 or TESS target. "
-                "Please add the prefix 'EPIC' or 'TIC' to disambiguate."
-                "".format(target)
-            )
-            target = str(target)
-        elif target < 0:
-            log.warning(
-                "Warning: {} input value does not correspond to valid values in 'TIC' 'KIC' or 'EPIC'. "
-                "Please check target name and try again."
-                "".format(target)
-            )
-            return None
-
-        # astroquery 0.4.11 update breaks if passing an integer, so convert to string
-        else:
-            target = f"TIC {target}"
-
+    target = _normalize_target(target)
+    if target is None:
+        return None
 
-    # Specifying quarter, campaign, or quarter should constrain the mission
-    if quarter is not None:
-        mission = "Kepler"
-    if campaign is not None:
-        mission = "K2"
-    if sector is not None:
-        mission = "TESS"
-    # Ensure mission is a list
-    mission = np.atleast_1d(mission).tolist()
-
-    # Avoid filtering on `provenance_name` if `author` equals "any" or "all"
-    if provenance_name in ("any", "all") or provenance_name is None:
-        provenance_name = None
-    else:
-        provenance_name = np.atleast_1d(provenance_name).tolist()
-
-    # Speed up by restricting the MAST query if we don't want FFI image data
-    extra_query_criteria = {}
-    if filetype in ["Lightcurve", "Target Pixel"]:
-        # At MAST, non-FFI Kepler pipeline products are known as "cube" products,
-        # and non-FFI TESS pipeline products are listed as "timeseries".
-        extra_query_criteria["dataproduct_type"] = ["cube", "timeseries"]
+    mission, provenance_name, extra_query_criteria = _search_criteria(
+        filetype, mission, provenance_name, quarter, campaign, sector
+    )
     # Make sure `search_tesscut` always performs a cone search (i.e. always
     # passed a radius value), because strict target name search does not apply.
     if filetype.lower() == "ffi" and radius is None:
@@ -1032,32 +1345,7 @@ def _search_products(
         )
         result.sort(["distance", "obs_id"])
 
-        # Add the user-friendly 'author' column (synonym for 'provenance_name')
-        result["author"] = result["provenance_name"]
-        # Add the user-friendly 'mission' column
-        result["mission"] = None
-        obs_prefix = {"Kepler": "Quarter", "K2": "Campaign", "TESS": "Sector"}
-        for idx in range(len(result)):
-            obs_project = result["project"][idx]
-            tmp_seqno = result["sequence_number"][idx]
-            obs_seqno = f"{tmp_seqno:02d}" if tmp_seqno else ""
-            # Kepler sequence_number values were not populated at the time of
-            # writing this code, so we parse them from the description field.
-            if obs_project == "Kepler" and result["sequence_number"].mask[idx]:
-                try:
-                    tmp_seqno = re.findall(r".*Q(\d+)", result["description"][idx])[0]
-                    obs_seqno = f"{int(tmp_seqno):02d}"
-                except IndexError:
-                    obs_seqno = ""
-            # K2 campaigns 9, 10, and 11 were split into two sections, which are
-            # listed separately in the table with suffixes "a" and "b"
-            if obs_project == "K2" and result["sequence_number"][idx] in [9, 10, 11]:
-                for half, letter in zip([1, 2], ["a", "b"]):
-                    if f"c{tmp_seqno}{half}" in result["productFilename"][idx]:
-                        obs_seqno = f"{int(tmp_seqno):02d}{letter}"
-            result["mission"][idx] = "{} {} {}".format(
-                obs_project, obs_prefix.get(obs_project, ""), obs_seqno
-            )
+        _add_author_and_mission_columns(result)
 
         masked_result = _filter_products(
             result,
@@ -1077,32 +1365,7 @@ def _search_products(
 
     # Full Frame Images
     else:
-        cutouts = []
-        for idx in np.where(["TESS FFI" in t for t in observations["target_name"]])[0]:
-            # if target passed in is a SkyCoord object, convert to RA, dec pair
-            if isinstance(target, SkyCoord):
-                target = "{}, {}".format(target.ra.deg, target.dec.deg)
-            # pull sector numbers
-            s = observations["sequence_number"][idx]
-            # if the desired sector is available, add a row
-            if s in np.atleast_1d(sector) or sector is None:
-                cutouts.append(
-                    {
-                        "description": f"TESS FFI Cutout (sector {s})",
-                        "mission": f"TESS Sector {s:02d}",
-                        "target_name": str(target),
-                        "targetid": str(target),
-                        "t_min": observations["t_min"][idx],
-                        "exptime": observations["exptime"][idx],
-                        "productFilename": "TESScut",
-                        "provenance_name": "TESScut",
-                        "author": "TESScut",
-                        "distance": 0.0,
-                        "sequence_number": s,
-                        "project": "TESS",
-                        "obs_collection": "TESS",
-                    }
-                )
+        cutouts = _tesscut_products(observations, target, sector)
         if len(cutouts) > 0:
             log.debug("Found {} matching cutouts.".format(len(cutouts)))
             masked_result = Table(cutouts)
@@ -1112,6 +1375,386 @@ def _search_products(
         return SearchResult(masked_result)
 
 
+def _tesscut_products(observations, target, sector=None):
+    """Returns the rows of the SearchResult table listing the TESS FFI cutouts
+    of ``target`` which are available in the ``observations`` table."""
+    cutouts = []
+    for idx in np.where(["TESS FFI" in t for t in observations["target_name"]])[0]:
+        # if target passed in is a SkyCoord object, convert to RA, dec pair
+        if isinstance(target, SkyCoord):
+            target = "{}, {}".format(target.ra.deg, target.dec.deg)
+        # pull sector numbers
+        s = observations["sequence_number"][idx]
+        # if the desired sector is available, add a row
+        if s in np.atleast_1d(sector) or sector is None:
+            cutouts.append(
+                {
+                    "description": f"TESS FFI Cutout (sector {s})",
+                    "mission": f"TESS Sector {s:02d}",
+                    "target_name": str(target),
+                    "targetid": str(target),
+                    "t_min": observations["t_min"][idx],
+                    "exptime": observations["exptime"][idx],
+                    "productFilename": "TESScut",
+                    "provenance_name": "TESScut",
+                    "author": "TESScut",
+                    "distance": 0.0,
+                    "sequence_number": s,
+                    "project": "TESS",
+                    "obs_collection": "TESS",
+                }
+            )
+    return cutouts
+
+
+def _search_products_many(
+    targets,
+    radius=None,
+    filetype="Lightcurve",
+    mission=("Kepler", "K2", "TESS"),
+    provenance_name=None,
+    exptime=(0, 9999),
+    quarter=None,
+    month=None,
+    campaign=None,
+    sector=None,
+    limit=None,
+    n_workers=4,
+    batch_size=100,
+):
+    """Helper function which returns a SearchResult object containing the MAST
+    products of many targets; see `search_lightcurve_many()`.
+
+    Kepler, K2, and TESS identifiers are searched by exact `target_name` in
+    batches of ``batch_size`` targets, all other targets by individual cone
+    searches.  The product lists of all observations are requested in batches,
+    and the products are filtered at once.  Up to ``n_workers`` queries are
+    sent to MAST concurrently.
+    """
+    from astroquery.exceptions import NoResultsWarning
+    from astroquery.mast import Observations
+
+    mission, provenance_name, extra_query_criteria = _search_criteria(
+        filetype, mission, provenance_name, quarter, campaign, sector
+    )
+    if filetype.lower() == "ffi" and radius is None:
+        radius = 0.0001 * u.arcsec
+    query_criteria = _mast_query_criteria(
+        mission, provenance_name, exptime, campaign or sector, **extra_query_criteria
+    )
+
+    failures = {}  # target index => error message
+    normalized_targets = {}
+    exact_names = {}  # target_name => indices of the targets known by that name
+    for idx, target in enumerate(targets):
+        target = _normalize_target(target)
+        if target is None:
+            failures[idx] = "Invalid target identifier."
+            continue
+        normalized_targets[idx] = target
+        name = _exact_target_name(target) if radius is None else None
+        if name:
+            exact_names.setdefault(name, []).append(idx)
+
+    def query_names(names):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=NoResultsWarning)
+            warnings.filterwarnings("ignore", message="t_exptime is continuous")
+            return Observations.query_criteria(target_name=names, **query_criteria)
+
+    def query_cone(target, radius):
+        return _query_mast(
+            target,
+            radius=radius,
+            project=mission,
+            provenance_name=provenance_name,
+            exptime=exptime,
+            sequence_number=campaign or sector,
+            **extra_query_criteria,
+        )
+
+    observations = []
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        names = list(exact_names)
+        name_futures = [
+            (executor.submit(query_names, names[i : i + batch_size]), names[i : i + batch_size])
+            for i in range(0, len(names), batch_size)
+        ]
+        named = {idx for indices in exact_names.values() for idx in indices}
+        cone_futures = [
+            (executor.submit(query_cone, target, radius), idx)
+            for idx, target in normalized_targets.items()
+            if idx not in named
+        ]
+        for future, batch in name_futures:
+            try:
+                obs = future.result()
+            except Exception as exc:
+                for name in batch:
+                    for idx in exact_names[name]:
+                        failures[idx] = str(exc)
+                continue
+            found = set()
+            if len(obs) > 0:
+                found = set(obs["target_name"])
+                rows, indices = [], []
+                for row, name in enumerate(obs["target_name"]):
+                    for idx in exact_names.get(name, []):
+                        rows.append(row)
+                        indices.append(idx)
+                obs = obs[rows]
+                # We use `exptime` as an alias for `t_exptime`
+                obs["exptime"] = obs["t_exptime"]
+                # astroquery does not report distance when querying by `target_name`
+                obs["distance"] = 0.0
+                obs["target_index"] = indices
+                observations.append(obs)
+            # Identifiers unknown to MAST by name are looked up with a cone search,
+            # as done by `_query_mast`
+            for name in batch:
+                if name not in found:
+                    for idx in exact_names[name]:
+                        cone_futures.append(
+                            (
+                                executor.submit(
+                                    query_cone, normalized_targets[idx], 0.0001 * u.arcsec
+                                ),
+                                idx,
+                            )
+                        )
+        for future, idx in cone_futures:
+            try:
+                obs = future.result()
+            except Exception as exc:
+                failures[idx] = str(exc)
+                continue
+            if len(obs) > 0:
+                obs["target_index"] = idx
+                observations.append(obs)
+
+        if len(observations) == 0:
+            masked_result = None
+        elif filetype.lower() == "ffi":
+            cutouts = []
+            for obs in observations:
+                idx = obs["target_index"][0]
+                try:
+                    rows = _tesscut_products(obs, normalized_targets[idx], sector)
+                except Exception as exc:
+                    failures[idx] = str(exc)
+                    continue
+                for row in rows:
+                    row["target_index"] = idx
+                    cutouts.append(row)
+            masked_result = Table(cutouts) if len(cutouts) > 0 else None
+        else:
+            observations = vstack(observations, metadata_conflicts="silent")
+            # Request the product lists of the unique observations in batches
+            unique_obs = observations[
+                np.unique(observations["obsid"], return_index=True)[1]
+            ]
+            product_futures = [
+                (
+                    executor.submit(
+                        Observations.get_product_list, unique_obs[i : i + batch_size]
+                    ),
+                    unique_obs[i : i + batch_size],
+                )
+                for i in range(0, len(unique_obs), batch_size)
+            ]
+            products = []
+            for future, batch in product_futures:
+                try:
+                    products.append(future.result())
+                except Exception as exc:
+                    # Fail the targets of the observations in this batch only
+                    in_batch = np.isin(observations["obsid"], batch["obsid"])
+                    for idx in np.unique(observations["target_index"][in_batch]):
+                        failures[int(idx)] = str(exc)
+            if len(products) > 0:
+                masked_result = _join_products_many(
+                    observations,
+                    vstack(products, metadata_conflicts="silent"),
+                    filetype=filetype,
+                    campaign=campaign,
+                    quarter=quarter,
+                    exptime=exptime,
+                    project=mission,
+                    provenance_name=provenance_name,
+                    month=month,
+                    sector=sector,
+                )
+            else:
+                masked_result = None
+
+    if masked_result is not None:
+        masked_result.sort(["target_index", "distance", "productFilename"])
+        if limit is not None:
+            # apply the limit to the products of each target
+            target_index = np.asarray(masked_result["target_index"])
+            first = np.searchsorted(target_index, target_index)
+            masked_result = masked_result[np.arange(len(target_index)) - first < limit]
+    if len(failures) > 0:
+        log.warning(
+            "Search failed for {} of {} targets; see the `failures` entry "
+            "of the search result table's `meta`.".format(len(failures), len(targets))
+        )
+    result = SearchResult(masked_result)
+    result.table.meta["failures"] = {idx: failures[idx] for idx in sorted(failures)}
+    return result
+
+
+def _join_products_many(observations, products, **filter_kwargs):
+    """Joins the observations of `_search_products_many` with their product
+    lists, and filters the products like `_search_products` does."""
+    result = join(
+        observations,
+        products,
+        keys="obs_id",
+        join_type="right",
+        uniq_col_name="{col_name}{table_name}",
+        table_names=["", "_products"],
+    )
+    _add_author_and_mission_columns(result)
+    masked_result = _filter_products(result, **filter_kwargs)
+    masked_result["distance"].info.format = ".1f"  # display <0.1 arcsec
+    return masked_result
+
+
+def _normalize_target(target):
+    """Converts an integer ``target`` into a target name string, warning about
+    ambiguous identifiers; returns `None` for invalid identifiers."""
+    if isinstance(target, int):
+        # see: https://archive.stsci.edu/search_fields.php?mission=kic10
+        if (0 < target) and (target < 13161030):
+            log.warning(
+                "Warning: {} may refer to a different Kepler or TESS target. "
+                "Please add the prefix 'KIC' or 'TIC' to disambiguate."
+                "".format(target)
+            )
+            target = str(target)
+        # see: https://archive.stsci.edu/k2/manuals/KSCI-19082-021.pdf
+        elif (target > 200000000) and (target < 252090718):
+            log.warning(
+                "Warning: {} may refer to a different K2 or TESS target. "
+                "Please add the prefix 'EPIC' or 'TIC' to disambiguate."
+                "".format(target)
+            )
+            target = str(target)
+        elif target < 0:
+            log.warning(
+                "Warning: {} input value does not correspond to valid values in 'TIC' 'KIC' or 'EPIC'. "
+                "Please check target name and try again."
+                "".format(target)
+            )
+            return None
+
+        # astroquery 0.4.11 update breaks if passing an integer, so convert to string
+        else:
+            target = f"TIC {target}"
+    return target
+
+
+def _search_criteria(filetype, mission, provenance_name, quarter, campaign, sector):
+    """Returns the ``mission``, ``provenance_name``, and extra query criteria
+    which `_search_products` passes to `_query_mast`."""
+    # Specifying quarter, campaign, or quarter should constrain the mission
+    if quarter is not None:
+        mission = "Kepler"
+    if campaign is not None:
+        mission = "K2"
+    if sector is not None:
+        mission = "TESS"
+    # Ensure mission is a list
+    mission = np.atleast_1d(mission).tolist()
+
+    # Avoid filtering on `provenance_name` if `author` equals "any" or "all"
+    if provenance_name in ("any", "all") or provenance_name is None:
+        provenance_name = None
+    else:
+        provenance_name = np.atleast_1d(provenance_name).tolist()
+
+    # Speed up by restricting the MAST query if we don't want FFI image data
+    extra_query_criteria = {}
+    if filetype in ["Lightcurve", "Target Pixel"]:
+        # At MAST, non-FFI Kepler pipeline products are known as "cube" products,
+        # and non-FFI TESS pipeline products are listed as "timeseries".
+        extra_query_criteria["dataproduct_type"] = ["cube", "timeseries"]
+    return mission, provenance_name, extra_query_criteria
+
+
+def _add_author_and_mission_columns(result):
+    """Adds the user-friendly 'author' and 'mission' columns to a table of
+    MAST data products."""
+    # Add the user-friendly 'author' column (synonym for 'provenance_name')
+    result["author"] = result["provenance_name"]
+    # Add the user-friendly 'mission' column
+    result["mission"] = None
+    obs_prefix = {"Kepler": "Quarter", "K2": "Campaign", "TESS": "Sector"}
+    for idx in range(len(result)):
+        obs_project = result["project"][idx]
+        tmp_seqno = result["sequence_number"][idx]
+        obs_seqno = f"{tmp_seqno:02d}" if tmp_seqno else ""
+        # Kepler sequence_number values were not populated at the time of
+        # writing this code, so we parse them from the description field.
+        if obs_project == "Kepler" and result["sequence_number"].mask[idx]:
+            try:
+                tmp_seqno = re.findall(r".*Q(\d+)", result["description"][idx])[0]
+                obs_seqno = f"{int(tmp_seqno):02d}"
+            except IndexError:
+                obs_seqno = ""
+        # K2 campaigns 9, 10, and 11 were split into two sections, which are
+        # listed separately in the table with suffixes "a" and "b"
+        if obs_project == "K2" and result["sequence_number"][idx] in [9, 10, 11]:
+            for half, letter in zip([1, 2], ["a", "b"]):
+                if f"c{tmp_seqno}{half}" in result["productFilename"][idx]:
+                    obs_seqno = f"{int(tmp_seqno):02d}{letter}"
+        result["mission"][idx] = "{} {} {}".format(
+            obs_project, obs_prefix.get(obs_project, ""), obs_seqno
+        )
+
+
+def _mast_query_criteria(
+    project, provenance_name, exptime, sequence_number, **extra_query_criteria
+):
+    """Returns the criteria passed to `Observations.query_criteria` by
+    `_query_mast`, regardless of whether we search by position or target name."""
+    query_criteria = {"project": project, **extra_query_criteria}
+    if provenance_name is not None:
+        query_criteria["provenance_name"] = provenance_name
+    if sequence_number is not None:
+        query_criteria["sequence_number"] = sequence_number
+    if exptime is not None:
+        query_criteria["t_exptime"] = exptime
+    return query_criteria
+
+
+def _exact_target_name(target):
+    """Returns the exact `target_name` under which MAST knows a Kepler, K2,
+    or TESS target identifier, or `None` if ``target`` is not such an identifier.
+    """
+    # If an exact KIC ID is passed, we will search by the exact `target_name`
+    # under which MAST will know the object to prevent source confusion.
+    # For discussion, see e.g. GitHub issues #148, #718.
+    if isinstance(target, SkyCoord):
+        return None
+    exact_target_name = None
+    target_lower = str(target).lower()
+    # Was a Kepler target ID passed?
+    kplr_match = re.match(r"^(kplr|kic) ?(\d+)$", target_lower)
+    if kplr_match:
+        exact_target_name = f"kplr{kplr_match.group(2).zfill(9)}"
+    # Was a K2 target ID passed?
+    ktwo_match = re.match(r"^(ktwo|epic) ?(\d+)$", target_lower)
+    if ktwo_match:
+        exact_target_name = f"ktwo{ktwo_match.group(2).zfill(9)}"
+    # Was a TESS target ID passed?
+    tess_match = re.match(r"^(tess|tic) ?(\d+)$", target_lower)
+    if tess_match:
+        exact_target_name = f"{tess_match.group(2)}"  # for TESS, the id is not zero-padded in MAST
+    return exact_target_name
+
+
 def _query_mast(
     target,
     radius=None,
@@ -1164,32 +1807,11 @@ def _query_mast(
 
     # We pass the following `query_criteria` to MAST regardless of whether
     # we search by position or target name:
-    query_criteria = {"project": project, **extra_query_criteria}
-    if provenance_name is not None:
-        query_criteria["provenance_name"] = provenance_name
-    if sequence_number is not None:
-        query_criteria["sequence_number"] = sequence_number
-    if exptime is not None:
-        query_criteria["t_exptime"] = exptime
-
-    # If an exact KIC ID is passed, we will search by the exact `target_name`
-    # under which MAST will know the object to prevent source confusion.
-    # For discussion, see e.g. GitHub issues #148, #718.
-    exact_target_name = None
-    target_lower = str(target).lower()
-    # Was a Kepler target ID passed?
-    kplr_match = re.match(r"^(kplr|kic) ?(\d+)$", target_lower)
-    if kplr_match:
-        exact_target_name = f"kplr{kplr_match.group(2).zfill(9)}"
-    # Was a K2 target ID passed?
-    ktwo_match = re.match(r"^(ktwo|epic) ?(\d+)$", target_lower)
-    if ktwo_match:
-        exact_target_name = f"ktwo{ktwo_match.group(2).zfill(9)}"
-    # Was a TESS target ID passed?
-    tess_match = re.match(r"^(tess|tic) ?(\d+)$", target_lower)
-    if tess_match:
-        exact_target_name = f"{tess_match.group(2)}"  # for TESS, the id is not zero-padded in MAST
+    query_criteria = _mast_query_criteria(
+        project, provenance_name, exptime, sequence_number, **extra_query_criteria
+    )
 
+    exact_target_name = _exact_target_name(target)
     if exact_target_name and radius is None:
         log.debug(
             "Started querying MAST for observations with the exact "
@@ -1224,10 +1846,15 @@ def _query_mast(
             "Started querying MAST for observations within "
             f"{radius.to(u.arcsec)} arcsec of objectname='{target}'."
         )
+        if conf.search_cache_ttl > 0:
+            # resolve the name ourselves, so that the coordinates are cached
+            query_criteria["coordinates"] = _resolve_object(target)
+        else:
+            query_criteria["objectname"] = target
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=NoResultsWarning)
             warnings.filterwarnings("ignore", message="t_exptime is continuous")
-            obs = Observations.query_criteria(objectname=target, **query_criteria)
+            obs = Observations.query_criteria(**query_criteria)
         obs.sort("distance")
         # We use `exptime` as an alias for `t_exptime`
         obs["exptime"] = obs["t_exptime"]
@@ -1400,6 +2027,37 @@ def _mask_by_exptime(products, exptime):
     return mask
 
 
+def _manifest_key(table, cutout_size=None):
+    """Returns the key identifying the one-row search result ``table`` in a
+    download manifest."""
+    if "FFI Cutout" in table[0]["description"]:
+        return "tesscut:{}:{}:{}".format(
+            table[0]["target_name"], table[0]["sequence_number"], cutout_size
+        )
+    return str(table[0]["dataURI"])
+
+
+def _read_manifest(path):
+    """Returns the ``{key: local path}`` entries of a download manifest."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as fp:
+            return json.load(fp)
+    except ValueError:
+        log.warning("Ignoring unreadable download manifest {}.".format(path))
+        return {}
+
+
+def _write_manifest(path, entries):
+    """Atomically writes the entries of a download manifest to ``path``."""
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "w") as fp:
+        json.dump(entries, fp, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+@_search_cached("coordinates")
 def _resolve_object(target):
     """Ask MAST to resolve an object string to a set of coordinates."""
     from astroquery.mast import MastClass
@@ -1,17 +1,28 @@
 """Defines the Seismology class."""
 import logging
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from matplotlib import pyplot as plt
 from scipy.signal import find_peaks
 
 from astropy import units as u
+from astropy.table import Table
 from astropy.units import cds
 
 from .. import MPLSTYLE
 from . import utils, stellar_estimators
-from ..periodogram import SNRPeriodogram
+from ..periodogram import (
+    SNRPeriodogram,
+    _logmedian_smooth,
+    _logmedian_windows,
+    _lombscargle_frequency_grid,
+    _lombscargle_power,
+    _lombscargle_sampling,
+    _normalize_lombscargle_power,
+    _validate_ls_method,
+)
 from ..utils import LightkurveWarning, validate_method
 from .utils import SeismologyQuantity
 
@@ -34,6 +45,98 @@ log = logging.getLogger(__name__)
 __all__ = ["Seismology"]
 
 
+def _prepare_lightcurve(lc):
+    """Prepares ``lc`` for seismology as done by `Seismology.from_lightcurve`."""
+    return lc.normalize().remove_nans().fill_gaps()
+
+
+class _SeismologyPipeline(object):
+    """Estimates the global seismic parameters of many stars on one frequency grid.
+
+    The frequency grid and the windows of the log-median background filter
+    are computed once and shared by all stars.  Calling the pipeline on a
+    star only returns scalar results, so that neither its periodogram nor
+    the diagnostics of the estimators are kept in memory.
+    """
+
+    columns = ["numax", "deltanu", "radius", "mass", "logg"]
+
+    def __init__(
+        self,
+        frequency,
+        oversample_factor,
+        ls_method,
+        filter_width,
+        numax_kwargs,
+        kwargs,
+    ):
+        self.frequency = frequency
+        self.oversample_factor = oversample_factor
+        self.ls_method = ls_method
+        self.filter_width = filter_width
+        self.numax_kwargs = numax_kwargs
+        self.kwargs = kwargs
+        self.windows = _logmedian_windows(frequency.value, filter_width)
+
+    def __call__(self, args):
+        from .numax_estimators import estimate_numax_acf2d
+        from .deltanu_estimators import estimate_deltanu_acf2d
+
+        lc, teff = args
+        row = {}
+        for name in self.columns:
+            row[name] = np.nan
+            row[name + "_err"] = np.nan
+        try:
+            lc = _prepare_lightcurve(lc)
+            nyquist, fs = _lombscargle_sampling(lc, self.oversample_factor, self.frequency.unit)
+            power = _lombscargle_power(
+                lc.time.copy(), lc.flux.copy(), self.frequency, 1, self.ls_method, self.kwargs
+            )[1]
+            power = _normalize_lombscargle_power(
+                power, len(lc.time), self.oversample_factor, fs, "psd"
+            ).value
+            bkg = _logmedian_smooth(
+                self.frequency.value, power, self.filter_width, windows=self.windows
+            )
+            periodogram = SNRPeriodogram(
+                self.frequency,
+                u.Quantity(power / bkg),
+                nyquist=nyquist,
+                label=lc.meta.get("LABEL"),
+            )
+            results = {"numax": estimate_numax_acf2d(periodogram, **self.numax_kwargs)}
+            results["deltanu"] = estimate_deltanu_acf2d(periodogram, results["numax"])
+            if teff is not None and np.isfinite(teff):
+                numax, deltanu = results["numax"], results["deltanu"]
+                results["radius"] = stellar_estimators.estimate_radius(numax, deltanu, teff)
+                results["mass"] = stellar_estimators.estimate_mass(numax, deltanu, teff)
+                results["logg"] = stellar_estimators.estimate_logg(numax, teff)
+        except Exception as e:
+            log.warning(
+                "Seismology failed for {}: {}".format(lc.meta.get("LABEL"), e)
+            )
+            return row
+        for name, result in results.items():
+            row[name] = result.value
+            if result.error is not None:
+                row[name + "_err"] = u.Quantity(result.error, result.unit).value
+        return row
+
+
+# The pipeline shared by the tasks of each worker process of `Seismology.run_many`
+_pipeline = None
+
+
+def _init_pipeline(pipeline):
+    global _pipeline
+    _pipeline = pipeline
+
+
+def _run_pipeline(args):
+    return _pipeline(args)
+
+
 class Seismology(object):
     """Enables astroseismic quantities to be estimated from periodograms.
 
@@ -109,6 +212,135 @@ class Seismology(object):
             .flatten()
         )
 
+    @staticmethod
+    def run_many(
+        lcs,
+        teff=None,
+        minimum_frequency=None,
+        maximum_frequency=None,
+        frequency=None,
+        nyquist_factor=1,
+        oversample_factor=1.0,
+        freq_unit=u.microhertz,
+        ls_method="fast",
+        filter_width=0.01,
+        numax_kwargs=None,
+        n_workers=1,
+        **kwargs
+    ):
+        """Estimates the global seismic parameters of many light curves.
+
+        Each light curve goes through the same steps as
+        ``Seismology.from_lightcurve(lc, normalization='psd')``, followed by
+        `estimate_numax`, `estimate_deltanu` and, if an effective temperature
+        is known, `estimate_radius`, `estimate_mass` and `estimate_logg`.
+        All periodograms are evaluated on one frequency grid, built from
+        ``frequency`` if given, or else from the frequency limits and the
+        time sampling of the first light curve.  The grid and the windows of
+        the background filter are computed once for all stars, and only the
+        scalar results are kept for each star.
+
+        Stars for which an estimator fails are logged as a warning and get
+        NaN values in the results table.
+
+        Parameters
+        ----------
+        lcs : `~lightkurve.collections.LightCurveCollection` or list of `LightCurve`
+            The light curves of the stars to analyze.
+        teff : float or array-like
+            The effective temperature of the stars, in Kelvin.  If None, the
+            'TEFF' value of the meta data of each light curve is used if
+            available.  The radius, mass and logg are NaN for the stars
+            without an effective temperature.
+        filter_width : float
+            Width of the filter used to estimate the background, in
+            log10(frequency) space; see `Periodogram.flatten`.
+        numax_kwargs : dict
+            Keyword arguments passed to
+            `~lightkurve.seismology.estimate_numax_acf2d`.
+        n_workers : int
+            Default 1. Number of processes over which the stars are
+            distributed.
+        kwargs : dict
+            See `~lightkurve.periodogram.LombScarglePeriodogram.from_lightcurve`
+            for the other parameters.
+
+        Returns
+        -------
+        results : `~astropy.table.Table`
+            One row per light curve, with the columns 'label', 'numax',
+            'deltanu', 'radius', 'mass' and 'logg', and their uncertainties
+            in the '_err' columns (NaN if the estimator provides none).
+        """
+        if n_workers < 1:
+            raise ValueError("`n_workers` must be at least 1.")
+        lcs = list(lcs)
+        if len(lcs) == 0:
+            raise ValueError("`lcs` must contain at least one light curve.")
+        if teff is None:
+            teff = [lc.meta.get("TEFF") for lc in lcs]
+        elif np.ndim(teff) == 0:
+            teff = [teff] * len(lcs)
+        if len(teff) != len(lcs):
+            raise ValueError("`teff` must contain one value per light curve.")
+        teff = [None if t is None else u.Quantity(t, u.Kelvin).value for t in teff]
+
+        frequency, _ = _lombscargle_frequency_grid(
+            _prepare_lightcurve(lcs[0]),
+            minimum_frequency=minimum_frequency,
+            maximum_frequency=maximum_frequency,
+            minimum_period=None,
+            maximum_period=None,
+            frequency=frequency,
+            period=None,
+            nyquist_factor=nyquist_factor,
+            oversample_factor=oversample_factor,
+            freq_unit=freq_unit,
+            kwargs=kwargs,
+        )
+        ls_method, _ = _validate_ls_method(frequency, ls_method, 1)
+        pipeline = _SeismologyPipeline(
+            frequency,
+            oversample_factor=oversample_factor,
+            ls_method=ls_method,
+            filter_width=filter_width,
+            numax_kwargs=numax_kwargs or {},
+            kwargs=kwargs,
+        )
+
+        args = list(zip(lcs, teff))
+        if n_workers > 1 and len(args) > 1:
+            n_workers = min(n_workers, len(args))
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_pipeline,
+                initargs=(pipeline,),
+            ) as executor:
+                rows = list(
+                    executor.map(
+                        _run_pipeline,
+                        args,
+                        chunksize=max(1, len(args) // (4 * n_workers)),
+                    )
+                )
+        else:
+            rows = [pipeline(arg) for arg in args]
+
+        units = {
+            "numax": frequency.unit,
+            "deltanu": frequency.unit,
+            "radius": u.solRad,
+            "mass": u.solMass,
+            "logg": u.dex,
+        }
+        results = Table()
+        results["label"] = [lc.meta.get("LABEL") for lc in lcs]
+        for name in _SeismologyPipeline.columns:
+            for column in [name, name + "_err"]:
+                results[column] = np.array([row[column] for row in rows])
+                results[column].unit = units[name]
+        return results
+
     def _validate_numax(self, numax):
         """Raises exception if `numax` is None and `self.numax` is not set."""
         if numax is None:
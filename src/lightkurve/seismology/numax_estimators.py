@@ -170,16 +170,15 @@ def estimate_numax_acf2d(periodogram, numaxs=None, window_width=None, spacing=No
     # power, rescaled based on filter width
     fs = np.median(np.diff(periodogram.frequency.value))
 
-    metric = np.zeros(len(numaxs))
-    acf2d = np.zeros([int(window_width / 2 / fs) * 2, len(numaxs)])
-    for idx, numax in enumerate(numaxs):
-        acf = utils.autocorrelate(
-            periodogram, numax, window_width=window_width, frequency_spacing=fs
-        )  # Return the acf at this numax
-        acf2d[:, idx] = acf  # Store the 2D acf
-        metric[idx] = (np.sum(np.abs(acf)) - 1) / len(
-            acf
-        )  # Store the max acf power normalised by the length
+    # Autocorrelate the windows around all numaxs at once, selecting the
+    # same window indices as `utils.autocorrelate`
+    spread = int(window_width / 2 / fs)
+    x0 = int(periodogram.frequency[0].value / fs)
+    starts = np.array([int(numax / fs) for numax in numaxs]) - x0 - spread
+    acf = utils.autocorrelate_windows(periodogram.power.value, starts, 2 * spread)
+    acf2d = acf.T  # Store the 2D acf
+    # Store the max acf power normalised by the length
+    metric = (np.sum(np.abs(acf), axis=1) - 1) / acf.shape[1]
 
     # Smooth the data to find the peak
     # Gaussian1D kernel takes a standard deviation in unitless indices. A stddev
@@ -1,6 +1,9 @@
 """Generic classes and functions which aid the asteroseismology features."""
+import functools
+
 import numpy as np
-import copy
+import scipy.fft
+from scipy.fft import next_fast_len
 from astropy import units as u
 from astropy.units import Quantity
 
@@ -103,6 +106,70 @@ def get_fwhm(periodogram, numax):
     return fwhm
 
 
+@functools.lru_cache(maxsize=128)
+def _fft_length(width):
+    """Returns the length of the zero-padded FFT used to autocorrelate ``width`` values.
+
+    The result is cached since the estimators autocorrelate many windows of
+    the same width; `scipy.fft` in turn caches the plans of recent lengths.
+    """
+    if width < 1:
+        raise ValueError("Can not autocorrelate an empty window.")
+    return next_fast_len(2 * width - 1, real=True)
+
+
+def _fft_autocorrelate(x):
+    """Returns the autocorrelation of ``x`` along its last axis at lags >= 0.
+
+    This is equivalent to ``np.correlate(x, x, mode="full")[len(x) - 1:]``
+    for each row of ``x``, but is computed with a zero-padded real FFT in
+    O(W log W) rather than O(W^2) operations for a window of W values.
+    """
+    width = x.shape[-1]
+    nfft = _fft_length(width)
+    fx = scipy.fft.rfft(x, n=nfft, axis=-1)
+    return scipy.fft.irfft(fx * np.conj(fx), n=nfft, axis=-1)[..., :width]
+
+
+def autocorrelate_windows(power, starts, width, max_chunk_size=2 ** 22):
+    """Autocorrelates many windows of ``width`` values of ``power`` at once.
+
+    Each window ``power[start:start + width]`` is first rescaled to zero mean,
+    as in `autocorrelate`.  The windows are taken as strided views of
+    ``power`` and autocorrelated with FFTs, ``max_chunk_size`` values at a
+    time to bound the memory used.
+
+    Parameters:
+    ----------
+        power : array-like
+            The power spectrum.
+
+        starts : array-like of int
+            The index of the first value of each window.
+
+        width : int
+            The number of values in each window.
+
+    Returns:
+    --------
+        acf : array-like
+            Array of shape (len(starts), width) with the autocorrelation
+            power of each window.
+    """
+    power = np.asarray(power, dtype=float)
+    starts = np.asarray(starts, dtype=int)
+    if (starts < 0).any() or (starts + width > len(power)).any():
+        raise ValueError("The autocorrelation windows extend beyond the spectrum.")
+    windows = np.lib.stride_tricks.sliding_window_view(power, width)
+    acf = np.empty((len(starts), width))
+    chunk = max(1, max_chunk_size // max(width, 1))
+    for idx in range(0, len(starts), chunk):
+        sel = windows[starts[idx : idx + chunk]]  # copies the chunk
+        sel -= np.nanmean(sel, axis=1)[:, None]
+        acf[idx : idx + chunk] = _fft_autocorrelate(sel)
+    return acf
+
+
 def autocorrelate(periodogram, numax, window_width=25.0, frequency_spacing=None):
     """An autocorrelation function (ACF) for seismic mode envelopes.
 
@@ -143,12 +210,10 @@ def autocorrelate(periodogram, numax, window_width=25.0, frequency_spacing=None)
         (periodogram.frequency[0].value / frequency_spacing)
     )  # Transform in case the index isn't from 0
     xt = x - x0
-    p_sel = copy.deepcopy(
-        periodogram.power[xt - spread : xt + spread].value
+    p_sel = np.array(
+        periodogram.power[xt - spread : xt + spread].value, dtype=float
     )  # Make the window selection
     p_sel -= np.nanmean(p_sel)  # Make it so that the selection has zero mean.
 
-    C = np.correlate(p_sel, p_sel, mode="full")[
-        len(p_sel) - 1 :
-    ]  # Correlated the resulting SNR space with itself
+    C = _fft_autocorrelate(p_sel)  # Correlated the resulting SNR space with itself
     return C
@@ -2,11 +2,13 @@
 
 from __future__ import division
 import datetime
+import io
 import os
 import warnings
 import logging
 
 import collections
+from contextlib import contextmanager
 
 from astropy.io import fits
 from astropy.io.fits import Undefined, BinTableHDU
@@ -158,6 +160,29 @@ class TargetPixelFile(object):
     def __len__(self):
         return len(self.time)
 
+    def __getstate__(self):
+        """Supports pickling, e.g. to return target pixel files from worker processes.
+
+        An `HDUList` backed by an open file cannot be pickled, so the FITS
+        file is pickled as bytes instead.
+        """
+        state = self.__dict__.copy()
+        buffer = io.BytesIO()
+        self.hdu.writeto(buffer, output_verify="ignore")
+        state["_hdu"] = buffer.getvalue()
+        if isinstance(self.path, fits.HDUList):
+            state["path"] = None
+        # The meta mapping and column cache are rebuilt from the HDUList
+        del state["meta"], state["_column_cache"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.hdu = fits.HDUList.fromstring(state["_hdu"])
+        if self.path is None:
+            self.path = self.hdu
+        self.meta = HduToMetaMapping(self.hdu[0])
+
     def __add__(self, other):
         if isinstance(other, Quantity):
             other = other.value
@@ -232,6 +257,111 @@ class TargetPixelFile(object):
                     "is this a target pixel file?".format(self.path, key)
                 )
         self._hdu = value
+        self._column_cache = None
+
+    @contextmanager
+    def _cached_columns(self):
+        """Context in which each column read by ``_get_column`` is indexed with
+        ``quality_mask`` only once.
+
+        The cache only lives for the duration of one extraction call, e.g.
+        ``_aperture_photometry``, so that the public properties keep reflecting
+        changes made to ``hdu`` or ``quality_mask`` in between calls.
+        """
+        if self._column_cache is not None:  # nested call
+            yield
+            return
+        self._column_cache = {}
+        try:
+            yield
+        finally:
+            self._column_cache = None
+
+    def _get_column(self, name, copy=True):
+        """Returns the values of column ``name`` of the pixel data table
+        for all good-quality cadences, in native byte order.
+
+        Within ``_cached_columns``, the values are read once and cached.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column, e.g. "FLUX".
+        copy : bool
+            If `False`, a read-only array is returned, which may be the
+            cached array itself.
+        """
+        cache = self._column_cache
+        values = None if cache is None else cache.get(name)
+        if values is None:
+            values = self.hdu[1].data[name][self.quality_mask]
+            values = values.astype(values.dtype.newbyteorder("="), copy=False)
+            values.flags.writeable = False
+            if cache is not None:
+                cache[name] = values
+        if copy:
+            return values.copy()
+        return values
+
+    def _get_column_unit(self, name):
+        """Returns the unit of the flux columns of the pixel data table."""
+        if name in ("FLUX_BKG", "FLUX_BKG_ERR"):
+            return "electron/s"
+        tunit = {"FLUX": "TUNIT5", "FLUX_ERR": "TUNIT6"}.get(name)
+        if tunit is not None and self.get_header(1).get(tunit) == "e-/s":
+            return "electron/s"
+        return None
+
+    def _get_quantity(self, name, copy=True):
+        """Returns the flux-like column ``name`` as a `~astropy.units.Quantity`;
+        see ``_get_column``."""
+        return Quantity(
+            self._get_column(name, copy=False), unit=self._get_column_unit(name), copy=copy
+        )
+
+    def read_column(self, name, cadences=None, aperture_mask=None):
+        """Reads the values of a column of the pixel data table, optionally for a
+        subset of the good-quality cadences and of the pixels only.
+
+        Only the requested rows are read from the (memory-mapped) file, which
+        makes it possible to process large pixel files in chunks of cadences.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column, e.g. "FLUX" or "FLUX_ERR".
+        cadences : int, slice, or array-like, optional
+            Index into the good-quality cadences, e.g. ``slice(0, 1000)``.
+            Defaults to all good-quality cadences.
+        aperture_mask : array-like, 'pipeline', 'all', 'threshold', 'default',
+        'background', or None
+            If specified, only the pixels in the mask are returned;
+            see `~TargetPixelFile.extract_aperture_photometry`.
+
+        Returns
+        -------
+        values : `~numpy.ndarray`
+            Array of shape (n_cadences, n_rows, n_cols), or (n_cadences, n_pixels)
+            if ``aperture_mask`` is specified.
+        """
+        if self._column_cache is not None and name in self._column_cache:
+            values = self._get_column(name, copy=False)
+            values = values if cadences is None else values[cadences]
+        else:
+            quality_idx = np.nonzero(self.quality_mask)[0]
+            if cadences is not None:
+                quality_idx = np.atleast_1d(quality_idx[cadences])
+            column = self.hdu[1].data[name]
+            if len(quality_idx) > 0 and (
+                quality_idx[-1] - quality_idx[0] + 1 == len(quality_idx)
+            ):
+                # contiguous cadences: read a slice rather than fancy-index the table
+                values = column[quality_idx[0] : quality_idx[-1] + 1]
+            else:
+                values = column[quality_idx]
+        if aperture_mask is not None:
+            values = values[:, self._parse_aperture_mask(aperture_mask)]
+        return np.array(values, dtype=values.dtype.newbyteorder("="))
 
     def get_keyword(self, keyword, hdu=0, default=None):
         """Returns a header keyword value.
@@ -297,12 +427,12 @@ class TargetPixelFile(object):
     @property
     def pos_corr1(self):
         """Returns the column position correction."""
-        return self.hdu[1].data["POS_CORR1"][self.quality_mask]
+        return self._get_column("POS_CORR1")
 
     @property
     def pos_corr2(self):
         """Returns the row position correction."""
-        return self.hdu[1].data["POS_CORR2"][self.quality_mask]
+        return self._get_column("POS_CORR2")
 
     @property
     def pipeline_mask(self):
@@ -324,12 +454,12 @@ class TargetPixelFile(object):
     @property
     def shape(self):
         """Return the cube dimension shape."""
-        return self.flux.shape
+        return (np.count_nonzero(self.quality_mask),) + self.hdu[1].data["FLUX"].shape[1:]
 
     @property
     def time(self) -> Time:
         """Returns the time for all good-quality cadences."""
-        time_values = self.hdu[1].data["TIME"][self.quality_mask]
+        time_values = self._get_column("TIME")
         # Some data products have missing time values;
         # we need to set these to zero or `Time` cannot be instantiated.
         time_values[~np.isfinite(time_values)] = 0
@@ -351,7 +481,7 @@ class TargetPixelFile(object):
     @property
     def cadenceno(self):
         """Return the cadence number for all good-quality cadences."""
-        cadenceno = self.hdu[1].data["CADENCENO"][self.quality_mask]
+        cadenceno = self._get_column("CADENCENO")
         # The TESScut service returns an array of zeros as CADENCENO.
         # If this is the case, return frame numbers from 0 instead.
         if cadenceno[0] == 0:
@@ -366,36 +496,26 @@ class TargetPixelFile(object):
     @property
     def flux(self) -> Quantity:
         """Returns the flux for all good-quality cadences."""
-        unit = None
-        if self.get_header(1).get("TUNIT5") == "e-/s":
-            unit = "electron/s"
-        return Quantity(self.hdu[1].data["FLUX"][self.quality_mask], unit=unit)
+        return self._get_quantity("FLUX")
 
     @property
     def flux_err(self) -> Quantity:
         """Returns the flux uncertainty for all good-quality cadences."""
-        unit = None
-        if self.get_header(1).get("TUNIT6") == "e-/s":
-            unit = "electron/s"
-        return Quantity(self.hdu[1].data["FLUX_ERR"][self.quality_mask], unit=unit)
+        return self._get_quantity("FLUX_ERR")
 
     @property
     def flux_bkg(self) -> Quantity:
         """Returns the background flux for all good-quality cadences."""
-        return Quantity(
-            self.hdu[1].data["FLUX_BKG"][self.quality_mask], unit="electron/s"
-        )
+        return self._get_quantity("FLUX_BKG")
 
     @property
     def flux_bkg_err(self) -> Quantity:
-        return Quantity(
-            self.hdu[1].data["FLUX_BKG_ERR"][self.quality_mask], unit="electron/s"
-        )
+        return self._get_quantity("FLUX_BKG_ERR")
 
     @property
     def quality(self):
         """Returns the quality flag integer of every good cadence."""
-        return self.hdu[1].data["QUALITY"][self.quality_mask]
+        return self._get_column("QUALITY")
 
     @property
     def wcs(self) -> WCS:
@@ -777,7 +897,7 @@ class TargetPixelFile(object):
         """
         mask = self._parse_aperture_mask(aperture_mask)
         # For each cadence, compute the median pixel flux across the background
-        simple_bkg = np.nanmedian(self.flux[:, mask], axis=1) / u.pixel
+        simple_bkg = np.nanmedian(self._get_quantity("FLUX", copy=False)[:, mask], axis=1) / u.pixel
         return LightCurve(time=self.time, flux=simple_bkg)
 
     def estimate_centroids(self, aperture_mask="default", method="moments"):
@@ -826,103 +946,132 @@ class TargetPixelFile(object):
             for each cadence, or NaN for cadences where the estimation failed.
         """
         method = validate_method(method, ["moments", "quadratic"])
-        if method == "moments":
-            return self._estimate_centroids_via_moments(aperture_mask=aperture_mask)
-        elif method == "quadratic":
-            return self._estimate_centroids_via_quadratic(aperture_mask=aperture_mask)
+        with self._cached_columns():
+            if method == "moments":
+                return self._estimate_centroids_via_moments(aperture_mask=aperture_mask)
+            elif method == "quadratic":
+                return self._estimate_centroids_via_quadratic(aperture_mask=aperture_mask)
 
-    def _estimate_centroids_via_moments(self, aperture_mask):
+    def _estimate_centroids_via_moments(self, aperture_mask, flux=None):
         """Compute the "center of mass" of the light based on the 2D moments;
         this is a helper method for `estimate_centroids()`."""
         aperture_mask = self._parse_aperture_mask(aperture_mask)
+        if flux is None:
+            flux = self._get_quantity("FLUX", copy=False)
         yy, xx = np.indices(self.shape[1:])
         yy = self.row + yy
         xx = self.column + xx
-        total_flux = np.nansum(self.flux[:, aperture_mask], axis=1)
+        total_flux = np.nansum(flux[:, aperture_mask], axis=1)
         with warnings.catch_warnings():
             # RuntimeWarnings may occur below if total_flux contains zeros
             warnings.simplefilter("ignore", RuntimeWarning)
             col_centr = (
-                np.nansum(xx * aperture_mask * self.flux, axis=(1, 2)) / total_flux
+                np.nansum(xx * aperture_mask * flux, axis=(1, 2)) / total_flux
             )
             row_centr = (
-                np.nansum(yy * aperture_mask * self.flux, axis=(1, 2)) / total_flux
+                np.nansum(yy * aperture_mask * flux, axis=(1, 2)) / total_flux
             )
         return col_centr * u.pixel, row_centr * u.pixel
 
-    def _estimate_centroids_via_quadratic(self, aperture_mask):
+    def _estimate_centroids_via_quadratic(self, aperture_mask, flux=None):
         """Estimate centroids by fitting a 2D quadratic to the brightest pixels;
         this is a helper method for `estimate_centroids()`."""
         aperture_mask = self._parse_aperture_mask(aperture_mask)
-        col_centr, row_centr = [], []
-        for idx in range(len(self.time)):
-            col, row = centroid_quadratic(self.flux[idx], mask=aperture_mask)
-            col_centr.append(col)
-            row_centr.append(row)
+        if flux is None:
+            flux = self._get_quantity("FLUX", copy=False)
+        col_centr, row_centr = centroid_quadratic(flux, mask=aperture_mask)
         col_centr = np.asarray(col_centr, dtype=float) + self.column
         row_centr = np.asarray(row_centr, dtype=float) + self.row
         col_centr = Quantity(col_centr, unit="pixel")
         row_centr = Quantity(row_centr, unit="pixel")
         return col_centr, row_centr
 
+    def _iter_chunks(self, column, chunk_size):
+        """Yields column ``column`` of the good-quality cadences as
+        `~astropy.units.Quantity` chunks of at most ``chunk_size`` cadences."""
+        if chunk_size is None:
+            yield self._get_quantity(column, copy=False)
+            return
+        chunk_size = int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        unit = self._get_column_unit(column)
+        for start in range(0, max(self.shape[0], 1), chunk_size):
+            values = self.read_column(column, cadences=slice(start, start + chunk_size))
+            yield Quantity(values, unit=unit, copy=False)
+
     def _aperture_photometry(
-        self, aperture_mask, flux_method="sum", centroid_method="moments"
+        self, aperture_mask, flux_method="sum", centroid_method="moments", chunk_size=None
     ):
         """Helper method for ``extract_aperture photometry``.
 
+        If ``chunk_size`` is given, the pixel data is read and reduced in chunks
+        of ``chunk_size`` cadences, so that the flux cube is never held in
+        memory in its entirety.
+
         Returns
         -------
         flux, flux_err, centroid_col, centroid_row
         """
-        # Validate the aperture mask
-        apmask = self._parse_aperture_mask(aperture_mask)
-        if apmask.sum() == 0:
-            log.warning("Warning: aperture mask contains zero pixels.")
-
-        # Estimate centroids
-        centroid_col, centroid_row = self.estimate_centroids(
-            apmask, method=centroid_method
-        )
-
-        # Estimate flux
+        centroid_method = validate_method(centroid_method, ["moments", "quadratic"])
         if flux_method == "sum":
-            flux = np.nansum(self.flux[:, apmask], axis=1)
-
+            reduce_func = np.nansum
         elif flux_method == "median":
-            flux = np.nanmedian(self.flux[:, apmask], axis=1)
-
+            reduce_func = np.nanmedian
         elif flux_method == "mean":
-            flux = np.nanmean(self.flux[:, apmask], axis=1)
+            reduce_func = np.nanmean
         else:
             raise ValueError("`flux_method` must be one of 'sum', 'median', or 'mean'.")
+        if centroid_method == "moments":
+            centroid_func = self._estimate_centroids_via_moments
+        else:
+            centroid_func = self._estimate_centroids_via_quadratic
 
-        # In the future we may wish to add a user specified function
+        # Validate the aperture mask
+        apmask = self._parse_aperture_mask(aperture_mask)
+        if apmask.sum() == 0:
+            log.warning("Warning: aperture mask contains zero pixels.")
 
-        # We use ``np.nansum`` above to be robust against a subset of pixels
-        # being NaN, however if *all* pixels are NaN, we propagate a NaN.
-        is_allnan = ~np.any(np.isfinite(self.flux[:, apmask]), axis=1)
-        flux[is_allnan] = np.nan
+        results = []
+        with self._cached_columns():
+            for flux_cube, flux_err_cube in zip(
+                self._iter_chunks("FLUX", chunk_size),
+                self._iter_chunks("FLUX_ERR", chunk_size),
+            ):
+                # Estimate centroids
+                centroid_col, centroid_row = centroid_func(apmask, flux=flux_cube)
 
-        # Similarly, if *all* pixel values across the TPF are exactly zero,
-        # we propagate NaN (cf. #873 for an example of this happening)
-        is_allzero = np.all(self.flux == 0, axis=(1, 2))
-        flux[is_allzero] = np.nan
+                # Estimate flux
+                flux = reduce_func(flux_cube[:, apmask], axis=1)
 
-        # Estimate flux_err
-        with warnings.catch_warnings():
-            # Ignore warnings due to negative errors
-            warnings.simplefilter("ignore", RuntimeWarning)
-            if flux_method == "sum":
-                flux_err = np.nansum(self.flux_err[:, apmask] ** 2, axis=1) ** 0.5
+                # In the future we may wish to add a user specified function
 
-            elif flux_method == "median":
-                flux_err = np.nanmedian(self.flux_err[:, apmask] ** 2, axis=1) ** 0.5
+                # We use ``np.nansum`` above to be robust against a subset of pixels
+                # being NaN, however if *all* pixels are NaN, we propagate a NaN.
+                is_allnan = ~np.any(np.isfinite(flux_cube[:, apmask]), axis=1)
+                flux[is_allnan] = np.nan
 
-            elif flux_method == "mean":
-                flux_err = np.nanmean(self.flux_err[:, apmask] ** 2, axis=1) ** 0.5
+                # Similarly, if *all* pixel values across the TPF are exactly zero,
+                # we propagate NaN (cf. #873 for an example of this happening)
+                is_allzero = np.all(flux_cube == 0, axis=(1, 2))
+                flux[is_allzero] = np.nan
 
-            is_allnan = ~np.any(np.isfinite(self.flux_err[:, apmask]), axis=1)
-            flux_err[is_allnan] = np.nan
+                # Estimate flux_err
+                with warnings.catch_warnings():
+                    # Ignore warnings due to negative errors
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    flux_err = reduce_func(flux_err_cube[:, apmask] ** 2, axis=1) ** 0.5
+                    is_allnan = ~np.any(np.isfinite(flux_err_cube[:, apmask]), axis=1)
+                    flux_err[is_allnan] = np.nan
+
+                results.append((flux, flux_err, centroid_col, centroid_row))
+
+        if len(results) == 1:
+            flux, flux_err, centroid_col, centroid_row = results[0]
+        else:
+            flux, flux_err, centroid_col, centroid_row = (
+                np.concatenate(values) for values in zip(*results)
+            )
 
         if self.get_header(1).get("TUNIT5") == "e-/s":
             flux = Quantity(flux, unit="electron/s")
@@ -931,6 +1080,25 @@ class TargetPixelFile(object):
 
         return flux, flux_err, centroid_col, centroid_row
 
+    def _bkg_photometry(self, aperture_mask, chunk_size=None):
+        """Helper method for ``get_bkg_lightcurve``; returns the summed background
+        flux and its uncertainty, optionally reading the data in chunks of
+        ``chunk_size`` cadences."""
+        aperture_mask = self._parse_aperture_mask(aperture_mask)
+        flux_bkg, flux_bkg_err = [], []
+        for bkg, bkg_err in zip(
+            self._iter_chunks("FLUX_BKG", chunk_size),
+            self._iter_chunks("FLUX_BKG_ERR", chunk_size),
+        ):
+            flux_bkg.append(np.nansum(bkg[:, aperture_mask], axis=1))
+            # Ignore warnings related to zero or negative errors
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                flux_bkg_err.append(
+                    np.nansum(bkg_err[:, aperture_mask] ** 2, axis=1) ** 0.5
+                )
+        return np.concatenate(flux_bkg), np.concatenate(flux_bkg_err)
+
     def query_solar_system_objects(
         self,
         cadence_mask="outliers",
@@ -1129,7 +1297,7 @@ class TargetPixelFile(object):
                 else:
                     data_to_plot = self.flux[frame]
             else:
-                data_to_plot = self.hdu[1].data[column][self.quality_mask][frame]
+                data_to_plot = self._get_column(column, copy=False)[frame]
         except KeyError:
             raise ValueError(
                 "column must be one of the following: ('FLUX','FLUX_ERR',"
@@ -1234,13 +1402,14 @@ class TargetPixelFile(object):
 
         column = plot_args.get("column", "FLUX")
         ax = self.plot(**plot_args)
+        values = self._get_column(column, copy=False)
 
         def init():
             return ax.images
 
         def animate(i):
             frame = i * step
-            ax.images[0].set_data(self.hdu[1].data[column][self.quality_mask][frame])
+            ax.images[0].set_data(values[frame])
             ax.set_title(f"Frame {frame}")
             return ax.images
 
@@ -2196,7 +2365,11 @@ class KeplerTargetPixelFile(TargetPixelFile):
         return self.get_keyword("MISSION")
 
     def extract_aperture_photometry(
-        self, aperture_mask="default", flux_method="sum", centroid_method="moments"
+        self,
+        aperture_mask="default",
+        flux_method="sum",
+        centroid_method="moments",
+        chunk_size=None,
     ):
         """Returns a LightCurve obtained using aperture photometry.
 
@@ -2218,6 +2391,10 @@ class KeplerTargetPixelFile(TargetPixelFile):
         centroid_method : str, 'moments' or 'quadratic'
             For the details on this arguments, please refer to the documentation
             for `estimate_centroids()`.
+        chunk_size : int, optional
+            If specified, the pixel data is read from the file and reduced in
+            chunks of ``chunk_size`` cadences, which bounds the memory used for
+            pixel files that are too large to be loaded at once.
 
         Returns
         -------
@@ -2233,6 +2410,7 @@ class KeplerTargetPixelFile(TargetPixelFile):
             aperture_mask=aperture_mask,
             flux_method=flux_method,
             centroid_method=centroid_method,
+            chunk_size=chunk_size,
         )
         keys = {
             "centroid_col": centroid_col,
@@ -2253,14 +2431,8 @@ class KeplerTargetPixelFile(TargetPixelFile):
             time=self.time, flux=flux, flux_err=flux_err, **keys, meta=meta
         )
 
-    def get_bkg_lightcurve(self, aperture_mask=None):
-        aperture_mask = self._parse_aperture_mask(aperture_mask)
-        # Ignore warnings related to zero or negative errors
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", RuntimeWarning)
-            flux_bkg_err = (
-                np.nansum(self.flux_bkg_err[:, aperture_mask] ** 2, axis=1) ** 0.5
-            )
+    def get_bkg_lightcurve(self, aperture_mask=None, chunk_size=None):
+        flux_bkg, flux_bkg_err = self._bkg_photometry(aperture_mask, chunk_size)
         keys = {
             "quality": self.quality,
             "channel": self.channel,
@@ -2275,7 +2447,7 @@ class KeplerTargetPixelFile(TargetPixelFile):
         }
         return KeplerLightCurve(
             time=self.time,
-            flux=np.nansum(self.flux_bkg[:, aperture_mask], axis=1),
+            flux=flux_bkg,
             flux_err=flux_bkg_err,
             **keys,
         )
@@ -2859,7 +3031,11 @@ class TessTargetPixelFile(TargetPixelFile):
         return "TESS"
 
     def extract_aperture_photometry(
-        self, aperture_mask="default", flux_method="sum", centroid_method="moments"
+        self,
+        aperture_mask="default",
+        flux_method="sum",
+        centroid_method="moments",
+        chunk_size=None,
     ):
         """Returns a LightCurve obtained using aperture photometry.
 
@@ -2881,6 +3057,10 @@ class TessTargetPixelFile(TargetPixelFile):
         centroid_method : str, 'moments' or 'quadratic'
             For the details on this arguments, please refer to the documentation
             for `estimate_centroids()`.
+        chunk_size : int, optional
+            If specified, the pixel data is read from the file and reduced in
+            chunks of ``chunk_size`` cadences, which bounds the memory used for
+            pixel files that are too large to be loaded at once.
 
         Returns
         -------
@@ -2895,6 +3075,7 @@ class TessTargetPixelFile(TargetPixelFile):
             aperture_mask=aperture_mask,
             flux_method=flux_method,
             centroid_method=centroid_method,
+            chunk_size=chunk_size,
         )
         keys = {
             "centroid_col": centroid_col,
@@ -2915,14 +3096,8 @@ class TessTargetPixelFile(TargetPixelFile):
             time=self.time, flux=flux, flux_err=flux_err, **keys, meta=meta
         )
 
-    def get_bkg_lightcurve(self, aperture_mask=None):
-        aperture_mask = self._parse_aperture_mask(aperture_mask)
-        # Ignore warnings related to zero or negative errors
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", RuntimeWarning)
-            flux_bkg_err = (
-                np.nansum(self.flux_bkg_err[:, aperture_mask] ** 2, axis=1) ** 0.5
-            )
+    def get_bkg_lightcurve(self, aperture_mask=None, chunk_size=None):
+        flux_bkg, flux_bkg_err = self._bkg_photometry(aperture_mask, chunk_size)
         keys = {
             "quality": self.quality,
             "sector": self.sector,
@@ -2936,7 +3111,7 @@ class TessTargetPixelFile(TargetPixelFile):
         }
         return TessLightCurve(
             time=self.time,
-            flux=np.nansum(self.flux_bkg[:, aperture_mask], axis=1),
+            flux=flux_bkg,
             flux_err=flux_bkg_err,
             **keys,
         )
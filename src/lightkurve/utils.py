@@ -598,6 +598,29 @@ def validate_method(method, supported_methods):
     )
 
 
+# Design matrix of the bivariate quadratic fitted by `centroid_quadratic`, as
+# defined by Eqn 20 in Vakili & Hogg (arxiv:1610.05873). It contains a
+# column of ones followed by pixel coordinates: x, y, x**2, xy, y**2.
+_CENTROID_QUADRATIC_A = np.array(
+    [
+        [1, -1, -1, 1, 1, 1],
+        [1, 0, -1, 0, 0, 1],
+        [1, 1, -1, 1, -1, 1],
+        [1, -1, 0, 1, 0, 0],
+        [1, 0, 0, 0, 0, 0],
+        [1, 1, 0, 1, 0, 0],
+        [1, -1, 1, 1, -1, 1],
+        [1, 0, 1, 0, 0, 1],
+        [1, 1, 1, 1, 1, 1],
+    ]
+)
+# We also pre-compute $(A^t A)^-1 A^t$, cf. Eqn 21 in Vakili & Hogg.
+_CENTROID_QUADRATIC_APRIME = (
+    np.linalg.inv(_CENTROID_QUADRATIC_A.T @ _CENTROID_QUADRATIC_A)
+    @ _CENTROID_QUADRATIC_A.T
+)
+
+
 def centroid_quadratic(data, mask=None):
     """Computes the quadratic estimate of the centroid in a 2d-array.
 
@@ -616,90 +639,87 @@ def centroid_quadratic(data, mask=None):
 
     Parameters
     ----------
-    data : 2D array
+    data : 2D or 3D array
         The 2D input array representing the pixel values of the image.
+        If a 3D array of shape (n_frames, n_rows, n_columns) is passed,
+        the centroid of every frame is computed at once.
     mask : array_like (bool), optional
-        A boolean mask, with the same shape as `data`, where a **True** value
+        A boolean mask, with the same shape as the image, where a **True** value
         indicates the corresponding element of data is masked.
 
     Returns
     -------
     column, row : tuple
         The coordinates of the centroid in column and row.  If the fit failed,
-        then (NaN, NaN) will be returned.
+        then (NaN, NaN) will be returned.  If ``data`` is a 3D array, these are
+        arrays of length n_frames, which are NaN for the frames where the fit
+        failed, including frames which do not contain any finite value.
     """
     if isinstance(data, u.Quantity):
         data = data.value
+    data = np.asarray(data)
 
     if np.issubdtype(data.dtype, int):
         # multiple code paths below require data be of float type
         # proactively convert int to float once and for all.
         data = data.astype(float)
 
+    single_frame = data.ndim == 2
+    if single_frame:
+        data = data[np.newaxis]
+
     # Step 1: identify the patch of 3x3 pixels (z_)
     # that is centered on the brightest pixel (xx, yy)
     if mask is not None:
         # mask handling.
         # Issue 1401 demonstrates that using 'data' to find the max will break when all flux is negative
         # set masked pixels NaN (instead of 0) to resolve it.
-        data = data.copy()
-        data[~mask] = np.nan
-    arg_data_max = np.nanargmax(data)
-    yy, xx = np.unravel_index(arg_data_max, data.shape)
+        data = np.where(mask, data, np.nan)
+    n_frames, n_rows, n_cols = data.shape
+    flat = data.reshape(n_frames, -1)
+    is_allnan = np.all(np.isnan(flat), axis=1)
+    if single_frame and is_allnan[0]:
+        raise ValueError("All-NaN slice encountered")
+    if is_allnan.any():
+        flat = np.where(is_allnan[:, np.newaxis], 0, flat)
+    yy, xx = np.divmod(np.nanargmax(flat, axis=1), n_cols)
     # Make sure the 3x3 patch does not leave the TPF bounds
-    if yy < 1:
-        yy = 1
-    if xx < 1:
-        xx = 1
-    if yy > (data.shape[0] - 2):
-        yy = data.shape[0] - 2
-    if xx > (data.shape[1] - 2):
-        xx = data.shape[1] - 2
-
-    z_ = data[yy - 1 : yy + 2, xx - 1 : xx + 2]
-    if np.any(np.isnan(z_)):
+    yy = np.clip(yy, 1, n_rows - 2)
+    xx = np.clip(xx, 1, n_cols - 2)
+
+    offsets = np.arange(-1, 2)
+    z_ = data[
+        np.arange(n_frames)[:, np.newaxis, np.newaxis],
+        yy[:, np.newaxis, np.newaxis] + offsets[np.newaxis, :, np.newaxis],
+        xx[:, np.newaxis, np.newaxis] + offsets[np.newaxis, np.newaxis, :],
+    ].reshape(n_frames, 9)
+    z_isnan = np.isnan(z_)
+    if z_isnan.any():
         # handle edge case the 3X3 patch has NaN
         # Need some finite value for NaN pixels for the
         # quadratic fit below: use the mean of the 3x3 patch
         # to reduce the skew
-        z_ = z_.copy()
-        z_[np.isnan(z_)] = np.nanmean(z_)
-
-    # Next, we will fit the coefficients of the bivariate quadratic with the
-    # help of a design matrix (A) as defined by Eqn 20 in Vakili & Hogg
-    # (arxiv:1610.05873). The design matrix contains a
-    # column of ones followed by pixel coordinates: x, y, x**2, xy, y**2.
-    A = np.array(
-        [
-            [1, -1, -1, 1, 1, 1],
-            [1, 0, -1, 0, 0, 1],
-            [1, 1, -1, 1, -1, 1],
-            [1, -1, 0, 1, 0, 0],
-            [1, 0, 0, 0, 0, 0],
-            [1, 1, 0, 1, 0, 0],
-            [1, -1, 1, 1, -1, 1],
-            [1, 0, 1, 0, 0, 1],
-            [1, 1, 1, 1, 1, 1],
-        ]
-    )
-    # We also pre-compute $(A^t A)^-1 A^t$, cf. Eqn 21 in Vakili & Hogg.
-    At = A.transpose()
-    # In Python 3 this can become `Aprime = np.linalg.inv(At @ A) @ At`
-    Aprime = np.matmul(np.linalg.inv(np.matmul(At, A)), At)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            z_mean = np.nanmean(z_, axis=1)
+        z_ = np.where(z_isnan, z_mean[:, np.newaxis], z_)
 
     # Step 2: fit the polynomial $P = a + bx + cy + dx^2 + exy + fy^2$
-    # following Equation 21 in Vakili & Hogg.
-    # In Python 3 this can become `Aprime @ z_.flatten()`
-    a, b, c, d, e, f = np.matmul(Aprime, z_.flatten())
+    # following Equation 21 in Vakili & Hogg, for all frames at once.
+    a, b, c, d, e, f = (z_ @ _CENTROID_QUADRATIC_APRIME.T).T
 
     # Step 3: analytically find the function maximum,
     # following https://en.wikipedia.org/wiki/Quadratic_function
     det = 4 * d * f - e ** 2
-    if abs(det) < 1e-6:
-        return np.nan, np.nan  # No solution
-    xm = -(2 * f * b - c * e) / det
-    ym = -(2 * d * c - b * e) / det
-    return xx + xm, yy + ym
+    failed = ~(np.abs(det) >= 1e-6)  # No solution
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xm = -(2 * f * b - c * e) / det
+        ym = -(2 * d * c - b * e) / det
+    column = np.where(failed, np.nan, xx + xm)
+    row = np.where(failed, np.nan, yy + ym)
+    if single_frame:
+        return column[0], row[0]
+    return column, row
 
 
 def _query_solar_system_objects(
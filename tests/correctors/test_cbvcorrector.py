@@ -29,7 +29,7 @@ from lightkurve.correctors.cbvcorrector import (
     KeplerCotrendingBasisVectors,
     TessCotrendingBasisVectors,
 )
-from lightkurve.correctors.cbvcorrector import CBVCorrector
+from lightkurve.correctors.cbvcorrector import CBVCorrector, _align_indices
 from .. import TESTDATA
 
 
@@ -141,6 +141,14 @@ def test_CotrendingBasisVectors_nonretrieval():
         cbv_designmatrix = cbvs.to_designmatrix(cbv_indices=[1])
     assert np.all(cbv_designmatrix["VECTOR_1"][[0, 1, 2, 4]] == [1.0, 2.0, 3.0, 6.0])
     assert np.all(np.isnan(cbv_designmatrix["VECTOR_1"][[3, 5]]))
+    # The alignment indices are reused for another CBV set on the same cadences
+    hits = _align_indices.cache_info().hits
+    dataTbl["VECTOR_1"] = [10.0, 20.0, 30.0, 50.0, 60.0]
+    cbvs2 = CotrendingBasisVectors(dataTbl, cbvTime).align(sample_lc)
+    assert _align_indices.cache_info().hits == hits + 1
+    assert_array_equal(cbvs2.cadenceno, cbvs.cadenceno)
+    assert_array_equal(cbvs2.time.value, cbvs.time.value)
+    assert_array_equal(cbvs2["VECTOR_1"].value, 10 * cbvs["VECTOR_1"].value)
 
     # ***
     # interpolate
@@ -330,6 +338,73 @@ def test_cbv_local():
     assert cbvs.module == 8
     assert cbvs.output == 4
 
+def test_cbv_store(tmp_path, monkeypatch):
+    """Tests that CBVs are downloaded once into the local CBV store and then
+    read back from it without any network access."""
+    import os
+    import shutil
+    from lightkurve.correctors import cbvcorrector
+
+    monkeypatch.setattr(cbvcorrector, "_cbv_store_dir", lambda: str(tmp_path))
+    fname = "tess2019085135100-s0010-2-4-0140-s_cbv.fits"
+    url = "https://archive.stsci.edu/missions/tess/ffi/s0010/" + fname
+    requested = []
+
+    def urlopen(curl_url):
+        requested.append(curl_url)
+        return [("curl -C - -L -o {} {}\n".format(fname, url)).encode()]
+
+    class Response:
+        def __init__(self, url):
+            requested.append(url)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            with open(os.path.join(TESTDATA, fname), "rb") as fp:
+                yield fp.read()
+
+    monkeypatch.setattr(cbvcorrector.urllib.request, "urlopen", urlopen)
+    monkeypatch.setattr(cbvcorrector.requests, "get", lambda url, stream: Response(url))
+
+    cbvs = load_tess_cbvs(sector=10, camera=2, ccd=4, cbv_type="SingleScale")
+    assert isinstance(cbvs, TessCotrendingBasisVectors)
+    assert cbvs.sector == 10
+    assert len(requested) == 2
+    assert os.path.exists(tmp_path / fname)
+    assert os.path.exists(tmp_path / "index.json")
+
+    # A second band of the same file is read from the store
+    cbvs2 = load_tess_cbvs(
+        sector=10, camera=2, ccd=4, cbv_type="MultiScale", band=2
+    )
+    assert cbvs2.band == 2
+    assert len(requested) == 2
+    # Repeated loads return independent copies of the parsed CBVs
+    cbvs3 = load_tess_cbvs(sector=10, camera=2, ccd=4, cbv_type="SingleScale")
+    assert cbvs3 is not cbvs
+    cbvs3.time.format = "iso"
+    assert cbvs.time.format != "iso"
+    assert_array_equal(cbvs3["VECTOR_1"], cbvs["VECTOR_1"])
+
+    # A Kepler file placed in the store is found through the index
+    kepler_fname = "kplr2011073133259-q08-d25_lcbv.fits"
+    shutil.copy(os.path.join(TESTDATA, kepler_fname), tmp_path)
+    index = cbvcorrector._read_manifest(str(tmp_path / "index.json"))
+    index["Kepler-q08"] = kepler_fname
+    cbvcorrector._write_manifest(str(tmp_path / "index.json"), index)
+    cbvs = load_kepler_cbvs(mission="Kepler", quarter=8, module=16, output=4)
+    assert cbvs.quarter == 8
+    assert len(requested) == 2
+
+
 # *******************************************************************************
 # *******************************************************************************
 # *******************************************************************************
@@ -413,6 +488,25 @@ def test_CBVCorrector():
     # There should be virtually no change in the flux
     assert_allclose(lc.flux, sample_lc.remove_nans().flux)
 
+    # The over-fitting metric reuses the periodograms of the original light
+    # curve as long as the cadence mask does not change
+    cbvCorrector.correct_gaussian_prior(
+        cbv_type=None, cbv_indices=None, alpha=1e-2, ext_dm=dm
+    )
+    metric = cbvCorrector.over_fitting_metric(n_samples=3)
+    cache = cbvCorrector._over_fitting_cache[1]
+    assert cbvCorrector.over_fitting_metric(n_samples=3) == metric
+    assert cbvCorrector._over_fitting_cache[1] is cache
+    cbvCorrector.correct_gaussian_prior(
+        cbv_type=None,
+        cbv_indices=None,
+        alpha=1e-2,
+        ext_dm=dm,
+        cadence_mask=np.array([True, True, False, True]),
+    )
+    cbvCorrector.over_fitting_metric(n_samples=3)
+    assert cbvCorrector._over_fitting_cache[1] is not cache
+
     # ***
     # Correction optimizer
     # The optimizer cannot be run without downloading targest from MAST for use
@@ -430,6 +524,41 @@ def test_CBVCorrector():
         )
 
 
+def test_CBVCorrector_optimizer():
+    """The alpha optimizer reuses the normal equations across alpha values,
+    and ends with the fit of the optimized alpha."""
+    rng = np.random.default_rng(0)
+    size = 2000
+    time = np.arange(size) / 48.0
+    X = np.vstack([np.sin(time / 3), (time / time.max()) ** 2]).T
+    flux = 1000 + X.dot([20, 50]) + rng.normal(0, 1, size)
+    lc = TessLightCurve(
+        time=time + 2000,
+        flux=flux,
+        flux_err=np.ones(size),
+        cadenceno=np.arange(size),
+        flux_unit=u.Unit("electron / second"),
+    )
+    dm = DesignMatrix(pd.DataFrame({"a": X[:, 0], "b": X[:, 1]}))
+    cbvCorrector = CBVCorrector(lc, do_not_load_cbvs=True)
+    # Only use the over-fitting metric, the under-fitting one needs MAST
+    corrected_lc = cbvCorrector.correct(
+        cbv_type=None, cbv_indices=None, ext_dm=dm, target_under_score=-1
+    )
+    assert cbvCorrector._alpha_normal_equations is None
+    assert len(cbvCorrector._goodness_metric_cache) > 1
+    assert cbvCorrector.under_fitting_score == -1.0
+    assert 0 < cbvCorrector.over_fitting_score <= 1
+
+    # The final correction is the one of the optimized alpha
+    coefficients = cbvCorrector.coefficients
+    lc2 = cbvCorrector.correct_gaussian_prior(
+        cbv_type=None, cbv_indices=None, alpha=cbvCorrector.alpha, ext_dm=dm
+    )
+    assert_allclose(cbvCorrector.coefficients, coefficients)
+    assert_allclose(lc2.flux, corrected_lc.flux)
+
+
 @pytest.mark.remote_data
 def test_CBVCorrector_retrieval():
     """Tests CBVCorrector by retrieving some sample Kepler/TESS light curves
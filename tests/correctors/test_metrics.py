@@ -4,10 +4,12 @@ from numpy.testing import assert_allclose
 
 from lightkurve import LightCurve, search_lightcurve
 from lightkurve.correctors.metrics import (
+    OverfitMetricCache,
     overfit_metric_lombscargle,
     underfit_metric_neighbors,
     _compute_correlation,
-    _align_to_lc,
+    _align_flux_to_lc,
+    _neighbor_store_path,
 )
 
 
@@ -34,6 +36,31 @@ def test_overfit_metric_lombscargle():
     assert overfit_metric_lombscargle(lc_flat, lc_sine) > 0.5
 
 
+def test_overfit_metric_cache():
+    """The cached spectra should give the same metric as fresh ones."""
+    time = np.arange(1, 100, 0.1)
+    rng = np.random.default_rng(0)
+    lc_orig = LightCurve(time=time, flux=np.sin(time) + 10, flux_err=0.1)
+    lc_corr = LightCurve(
+        time=time, flux=10 + rng.normal(0, 0.1, len(time)), flux_err=0.1
+    )
+
+    cache = OverfitMetricCache(lc_orig)
+    np.random.seed(42)
+    expected = overfit_metric_lombscargle(lc_orig, lc_corr, n_samples=3)
+    np.random.seed(42)
+    assert_allclose(
+        overfit_metric_lombscargle(None, lc_corr, n_samples=3, cache=cache), expected
+    )
+    # The noise realizations are reused, and only extended if more are needed
+    noise_power = cache.noise_power(3)
+    assert_allclose(cache.noise_power(2), noise_power[:2])
+    assert_allclose(cache.noise_power(5)[:3], noise_power)
+    assert overfit_metric_lombscargle(None, lc_corr, n_samples=3, cache=cache) == (
+        overfit_metric_lombscargle(None, lc_corr, n_samples=3, cache=cache)
+    )
+
+
 @pytest.mark.remote_data
 def test_underfit_metric_neighbors():
     """Sanity checks for `underfit_metric_neighbors`."""
@@ -54,6 +81,91 @@ def test_underfit_metric_neighbors():
     assert underfit_metric_neighbors(lc_sap, min_targets=3, max_targets=3) == 1.0
 
 
+def test_underfit_metric_neighbor_store(tmp_path, monkeypatch):
+    """The neighboring light curves are only downloaded once, and the metric
+    matches the one computed from the full correlation matrix."""
+    from astropy.table import Table
+    from lightkurve import LightCurveCollection, TessLightCurve
+    from lightkurve.correctors import metrics
+
+    monkeypatch.setattr(metrics, "_neighbor_store_dir", lambda: str(tmp_path))
+    rng = np.random.default_rng(0)
+    size, n_neighbors = 300, 5
+    time = 2000 + np.arange(size) / 720.0
+    systematics = np.sin(np.arange(size) / 20.0)
+    neighbors = {}
+    for idx in range(n_neighbors):
+        flux = 1000 + 5 * systematics + rng.normal(0, 1, size)
+        # The neighbors are missing different cadences
+        keep = np.ones(size, bool)
+        keep[rng.choice(size, 10, replace=False)] = False
+        neighbors[str(idx)] = TessLightCurve(
+            time=time[keep], flux=flux[keep], flux_err=np.ones(keep.sum()),
+            cadenceno=np.arange(size)[keep], targetid=idx,
+        )
+        neighbors[str(idx)]["sap_flux"] = neighbors[str(idx)].flux
+    downloaded = []
+
+    class FakeSearchResult:
+        def __init__(self, table):
+            self.table = table
+
+        def __len__(self):
+            return len(self.table)
+
+        def __getitem__(self, key):
+            return FakeSearchResult(self.table[key])
+
+        def download_all(self, flux_column, quality_bitmask, n_workers):
+            downloaded.extend(self.table["target_name"])
+            return LightCurveCollection([neighbors[n] for n in self.table["target_name"]])
+
+    table = Table({
+        "author": ["SPOC"] * n_neighbors,
+        "target_name": [str(idx) for idx in range(n_neighbors)],
+        "mission": ["TESS Sector 10"] * n_neighbors,
+        "exptime": [120.0] * n_neighbors,
+        "productFilename": [
+            "tess2019058134432-s0010-{:016d}-0140-s_lc.fits".format(idx)
+            for idx in range(n_neighbors)
+        ],
+    })
+    monkeypatch.setattr(
+        TessLightCurve, "search_neighbors",
+        lambda self, **kwargs: FakeSearchResult(table),
+    )
+
+    lc = TessLightCurve(
+        time=time, flux=1000 + 3 * systematics + rng.normal(0, 1, size),
+        flux_err=np.ones(size), cadenceno=np.arange(size), ra=10.0, dec=20.0,
+    )
+    metric = underfit_metric_neighbors(lc, min_targets=3, max_targets=5)
+    assert sorted(downloaded) == sorted(table["target_name"])
+    assert len(list(tmp_path.glob("*.npz"))) == n_neighbors
+
+    # Reference: the full correlation matrix of the aligned fluxes
+    target = lc.copy().remove_nans().normalize()
+    target -= 1.0
+    fluxMatrix = np.column_stack(
+        [_align_flux_to_lc((n.normalize() - 1.0), target) for n in neighbors.values()]
+        + [target.flux.value]
+    )
+    fluxMatrix = fluxMatrix[~np.isnan(fluxMatrix).any(axis=1)]
+    correlation = _compute_correlation(fluxMatrix)
+    correlation[-1, -1] = 0.0
+    wgn = 0.0007 + 0.8083 * len(fluxMatrix) ** -0.5023
+    scale = np.log(2.0 / 0.95 - 1.0) / wgn
+    expected = 2.0 / (1 + np.exp(scale * np.mean(np.abs(correlation[:, -1]) ** 3)))
+    assert_allclose(metric, expected)
+    assert metric < 0.95
+
+    # Another target sharing the neighbors reads them from the store
+    lc2 = lc.copy()
+    lc2.meta["RA"] = 10.1
+    assert_allclose(underfit_metric_neighbors(lc2, min_targets=3, max_targets=5), metric)
+    assert len(downloaded) == n_neighbors
+
+
 def test_compute_correlation():
     """ Simple test to verify the correction function works"""
 
@@ -96,6 +208,26 @@ def test_align_to_lc():
     lc1 = lc1[0:10].append(lc1[20:100])
     lc2 = lc2[0:50].append(lc2[70:100])
 
-    aligned_lc2 = _align_to_lc(lc2, lc1)
-
-    assert np.all(lc1['cadenceno'] == aligned_lc2['cadenceno'])
+    aligned_flux = _align_flux_to_lc(lc2, lc1)
+
+    assert len(aligned_flux) == len(lc1)
+    expected = np.where(np.isin(lc1['cadenceno'], lc2['cadenceno']), 2.0, np.nan)
+    assert_allclose(aligned_flux, expected)
+
+    # Unsorted cadences are returned sorted by cadence number
+    assert_allclose(_align_flux_to_lc(lc2[::-1], lc1), expected)
+
+
+def test_neighbor_store_path():
+    """Each product has its own entry in the neighbor store."""
+    # The monthly short cadence files of a Kepler quarter
+    rows = [
+        {"author": "Kepler", "target_name": "kplr011904151", "mission": "Kepler Quarter 09",
+         "exptime": 60.0, "productFilename": "kplr011904151-{}_slc.fits".format(date)}
+        for date in ["2011116030358", "2011145075126", "2011177032512"]
+    ]
+    paths = [_neighbor_store_path(row, "sap_flux", "default") for row in rows]
+    assert len(set(paths)) == 3
+    assert paths[0].endswith("kplr011904151-2011116030358_slc_sap_flux_default.npz")
+    assert _neighbor_store_path(rows[0], "pdcsap_flux", "default") != paths[0]
+    assert _neighbor_store_path(rows[0], "sap_flux", "hard") != paths[0]
@@ -8,6 +8,7 @@ import pytest
 
 from lightkurve import LightCurve, LightkurveWarning
 from lightkurve.correctors import RegressionCorrector, DesignMatrix
+from lightkurve.correctors.regressioncorrector import _model_error, _NormalEquations
 
 
 def test_regressioncorrector_priors():
@@ -116,3 +117,154 @@ def test_zero_fluxerr():
     lc = LightCurve(flux=[5, 10], flux_err=[1, -10])
     with pytest.raises(ValueError):
         RegressionCorrector(lc)
+
+
+def test_solvers():
+    """All solvers should agree with the dense solver of the normal equations,
+    which are updated rather than rebuilt between sigma-clipping iterations."""
+    size = 200
+    time = np.linspace(1, 100, size)
+    noise = np.sin(time / 5)
+    flux = 1 + noise + np.random.default_rng(0).normal(0, 0.01, size)
+    flux[[10, 50, 150]] += 1  # outliers
+    lc = LightCurve(time=time, flux=flux, flux_err=0.01 * np.ones(size))
+    design_matrix = DesignMatrix(
+        {"noise": noise, "offset": np.ones(size)}, name="noise_model"
+    )
+    design_matrix.prior_mu = [0.5, 0.5]
+    design_matrix.prior_sigma = [10, 10]
+
+    for dm in [design_matrix, design_matrix.to_sparse()]:
+        rc = RegressionCorrector(lc)
+        rc.correct(dm, solver="dense", propagate_errors=True)
+        assert rc.outlier_mask[[10, 50, 150]].all()
+        for solver in ["auto", "cholesky", "sparse", "eigh"]:
+            rc2 = RegressionCorrector(lc)
+            rc2.correct(dm, solver=solver, propagate_errors=True)
+            assert_almost_equal(rc2.coefficients, rc.coefficients)
+            assert_almost_equal(rc2.coefficients_err, rc.coefficients_err)
+            assert (rc2.outlier_mask == rc.outlier_mask).all()
+
+        # A single fit on the final mask gives the same coefficients
+        mask = rc.cadence_mask & ~rc.outlier_mask
+        w, _ = rc._fit_coefficients(
+            cadence_mask=mask, prior_mu=rc.dmc.prior_mu, prior_sigma=rc.dmc.prior_sigma
+        )
+        assert_almost_equal(w, rc.coefficients)
+
+    with pytest.raises(ValueError):
+        RegressionCorrector(lc).correct(design_matrix, solver="qr")
+
+
+def test_sparse_solver_stays_sparse(monkeypatch):
+    """The 'sparse' solver must not densify the sparse normal matrix."""
+    from scipy import sparse
+
+    rng = np.random.default_rng(0)
+    X = sparse.random(200, 20, density=0.1, format="csr", random_state=0)
+    X = X + sparse.eye(200, 20, format="csr")
+    flux = X.dot(np.arange(20.0)) + rng.normal(0, 0.1, 200)
+    ne = _NormalEquations(X, flux, 0.1 * np.ones(200))
+    ne.update(np.ones(200, bool))
+    expected, expected_err = ne.solve(
+        np.zeros(20), np.ones(20), propagate_errors=True, solver="dense"
+    )
+
+    def toarray(self, *args, **kwargs):
+        raise AssertionError("the normal matrix was densified")
+
+    for cls in [sparse.csr_matrix, sparse.csc_matrix]:
+        monkeypatch.setattr(cls, "toarray", toarray)
+    w, w_err = ne.solve(np.zeros(20), np.ones(20), propagate_errors=True, solver="sparse")
+    assert_almost_equal(w, expected)
+    assert_almost_equal(w_err, expected_err)
+
+
+def test_normal_equations_cache():
+    """The eigendecomposition of the normal equations is reused for new
+    prior widths and cadence masks seen before."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(100, 3))
+    flux = X.dot([1, 2, 3]) + rng.normal(0, 0.1, 100)
+    flux_err = 0.1 * np.ones(100)
+    mask = np.ones(100, bool)
+    mask2 = mask.copy()
+    mask2[:10] = False
+
+    ne = _NormalEquations(X, flux, flux_err, cache_size=2)
+    reference = _NormalEquations(X, flux, flux_err)
+    for m in [mask, mask2, mask]:
+        ne.update(m)
+        reference.update(m)
+        for sigma in [1e-2, 1.0, 1e2]:
+            prior_mu, prior_sigma = np.zeros(3), sigma * np.ones(3)
+            w, w_err = ne.solve(prior_mu, prior_sigma, True, solver="eigh")
+            w2, w2_err = reference.solve(prior_mu, prior_sigma, True, solver="dense")
+            assert_almost_equal(w, w2)
+            assert_almost_equal(w_err, w2_err)
+        assert ne._eigh is not None
+    assert len(ne._cache) == 2
+    # The cache is only used for the 'eigh' solver with equal prior widths
+    w, _ = ne.solve(np.zeros(3), np.array([1.0, 2.0, 3.0]), solver="eigh")
+    w2, _ = reference.solve(np.zeros(3), np.array([1.0, 2.0, 3.0]), solver="dense")
+    assert_almost_equal(w, w2)
+
+
+def test_normal_equations_drift():
+    """After many mask changes, the updated normal equations must match the
+    ones built from scratch, and be rebuilt after `max_updates` updates."""
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(500, 4)) * [1, 1e2, 1e4, 1e6]
+    flux = X.dot([1, 2, 3, 4]) + rng.normal(0, 0.1, 500)
+    flux_err = rng.uniform(0.05, 0.2, 500)
+
+    ne = _NormalEquations(X, flux, flux_err, cache_size=16, max_updates=20)
+    n_updates = []
+    for _ in range(200):
+        mask = rng.random(500) > 0.05
+        ne.update(mask)
+        n_updates.append(ne._n_updates)
+        fresh = _NormalEquations(X, flux, flux_err)
+        fresh.update(mask)
+        assert np.abs(ne.A - fresh.A).max() <= 1e-12 * np.abs(fresh.A).max()
+        assert np.abs(ne.B - fresh.B).max() <= 1e-12 * np.abs(fresh.B).max()
+    assert max(n_updates) == 20
+    assert n_updates.count(0) >= 200 // 21
+
+
+def test_propagate_errors():
+    """The analytic model uncertainties should match `diag(X cov X^T)`,
+    and agree with the ones estimated by sampling the weights."""
+    size = 200
+    time = np.linspace(1, 100, size)
+    noise = np.sin(time / 5)
+    flux = 1 + noise + np.random.default_rng(0).normal(0, 0.01, size)
+    lc = LightCurve(time=time, flux=flux, flux_err=0.01 * np.ones(size))
+    design_matrix = DesignMatrix(
+        {"noise": noise, "offset": np.ones(size)}, name="noise_model"
+    )
+    X = design_matrix.values
+    for dm in [design_matrix, design_matrix.to_sparse()]:
+        rc = RegressionCorrector(lc)
+        rc.correct(dm, propagate_errors=True)
+        expected = np.sqrt(np.diag(X.dot(rc.coefficients_err).dot(X.T)))
+        assert_almost_equal(rc.model_lc.flux_err.value, expected)
+        # Computing the uncertainties in chunks gives the same result
+        assert_almost_equal(
+            _model_error(rc.dmc.X, rc.coefficients_err, max_chunk_size=7), expected
+        )
+
+        # The sampled uncertainties are reproducible and close to the analytic ones
+        sampled = rc.correct(dm, propagate_errors="sampling").flux_err
+        assert_almost_equal(
+            rc.correct(dm, propagate_errors="sampling").flux_err.value, sampled.value
+        )
+        assert np.allclose(rc.model_lc.flux_err.value, expected, rtol=0.3)
+
+        # Any truthy value other than a string selects the analytic uncertainties
+        for value in [np.True_, 1]:
+            rc.correct(dm, propagate_errors=value)
+            assert_almost_equal(rc.model_lc.flux_err.value, expected)
+
+    with pytest.raises(ValueError):
+        rc.correct(design_matrix, propagate_errors="bootstrap")
@@ -183,3 +183,44 @@ def test_splines():
     assert np.allclose(spline_dense.values, spline_sparse.values)
     assert isinstance(spline_dense, DesignMatrix)
     assert isinstance(spline_sparse, SparseDesignMatrix)
+
+
+def test_sparse_spline_basis():
+    """The sparse spline basis should match the Cox-de Boor recursion and be cached."""
+
+    def basis_vector(x, degree, i, knots):
+        if degree == 0:
+            return ((x >= knots[i]) & (x < knots[i + 1])).astype(float)
+        B = np.zeros(len(x))
+        if knots[i + degree] != knots[i]:
+            B += (x - knots[i]) / (knots[i + degree] - knots[i]) * basis_vector(
+                x, degree - 1, i, knots
+            )
+        if knots[i + degree + 1] != knots[i + 1]:
+            B += (knots[i + degree + 1] - x) / (
+                knots[i + degree + 1] - knots[i + 1]
+            ) * basis_vector(x, degree - 1, i + 1, knots)
+        return B
+
+    x = np.linspace(0, 1, 100)
+    for degree in [0, 1, 3]:
+        knots = np.array([0, 0.1, 0.3, 0.6, 0.9, 1])
+        t = np.concatenate([[0] * degree, knots, [1] * degree])
+        expected = np.array(
+            [basis_vector(x, degree, i, t) for i in range(len(t) - degree - 1)]
+        ).T
+        expected[-1, -1] = 1  # The last knot is included in the last interval
+        dm = create_sparse_spline_matrix(x, knots=[0.1, 0.3, 0.6, 0.9], degree=degree)
+        assert isinstance(dm.X, sparse.csr_matrix)
+        assert np.allclose(dm.values, expected)
+        # The basis forms a partition of unity
+        assert np.allclose(dm.values.sum(axis=1), 1)
+
+    # Calls with the same inputs reuse the cached basis, but not the same matrix
+    dm2 = create_sparse_spline_matrix(x, knots=[0.1, 0.3, 0.6, 0.9], degree=3)
+    assert dm2.X is not dm.X
+    assert (dm2.X != dm.X).nnz == 0
+
+    # Basis vectors without any data are dropped
+    dm = create_sparse_spline_matrix(x, knots=[0.1, 0.3, 0.6, 0.9, 2], degree=1)
+    assert dm.shape == (100, 6)
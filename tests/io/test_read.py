@@ -4,6 +4,7 @@ import warnings
 import tempfile
 import tracemalloc
 
+import numpy as np
 import pytest
 
 from astropy.io import fits
@@ -50,6 +51,66 @@ def test_read_lc_in_hdu():
     assert len(lc.flux) > 0, "LC should be functional even the hdul is closed."
 
 
+@pytest.mark.filterwarnings("error::ResourceWarning")
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_read_single_open():
+    """Local files are opened once; the path must still be reported as the filename."""
+    filename_lc = os.path.join(TESTDATA, "test-lc-tess-pimen-100-cadences.fits")
+    lc = read(filename_lc)
+    assert lc.meta["FILENAME"] == filename_lc
+    assert lc.meta["AUTHOR"] == "SPOC"
+    with fits.open(filename_lc) as hdul:
+        lc_hdul = read(hdul)
+        assert lc_hdul.meta["FILENAME"] == filename_lc
+    assert (lc.flux == lc_hdul.flux).all()
+
+    k2_path = os.path.join(TESTDATA, "test-tpf-star.fits")
+    tpf = read(k2_path, quality_bitmask="hard")
+    assert tpf.path == k2_path
+    assert tpf.quality_bitmask == "hard"
+    tpf.hdu.close()
+
+
+@pytest.mark.filterwarnings("ignore::astropy.units.UnitsWarning")
+@pytest.mark.parametrize(
+    "fits_name",
+    ["test-lc-tess-pimen-100-cadences.fits", "test-sparcs-jdref.fits", "test-tpf-star.fits"],
+)
+def test_read_fits_table(fits_name):
+    """The fast table reader must agree with `Table.read`."""
+    from astropy.table import Table
+    from lightkurve.io.generic import _read_fits_table, _fix_unit
+
+    with fits.open(os.path.join(TESTDATA, fits_name)) as hdul:
+        expected = Table.read(hdul[1], format="fits")
+        tab = _read_fits_table(hdul[1])
+        assert tab.colnames == [name.lower() for name in expected.colnames]
+        assert tab.meta == expected.meta
+        for name in expected.colnames:
+            col = tab[name.lower()]
+            assert type(col) is type(expected[name])
+            assert col.format == expected[name].format
+            if expected[name].unit is not None:
+                assert col.unit == _fix_unit(expected[name].unit)
+            assert np.array_equal(col, expected[name], equal_nan=True)
+
+
+@pytest.mark.filterwarnings("ignore::astropy.units.UnitsWarning")
+def test_read_fits_table_fallback(monkeypatch):
+    """Tables must still be read if AstroPy's private TDISPn helper goes away."""
+    from astropy.table import Table
+    from lightkurve.io import generic
+
+    monkeypatch.setattr(generic, "_fortran_to_python_format", None)
+    with fits.open(os.path.join(TESTDATA, "test-lc-tess-pimen-100-cadences.fits")) as hdul:
+        expected = Table.read(hdul[1], format="fits")
+        tab = generic._read_fits_table(hdul[1])
+        assert tab.colnames == [name.lower() for name in expected.colnames]
+        assert tab.meta == expected.meta
+        lc = generic.read_generic_lightcurve(hdul, flux_column="pdcsap_flux", time_format="btjd")
+        assert np.array_equal(lc.flux.value, expected["PDCSAP_FLUX"], equal_nan=True)
+
+
 def test_read_lc_cloud():
     """Read a lightcurve file from AWS S3 cloud"""
     cloud_uri = 's3://stpubdata/tess/public/tid/s0015/0000/0003/7542/2201/tess2019226182529-s0015-0000000375422201-0151-s_lc.fits'
@@ -117,6 +178,38 @@ def test_read_tpf_collection():
     assert isinstance(collection, TargetPixelFileCollection)
 
 
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_read_collection_parallel(caplog, use_threads):
+    """Reading a collection with workers must give the same, ordered results."""
+    lc_path = os.path.join(TESTDATA, "test-lc-tess-pimen-100-cadences.fits")
+    tpf_path = os.path.join(TESTDATA, "test-tpf-star.fits")
+    tess_tpf_path = os.path.join(TESTDATA, "tess25155310-s01-first-cadences.fits.gz")
+    path_list = [tpf_path, lc_path, "nonexistent.fits", tess_tpf_path]
+
+    collection = read_lc_collection(path_list, n_workers=2, use_threads=use_threads)
+    assert isinstance(collection, LightCurveCollection)
+    assert len(collection) == 1
+    assert collection[0].meta["FILENAME"] == lc_path
+    warnings = [rec.message for rec in caplog.records if rec.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert "Unable to read nonexistent.fits" in warnings[0]
+
+    stitched = read_lc_collection([lc_path, lc_path], stitch=True, n_workers=2, use_threads=use_threads)
+    expected = read_lc_collection([lc_path, lc_path]).stitch()
+    assert isinstance(stitched, LightCurve)
+    assert (stitched.flux == expected.flux).all()
+
+    tpfs = read_tpf_collection(path_list, n_workers=2, use_threads=use_threads)
+    assert isinstance(tpfs, TargetPixelFileCollection)
+    assert [tpf.path for tpf in tpfs] == [tpf_path, tess_tpf_path]
+    assert isinstance(tpfs[0], KeplerTargetPixelFile)
+    assert isinstance(tpfs[1], TessTargetPixelFile)
+    assert tpfs[1].flux.shape == read(tess_tpf_path).flux.shape
+
+    with pytest.raises(ValueError):
+        read_lc_collection(path_list, n_workers=0)
+
+
 def test_open():
     """Does the deprecated `open` function still work?"""
     from lightkurve.io import open
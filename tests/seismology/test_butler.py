@@ -2,11 +2,15 @@ import pytest
 from astropy import units as u
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.signal import unit_impulse as deltafn
+from scipy.signal import find_peaks, unit_impulse as deltafn
+from numpy.testing import assert_array_equal
+
+from lightkurve import LightCurve
 
 from lightkurve.search import search_lightcurve
 from lightkurve.periodogram import Periodogram
 from lightkurve.periodogram import SNRPeriodogram
+from lightkurve.seismology import Seismology
 
 
 @pytest.mark.remote_data
@@ -136,6 +140,28 @@ def test_estimate_numax_kwargs():
     assert numax.unit == u.microhertz
 
 
+def test_estimate_numax_acf2d_matches_loop():
+    """The batched ACF2D must match autocorrelating each window in turn."""
+    from lightkurve.seismology import utils
+
+    f, p, true_numax, _ = generate_test_spectrum()
+    np.random.seed(5)
+    p = p * np.random.chisquare(2, len(p)) / 2
+    snr = SNRPeriodogram(f * u.microhertz, u.Quantity(p, None))
+    # Also use a periodogram which does not start at zero frequency
+    for pg in [snr, snr[snr.frequency.value > 1000.3]]:
+        numax = pg.to_seismology().estimate_numax(window_width=250.0, spacing=5.0)
+        diagnostics = numax.diagnostics
+        fs = np.median(np.diff(pg.frequency.value))
+        for idx, trial in enumerate(diagnostics["numaxs"]):
+            acf = utils.autocorrelate(pg, trial, window_width=250.0, frequency_spacing=fs)
+            assert np.allclose(diagnostics["acf2d"][:, idx], acf, rtol=1e-9, atol=1e-9)
+            assert np.isclose(
+                diagnostics["metric"][idx], (np.sum(np.abs(acf)) - 1) / len(acf)
+            )
+        assert np.isclose(numax.value, true_numax, atol=0.1 * true_numax)
+
+
 def test_plot_numax_diagnostics():
     """Test if we can estimate numax using the diagnostics function, and that
     it returns a correct metric when requested
@@ -177,6 +203,37 @@ def test_plot_numax_diagnostics():
     assert len(numax.diagnostics["metric"]) == len(numaxs)
 
 
+def test_autocorrelate_matches_correlate():
+    """The FFT-based ACF must match `np.correlate` and find the same deltanu peaks."""
+    from lightkurve.seismology import utils
+
+    f, p, true_numax, _ = generate_test_spectrum()
+    snr = SNRPeriodogram(f * u.microhertz, u.Quantity(p, None))
+    fs = np.median(np.diff(f))
+    for window_width in [25.0, 250.0, 1001.0]:
+        acf = utils.autocorrelate(snr, true_numax, window_width=window_width)
+        spread = int(window_width / 2 / fs)
+        xt = int(true_numax / fs)
+        p_sel = p[xt - spread : xt + spread] - np.nanmean(p[xt - spread : xt + spread])
+        expected = np.correlate(p_sel, p_sel, mode="full")[len(p_sel) - 1 :]
+        assert len(acf) == len(expected)
+        assert np.allclose(acf, expected, rtol=1e-9, atol=1e-9 * expected[0])
+
+    deltanu = snr.to_seismology().estimate_deltanu(numax=true_numax)
+    diagnostics = deltanu.diagnostics
+    width = len(diagnostics["acf"])
+    p_sel = p[int(true_numax / fs) - width // 2 : int(true_numax / fs) + width // 2]
+    p_sel = p_sel - np.mean(p_sel)
+    aacf = np.correlate(p_sel, p_sel, mode="full")[len(p_sel) - 1 :]
+    expected = (np.abs(aacf ** 2) / np.abs(aacf[0] ** 2)) / (3 / (2 * len(aacf)))
+    assert np.allclose(diagnostics["acf"], expected, rtol=1e-6, atol=1e-9)
+    peaks, _ = find_peaks(
+        expected[diagnostics["sel"]],
+        distance=np.floor(diagnostics["deltanu_emp"] / 2.0 / fs),
+    )
+    assert_array_equal(diagnostics["peaks"], peaks)
+
+
 def test_estimate_deltanu_basics():
     """Test if we can estimate a deltanu"""
     f, p, _, true_deltanu = generate_test_spectrum()
@@ -314,6 +371,45 @@ def test_stellar_estimator_calls():
         log = butler.estimate_logg()
 
 
+def test_run_many():
+    """Seismology.run_many should match the one-star-at-a-time pipeline."""
+    t = np.arange(0, 20, 120 / 86400.0)
+    lcs = []
+    for idx, numax in enumerate([900.0, 1000.0, 1100.0]):
+        rng = np.random.default_rng(idx)
+        deltanu = 0.294 * numax ** 0.772
+        flux = 1 + rng.normal(0, 1e-4, len(t))
+        for n in range(-6, 7):
+            for nu in [numax + n * deltanu, numax + (n + 0.1) * deltanu]:
+                flux += 1e-4 * np.exp(-0.5 * (n / 3) ** 2) * np.sin(
+                    2 * np.pi * nu * 1e-6 * 86400 * t + rng.uniform(0, 2 * np.pi)
+                )
+        lcs.append(LightCurve(time=t, flux=flux, meta={"LABEL": "star{}".format(idx)}))
+    lcs[2].meta["TEFF"] = 5000
+
+    results = Seismology.run_many(lcs, teff=[4800, 4900, None])
+    assert_array_equal(results["label"], ["star0", "star1", "star2"])
+    for idx, lc in enumerate(lcs):
+        seismology = Seismology.from_lightcurve(lc, normalization="psd")
+        assert results["numax"][idx] == seismology.estimate_numax().value
+        assert results["deltanu"][idx] == seismology.estimate_deltanu().value
+    assert np.isfinite(results["mass"][:2]).all()
+    assert results["radius"][0] == seismology.estimate_radius(
+        4800, numax=results["numax"][0], deltanu=results["deltanu"][0]
+    ).value
+    assert np.isnan(results["mass"][2])
+
+    # The effective temperature is read from the meta data by default
+    results = Seismology.run_many(lcs, n_workers=2)
+    assert np.isnan(results["logg"][:2]).all()
+    assert np.isfinite(results["logg"][2])
+    assert results["numax"].unit == u.microhertz
+
+    # Stars for which an estimator fails are filled with NaN values
+    results = Seismology.run_many(lcs, numax_kwargs={"numaxs": [1e5]})
+    assert np.isnan(results["numax"]).all()
+
+
 def test_plot_echelle():
     f, p, numax, deltanu = generate_test_spectrum()
     numax *= u.microhertz
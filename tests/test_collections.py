@@ -408,3 +408,68 @@ def test_unmergeable_columns():
         LightCurveCollection([lc1, lc2]).stitch()
     with pytest.warns(LightkurveWarning, match="column types are incompatible"):
         lc1.append(lc2)
+
+
+@pytest.mark.parametrize(
+    "flatten_kwargs",
+    [
+        dict(),
+        dict(window_length=51, polyorder=3, niters=5),
+        dict(break_tolerance=None),
+        dict(window_length=601),  # longer than the segments after the gap
+        dict(mask=np.arange(950) % 97 < 10),
+    ],
+)
+def test_collection_flatten(flatten_kwargs):
+    """Flattening aligned light curves together must match ``LightCurve.flatten()``."""
+    np.random.seed(42)
+    time = np.delete(np.arange(1000) * 0.02, np.s_[400:450])
+    lcs = []
+    for idx in range(4):
+        flux = 1 + 0.01 * np.sin(time / (3 + idx)) + np.random.normal(0, 1e-3, len(time))
+        flux[np.random.randint(0, len(time), 10)] += 0.05  # outliers
+        flux[np.random.randint(0, len(time), 5)] = np.nan
+        lcs.append(LightCurve(time=time, flux=flux, flux_err=1e-3 * np.ones(len(time))))
+    # masked flux, as in SPOC TESS light curves
+    lcs[-1].flux = Masked(lcs[-1].flux, mask=np.arange(len(time)) % 13 == 0)
+
+    flat_lcc, trend_lcc = LightCurveCollection(lcs).flatten(return_trend=True, **flatten_kwargs)
+    assert len(flat_lcc) == len(lcs)
+    for lc, flat_lc, trend_lc in zip(lcs, flat_lcc, trend_lcc):
+        expected_flat_lc, expected_trend_lc = lc.flatten(return_trend=True, **flatten_kwargs)
+        assert flat_lc.meta["NORMALIZED"]
+        np.testing.assert_allclose(trend_lc.flux.value, expected_trend_lc.flux.value, rtol=1e-10)
+        np.testing.assert_allclose(
+            np.ma.filled(flat_lc.flux.value, np.nan),
+            np.ma.filled(expected_flat_lc.flux.value, np.nan),
+            rtol=1e-10,
+        )
+        np.testing.assert_allclose(flat_lc.flux_err, expected_flat_lc.flux_err, rtol=1e-10)
+
+
+def test_collection_flatten_unaligned():
+    """Light curves with different time stamps are flattened one by one."""
+    lc = LightCurve(time=np.arange(10), flux=np.arange(10) + 10.0)
+    lc2 = LightCurve(time=np.arange(20), flux=np.arange(20) + 10.0)
+    flat_lcc = LightCurveCollection([lc, lc2]).flatten(window_length=3, polyorder=1)
+    for lc, flat_lc in zip([lc, lc2], flat_lcc):
+        np.testing.assert_allclose(
+            flat_lc.flux, lc.flatten(window_length=3, polyorder=1).flux
+        )
+
+
+def test_flatten_many_robustness():
+    """Test various special cases for flatten_many()."""
+    from lightkurve.lightcurve import flatten_many
+
+    time = [1, 2, 3, 4, 5, 6]
+    flux = [[10, 20, 30, 40, 50, 60], [10, 20, 30, 40, 50, 60]]
+    expected_result = np.ones((2, 6))
+    np.testing.assert_allclose(flatten_many(time, flux, window_length=3, polyorder=1), expected_result)
+    # polyorder >= window_length
+    np.testing.assert_allclose(flatten_many(time, flux, window_length=3, polyorder=5), expected_result)
+    # a target without any finite flux
+    flux = [[10, 20, 30, 40, 50, 60], [np.nan] * 6]
+    flat_flux, trend = flatten_many(time, flux, window_length=3, polyorder=1, return_trend=True)
+    np.testing.assert_allclose(flat_flux[0], expected_result[0])
+    assert np.isnan(trend[1]).all()
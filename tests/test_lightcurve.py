@@ -5,7 +5,8 @@ from astropy import units as u
 from astropy.units import Quantity
 from astropy.table import Table, Column, MaskedColumn
 from astropy.time import Time, TimeDelta
-from astropy.timeseries import aggregate_downsample
+from astropy.timeseries import TimeSeries, aggregate_downsample
+from astropy.utils.exceptions import AstropyUserWarning
 
 import matplotlib.pyplot as plt
 import astropy
@@ -19,6 +20,7 @@ import warnings
 
 from lightkurve.io import read
 from lightkurve.lightcurve import LightCurve, KeplerLightCurve, TessLightCurve, rmse, nanstd
+from lightkurve.lightcurve import nanmean_reduceat, nanmedian_reduceat, nansum_reduceat
 from lightkurve.lightcurvefile import KeplerLightCurveFile, TessLightCurveFile
 from lightkurve.targetpixelfile import KeplerTargetPixelFile, TessTargetPixelFile
 from lightkurve.utils import LightkurveWarning, LightkurveDeprecationWarning, LightkurveError
@@ -856,6 +858,74 @@ def test_bin_quality():
         assert_allclose(binned_lc.centroid_row, [2./3, 2])   # Expect mean
 
 
+
+def test_bin_reduceat_kernels():
+    """Test the vectorized aggregate functions used in ``bin()``."""
+    n = np.nan  # for shorthand below
+    data = [n, 3, 4, 9, n] + [1, 2, 5, 9, n] + [4, n]
+    mask = [0, 0, 0, 1, 1] + [0, 0, 0, 0, 0] + [1, 1]
+    indices = [0, 5, 10]
+
+    for vals in [
+        Masked(data * u.dimensionless_unscaled, mask=mask).value,  # MaskedQuantity
+        np.ma.MaskedArray(data=data, mask=mask),  # MaskedColumn
+    ]:
+        assert_allclose(nanmean_reduceat(vals, indices)[:2], [3.5, 4.25])
+        assert_allclose(nanmedian_reduceat(vals, indices)[:2], [3.5, 3.5])
+        assert_allclose(nansum_reduceat(vals, indices), [7, 17, 0])
+        # the bin with all masked values is masked
+        assert nanmean_reduceat(vals, indices).mask[2]
+        assert nanmedian_reduceat(vals, indices).mask[2]
+
+    vals = np.ma.MaskedArray(data=data, mask=mask).filled(np.nan)
+    assert_allclose(nanmean_reduceat(vals, indices), [3.5, 4.25, n])
+    assert_allclose(nanmedian_reduceat(vals, indices), [3.5, 3.5, n])
+    # integer columns, e.g., cadenceno
+    assert_allclose(nanmedian_reduceat(np.arange(6), [0, 3]), [1, 4])
+    assert_allclose(nanmean_reduceat(np.arange(6), [0, 3]), [1, 4])
+
+
+@pytest.mark.parametrize("aggregate_func", [None, np.nanmedian, np.nanmax])
+def test_bin_matches_aggregate_downsample(aggregate_func):
+    """``bin()`` must yield the same result as astropy's ``aggregate_downsample``."""
+    lc = read(get_pkg_data_filename("data/test-lc-tess-pimen-100-cadences.fits"))
+    # create some noncontiguous bins with a gap in the data
+    lc = lc[(lc.time.value < lc.time.value[30]) | (lc.time.value > lc.time.value[60])]
+    time_bin_size = 0.01 * u.day
+    binned_lc = lc.bin(time_bin_size=time_bin_size, aggregate_func=aggregate_func)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", (RuntimeWarning, AstropyUserWarning))
+        expected = aggregate_downsample(
+            lc, time_bin_size=time_bin_size, aggregate_func=aggregate_func
+        )
+        expected_err = aggregate_downsample(
+            TimeSeries(data=dict(time=lc.time.copy(), flux_err=lc.flux_err)),
+            time_bin_size=time_bin_size,
+            aggregate_func=rmse,
+        )
+    def _nan_filled(col):
+        col = getattr(col, "value", col)
+        if isinstance(col, Masked):
+            data, mask = col.unmasked, col.mask
+        else:
+            data, mask = np.ma.getdata(col), np.ma.getmaskarray(col)
+        return np.where(mask, np.nan, np.asarray(data, dtype=float))
+
+    assert len(binned_lc) == len(expected)
+    assert_allclose(binned_lc.time_bin_start.value, expected.time_bin_start.value)
+    for colname in ["flux", "sap_flux", "centroid_col", "quality"]:
+        assert_allclose(_nan_filled(binned_lc[colname]), _nan_filled(expected[colname]))
+    assert_allclose(_nan_filled(binned_lc.flux_err), _nan_filled(expected_err["flux_err"]))
+
+
+def test_bin_with_bin_edge_indices():
+    """``bins`` can be a sequence of indices of the bin edges."""
+    lc = LightCurve(time=np.arange(100), flux=np.arange(100))
+    binned_lc = lc.bin(bins=[0, 10, 50, 99])
+    assert len(binned_lc) == 3
+    assert_allclose(binned_lc.flux[:2], [4.5, 29.5])
+
+
 # TEMPORARILY SKIPPED, cf. https://github.com/lightkurve/lightkurve/issues/663
 @pytest.mark.xfail  # pytest.xfail("aggregate_downsample does not handle bitwise binning correctly")
 def test_binned_quality():
@@ -1985,6 +2055,40 @@ def test_create_transit_mask():
     assert all(f < 0.9 for f in synthetic_lc[mask].flux.value)
 
 
+def test_search_transits():
+    """Test for `LightCurve.search_transits()`."""
+    np.random.seed(3)
+    time = np.arange(0, 27, 0.01)
+    flux = np.ones_like(time) + 0.001 * np.random.randn(len(time))
+    planets = [(3.3, 0.7, 0.12, 0.01), (5.7, 1.9, 0.15, 0.006)]
+    for period, transit_time, duration, depth in planets:
+        flux[np.abs((time - transit_time + period / 2) % period - period / 2) < duration / 2] -= depth
+    lc = LightCurve(time=time, flux=flux, flux_err=np.full(len(time), 0.001))
+
+    candidates = lc.search_transits(max_planets=4)
+    # The search stops once no signal is left
+    assert len(candidates) == 2
+    assert len(candidates.meta["stats"]) == 2
+    for row, (period, transit_time, duration, depth) in zip(candidates, planets):
+        assert_allclose(row["period"].to_value(u.day), period, rtol=0.01)
+        assert_allclose(row["transit_time"].value % period, transit_time, atol=0.02)
+        assert_allclose(row["depth"].value, depth, rtol=0.2)
+        assert row["depth_snr"] >= 7
+        assert row["n_transits"] >= 4
+    # The first iteration is the plain BLS periodogram
+    pg = lc.to_periodogram("bls")
+    assert candidates["period"][0] == pg.period_at_max_power
+    # The depth is the one of the BLS peak
+    best = np.nanargmax(pg.power)
+    assert candidates["depth"][0] == pg.depth[best]
+    assert candidates["depth_err"][0] == pg._BLS_result.depth_err[best]
+
+    assert len(lc.search_transits(max_planets=1)) == 1
+    assert len(lc.search_transits(snr_threshold=1e9)) == 0
+    # The light curve is left untouched
+    assert_array_equal(lc.flux.value, flux)
+
+
 def test_row_repr():
     """Regression test for #830: ensure the repr works for a single row."""
     lc = LightCurve({"time": [1, 2, 3], "flux": [1.0, 1.0, 1.0]})
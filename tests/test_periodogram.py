@@ -3,14 +3,18 @@ import sys
 import pytest
 import numpy as np
 import matplotlib.pyplot as plt
-from numpy.testing import assert_almost_equal, assert_array_equal, assert_equal
+from numpy.testing import assert_allclose, assert_almost_equal, assert_array_equal, assert_equal
 
 from astropy import units as u
 from astropy.time import Time
 from astropy.utils.masked import Masked
 
 from lightkurve.lightcurve import LightCurve
-from lightkurve.periodogram import Periodogram
+from lightkurve.periodogram import (
+    Periodogram,
+    LombScarglePeriodogram,
+    LombScarglePeriodogramBatch,
+)
 from lightkurve.utils import LightkurveWarning
 
 HAS_NIFTY_LS = True
@@ -219,6 +223,38 @@ def test_smooth():
         p.smooth(method="logmedian", filter_width=5.0 * u.day)
 
 
+@pytest.mark.parametrize("filter_width", [0.01, 0.1, 0.37])
+def test_smooth_logmedian_matches_reference(filter_width):
+    """The sliding-window 'logmedian' smooth must match the mask-based loop."""
+
+    def reference(frequency, power):
+        count = np.zeros(len(frequency), dtype=int)
+        bkg = np.zeros(len(frequency))
+        x0 = np.log10(frequency[0])
+        while x0 < np.log10(frequency[-1]):
+            m = np.abs(np.log10(frequency) - x0) < filter_width
+            if m.any():
+                bkg[m] += np.nanmedian(power[m]) / (8.0 / 9.0) ** 3
+                count[m] += 1
+            x0 += 0.5 * filter_width
+        return bkg / count
+
+    np.random.seed(7)
+    frequency = np.sort(np.random.uniform(1, 300, 2000))
+    power = np.random.chisquare(2, 2000)
+    power[::97] = np.nan
+    # Also check an unsorted grid, keeping the first and last frequencies
+    shuffled = np.concatenate([[0], np.random.permutation(np.arange(1, 1999)), [1999]])
+    for idx in [np.arange(2000), shuffled]:
+        p = Periodogram(
+            frequency[idx] * u.microhertz, power[idx] * u.cds.ppm**2 / u.microhertz
+        )
+        assert_array_equal(
+            p.smooth(method="logmedian", filter_width=filter_width).power.value,
+            reference(frequency[idx], power[idx]),
+        )
+
+
 def test_flatten():
     npts = 10000
     np.random.seed(12069424)
@@ -431,6 +467,40 @@ def test_error_messages():
     assert "method 'not-implemented' is not supported" in err.value.args[0]
 
 
+def test_bls_workers_and_coarse_to_fine():
+    """Parallel and coarse-to-fine BLS must agree with the full single-process search."""
+    np.random.seed(11)
+    time = np.arange(0, 20, 0.02)
+    flux = np.ones_like(time) + 0.01 * np.random.randn(len(time))
+    flux[np.abs((time - 0.5 + 1.0) % 2.0 - 1.0) < 0.05] -= 0.2
+    lc = LightCurve(time=time, flux=flux, flux_err=np.full(len(time), 0.01))
+
+    full = lc.to_periodogram("bls")
+    parallel = lc.to_periodogram("bls", n_workers=3)
+    assert_array_equal(parallel.period, full.period)
+    assert_array_equal(parallel.power, full.power)
+    assert_array_equal(parallel.transit_time.value, full.transit_time.value)
+    assert_array_equal(parallel.depth, full.depth)
+
+    for n_workers in [1, 2]:
+        fine = lc.to_periodogram(
+            "bls", strategy="coarse-to-fine", coarse_factor=20, top_k=3,
+            n_workers=n_workers,
+        )
+        assert len(fine.period) < len(full.period)
+        idx = np.searchsorted(full.period.value, fine.period.value)
+        assert_array_equal(full.period[idx], fine.period)
+        assert_array_equal(full.power[idx], fine.power)
+        assert fine.max_power == full.max_power
+        assert fine.period_at_max_power == full.period_at_max_power
+        assert fine.compute_stats()["transit_times"] is not None
+
+    with pytest.raises(ValueError):
+        lc.to_periodogram("bls", strategy="sparse")
+    with pytest.raises(ValueError):
+        lc.to_periodogram("bls", n_workers=0)
+
+
 def test_bls_period():
     """Regression test for #514."""
     lc = LightCurve(time=[1, 2, 3], flux=[4, 5, 6])
@@ -513,3 +583,67 @@ def test_ls_method_uneven_freq_grid(ls_method, nterms, expected_period):
     assert_equal(pg.nterms, nterms)
     # automatically switched to slow method
     assert_equal(pg.ls_method, expected_method)
+
+
+@pytest.mark.parametrize("ls_method, nterms, n_workers", [
+    ("fast", 1, 1),
+    ("fast", 1, 2),
+    ("fastchi2", 2, 1),
+    ("fastnifty", 1, 1),
+    ("fastnifty_chi2", 2, 1),
+])
+@pytest.mark.parametrize("normalization", ["amplitude", "psd"])
+def test_ls_from_lightcurves(ls_method, nterms, n_workers, normalization):
+    """Each row of a batch must match the periodogram of its light curve."""
+    if "nifty" in ls_method and not HAS_NIFTY_LS:
+        pytest.skip("skipped because nifty-ls is not installed")
+
+    np.random.seed(42)
+    lc = create_beta_lyr_like_lc()
+    lcs = [lc]
+    for idx in range(3):
+        # Same time stamps, different noise
+        noisy = lc.copy()
+        noisy.flux = noisy.flux + np.random.normal(0, 0.1, len(lc)) * noisy.flux.unit
+        noisy.meta["TARGETID"] = idx
+        lcs.append(noisy)
+    # Different time stamps and a NaN
+    shifted = lc[10:].copy()
+    shifted.flux[5] = np.nan
+    lcs.append(shifted)
+
+    batch = LombScarglePeriodogram.from_lightcurves(
+        lcs, ls_method=ls_method, nterms=nterms, normalization=normalization,
+        n_workers=n_workers,
+    )
+    assert isinstance(batch, LombScarglePeriodogramBatch)
+    assert len(batch) == len(lcs)
+    assert batch.power.shape == (len(lcs), len(batch.frequency))
+    assert batch[1].targetid == 0
+    assert batch[1:3].targetid == [0, 1]
+
+    for idx, pg in enumerate(batch):
+        assert isinstance(pg, LombScarglePeriodogram)
+        expected = LombScarglePeriodogram.from_lightcurve(
+            lcs[idx], frequency=batch.frequency, ls_method=ls_method, nterms=nterms,
+            normalization=normalization,
+        )
+        assert pg.power.unit == expected.power.unit
+        assert_allclose(pg.power.value, expected.power.value, rtol=1e-6, atol=1e-10)
+        assert pg.nyquist == expected.nyquist
+    assert batch.period_at_max_power[2] == batch[2].period_at_max_power
+    assert batch.max_power[2] == batch[2].max_power
+
+    # The per-target views must be able to build their model
+    for pg in (batch[4], batch[3:][1]):
+        expected = LombScarglePeriodogram.from_lightcurve(
+            lcs[4], frequency=batch.frequency, ls_method=ls_method, nterms=nterms,
+            normalization=normalization,
+        )
+        model = pg.model(time=lcs[4].time)
+        assert_allclose(
+            model.flux.value, expected.model(time=lcs[4].time).flux.value, rtol=1e-6
+        )
+
+    with pytest.raises(ValueError):
+        LombScarglePeriodogram.from_lightcurves([])
@@ -5,7 +5,9 @@ with the `@pytest.mark.remote_data` decorator below will only run if the
 `--remote-data` argument is passed to py.test.  This allows tests to pass
 if no internet connection is available.
 """
+import json
 import os
+import numpy as np
 import pytest
 
 from numpy.testing import assert_almost_equal, assert_array_equal
@@ -661,3 +663,286 @@ def test_customize_search_result_display_case_nonexistent_column():
     search = search_lightcurve("TIC390021728")
     search.display_extra_columns = ['foo_col']
     assert 'foo_col' not in search.__repr__()
+
+
+@pytest.fixture
+def local_mast(monkeypatch):
+    """Serves the test data directory over HTTP and makes
+    `Observations.download_products` download from it, so that downloads can
+    be tested without access to MAST."""
+    import functools
+    import http.server
+    import shutil
+    import threading
+    import urllib.request
+    from astroquery.mast import Observations
+
+    datadir = os.path.join(os.path.dirname(__file__), "data")
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=datadir
+    )
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    state = {"calls": [], "failures": {}}
+
+    def download_products(products, mrp_only=False, download_dir=None):
+        row = products[0]
+        state["calls"].append(row["productFilename"])
+        if state["failures"].get(row["productFilename"], 0) > 0:
+            state["failures"][row["productFilename"]] -= 1
+            raise ConnectionError("Simulated network failure")
+        path = os.path.join(
+            download_dir, "mastDownload", row["obs_collection"], row["obs_id"],
+            row["productFilename"],
+        )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        url = "http://127.0.0.1:{}/{}".format(
+            server.server_address[1], row["dataURI"].split("/")[-1]
+        )
+        with urllib.request.urlopen(url) as response, open(path, "wb") as out:
+            shutil.copyfileobj(response, out)
+        return Table(data={"Local Path": [path], "Status": ["COMPLETE"],
+                           "Message": [None], "URL": [url]})
+
+    monkeypatch.setattr(Observations, "download_products", download_products)
+    monkeypatch.setattr(lk.search, "DOWNLOAD_RETRY_DELAY", 0)
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _local_search_result(n):
+    """Returns a SearchResult of ``n`` copies of the Pi Men test light curve."""
+    table = Table(
+        {
+            "description": ["Light curves"] * n,
+            "obs_collection": ["TESS"] * n,
+            "obs_id": ["obs{}".format(idx) for idx in range(n)],
+            "productFilename": ["lc{}.fits".format(idx) for idx in range(n)],
+            "dataURI": [
+                "mast:TESS/product/{}/test-lc-tess-pimen-100-cadences.fits".format(idx)
+                for idx in range(n)
+            ],
+            "author": ["SPOC"] * n,
+            "mission": ["TESS Sector {:02d}".format(idx + 1) for idx in range(n)],
+            "sequence_number": list(range(1, n + 1)),
+            "exptime": [120.0] * n,
+            "distance": [0.0] * n,
+            "t_min": [58325.0 + 27 * idx for idx in range(n)],
+            "target_name": ["261136679"] * n,
+        }
+    )
+    return SearchResult(table)
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+def test_download_all_local(local_mast, n_workers):
+    """download_all() with concurrency, retries and a resumable manifest."""
+    sr = _local_search_result(6)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        manifest = os.path.join(tmpdirname, "manifest.json")
+        # One file fails more often than it is retried: the bulk download fails,
+        # but the completed files are recorded in the manifest
+        local_mast["failures"] = {"lc0.fits": 2, "lc3.fits": 5}
+        with pytest.raises(ConnectionError):
+            sr.download_all(
+                download_dir=tmpdirname, n_workers=n_workers, max_retries=2,
+                manifest=manifest,
+            )
+        assert local_mast["calls"].count("lc3.fits") == 3
+        assert os.path.exists(manifest)
+
+        # Resuming only downloads the files missing from the manifest
+        local_mast["calls"].clear()
+        local_mast["failures"] = {}
+        with open(manifest) as fp:
+            n_recorded = len(json.load(fp))
+        assert 3 <= n_recorded < 6
+        lcc = sr.download_all(
+            download_dir=tmpdirname, n_workers=n_workers, manifest=manifest
+        )
+        assert len(local_mast["calls"]) == 6 - n_recorded
+        assert "lc3.fits" in local_mast["calls"]
+        assert len(lcc) == 6
+        assert [lc.meta["SECTOR"] for lc in lcc] == [1] * 6
+        assert_array_equal(lcc[0].flux, lcc[5].flux)
+
+
+@pytest.fixture
+def search_cache(tmp_path):
+    """Enables the on-disk search cache in a temporary cache directory."""
+    with lk.conf.set_temp("cache_dir", str(tmp_path)):
+        with lk.conf.set_temp("search_cache_ttl", 1.0):
+            yield tmp_path
+
+
+def test_search_cache(search_cache, monkeypatch):
+    """Search results are cached on disk, expire, and can be used offline."""
+    from lightkurve.search import _search_cached
+
+    calls = []
+
+    @_search_cached("test")
+    def search(target, radius=None, mission=("Kepler", "TESS")):
+        calls.append(target)
+        return Table({"target": [str(target)], "radius": [str(radius)]})
+
+    assert search("Pi Men")["target"][0] == "Pi Men"
+    assert search("Pi Men", radius=None)["target"][0] == "Pi Men"
+    assert len(calls) == 1
+    search("Pi Men", radius=1 * u.arcsec)
+    search(SkyCoord(10, 20, unit="deg"))
+    search(SkyCoord(10, 20, unit="deg"))
+    assert len(calls) == 3
+
+    # Offline mode only serves cached results
+    with lk.conf.set_temp("search_offline", True):
+        assert search("Pi Men")["target"][0] == "Pi Men"
+        with pytest.raises(SearchError, match="Offline"):
+            search("KIC 8462852")
+    assert len(calls) == 3
+
+    # Expired entries are refreshed
+    with lk.conf.set_temp("search_cache_ttl", 1e-12):
+        search("Pi Men")
+    assert len(calls) == 4
+
+    # The least recently used entries are evicted when the cache is too large
+    entries = list((search_cache / "search_cache" / "test").glob("*.pickle"))
+    assert len(entries) == 3
+    with lk.conf.set_temp("search_cache_max_size", 1.5 * entries[0].stat().st_size / 1e6):
+        search("KIC 8462852")
+    assert len(list((search_cache / "search_cache" / "test").glob("*.pickle"))) == 1
+    search("KIC 8462852")
+    assert len(calls) == 5
+
+    # The cache is not used if it is disabled
+    with lk.conf.set_temp("search_cache_ttl", 0):
+        search("KIC 8462852")
+    assert len(calls) == 6
+
+
+def test_resolve_object_cache(search_cache, monkeypatch):
+    from astroquery.mast import MastClass
+    from lightkurve.search import _resolve_object
+
+    calls = []
+
+    def resolve_object(self, target):
+        calls.append(target)
+        return SkyCoord(83.2, -80.5, unit="deg")
+
+    monkeypatch.setattr(MastClass, "resolve_object", resolve_object)
+    assert _resolve_object("Pi Men").ra.deg == 83.2
+    assert _resolve_object("Pi Men").dec.deg == -80.5
+    assert calls == ["Pi Men"]
+
+
+@pytest.fixture
+def fake_mast(monkeypatch):
+    """Replaces the MAST observation and product queries with a small
+    in-memory catalog of TESS observations."""
+    from astropy.table import MaskedColumn
+    from astroquery.exceptions import ResolverError
+    from astroquery.mast import Observations
+
+    catalog = Table(
+        {
+            "target_name": ["261136679", "261136679", "25155310", "261136679"],
+            "obs_id": ["obs-pimen-s1", "obs-pimen-s13", "obs-25155310-s1", "obs-pimen-s27"],
+            "obsid": [1, 2, 3, 4],
+            "project": ["TESS"] * 4,
+            "provenance_name": ["SPOC"] * 4,
+            "sequence_number": MaskedColumn([1, 13, 1, 27]),
+            "t_exptime": [120.0, 120.0, 120.0, 20.0],
+            "t_min": [58325.0, 58653.0, 58325.0, 59036.0],
+            "s_ra": [84.29, 84.29, 10.0, 84.29],
+            "s_dec": [-80.47, -80.47, -60.0, -80.47],
+        }
+    )
+    names = {"Pi Men": "261136679"}
+    queries = []
+
+    def query_criteria(target_name=None, objectname=None, **criteria):
+        queries.append(target_name or objectname)
+        if target_name is not None:
+            mask = np.isin(catalog["target_name"], np.atleast_1d(target_name))
+        elif objectname in names:
+            mask = catalog["target_name"] == names[objectname]
+        else:
+            raise ResolverError("Could not resolve {}".format(objectname))
+        obs = catalog[mask]
+        if objectname is not None:
+            obs["distance"] = 0.0
+        return obs
+
+    def get_product_list(observations):
+        rows = []
+        for obs_id in np.atleast_1d(observations["obs_id"]):
+            for suffix in ["lc", "tp"]:
+                rows.append(
+                    {
+                        "obs_id": obs_id,
+                        "obsID": obs_id,
+                        "description": "Light curves" if suffix == "lc" else "Target pixel files",
+                        "productFilename": "{}_{}.fits".format(obs_id, suffix),
+                        "dataURI": "mast:TESS/product/{}_{}.fits".format(obs_id, suffix),
+                    }
+                )
+        return Table(rows)
+
+    monkeypatch.setattr(Observations, "query_criteria", query_criteria)
+    monkeypatch.setattr(Observations, "get_product_list", get_product_list)
+    return queries
+
+
+def test_search_lightcurve_many(fake_mast):
+    """search_lightcurve_many must find the same products as search_lightcurve."""
+    from lightkurve.search import search_lightcurve_many, search_targetpixelfile_many
+
+    targets = ["TIC 25155310", "Pi Men", "TIC 261136679", "TIC 999", "TIC 25155310"]
+    result = search_lightcurve_many(targets, batch_size=2)
+    # one query per batch of two identifiers, one per other target or unknown identifier
+    assert len(fake_mast) == 4
+    assert result.table.meta["failures"].keys() == {3}
+    assert "Could not resolve" in result.table.meta["failures"][3]
+    for idx, target in enumerate(targets):
+        products = result[result.table["target_index"] == idx]
+        if idx == 3:
+            assert len(products) == 0
+            continue
+        expected = search_lightcurve.__wrapped__(target)
+        assert_array_equal(products.table["productFilename"], expected.table["productFilename"])
+        assert_array_equal(products.mission, expected.mission)
+        assert all(fn.endswith("lc.fits") for fn in products.table["productFilename"])
+    assert list(result.table["target_index"]) == sorted(result.table["target_index"])
+
+    # Filters are applied to the combined table, and `limit` to every target
+    result = search_targetpixelfile_many(targets, exptime=120, limit=1)
+    assert list(result.table["target_index"]) == [0, 1, 2, 4]
+    assert all(fn.endswith("tp.fits") for fn in result.table["productFilename"])
+
+
+def test_search_lightcurve_many_product_list_failure(fake_mast, monkeypatch):
+    """A failed product list batch only fails the targets of its observations."""
+    from astroquery.mast import Observations
+    from lightkurve.search import search_lightcurve_many
+
+    get_product_list = Observations.get_product_list
+
+    def failing_get_product_list(observations):
+        if "obs-25155310-s1" in observations["obs_id"]:
+            raise ConnectionError("MAST is down")
+        return get_product_list(observations)
+
+    monkeypatch.setattr(Observations, "get_product_list", failing_get_product_list)
+    targets = ["TIC 25155310", "Pi Men", "TIC 261136679"]
+    result = search_lightcurve_many(targets, batch_size=1)
+    assert result.table.meta["failures"] == {0: "MAST is down"}
+    assert set(result.table["target_index"]) == {1, 2}
+    expected = search_lightcurve.__wrapped__("Pi Men")
+    products = result[result.table["target_index"] == 1]
+    assert_array_equal(products.table["productFilename"], expected.table["productFilename"])
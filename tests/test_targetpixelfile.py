@@ -5,7 +5,7 @@ import warnings
 
 import matplotlib.pyplot as plt
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_equal, assert_allclose
 import pytest
 
 from astropy.utils.data import get_pkg_data_filename
@@ -710,6 +710,46 @@ def test_endianness():
     tpf.to_lightcurve().to_pandas().describe()
 
 
+def test_column_cache():
+    """The quality-masked columns are only cached within one extraction call,
+    so the properties follow changes to quality_mask and the pixel data."""
+    tpf = KeplerTargetPixelFile(filename_tpf_tabby_lite)
+    flux = tpf.flux
+    # Properties return copies, so modifying them does not affect the TPF
+    flux[0] = -1 * flux.unit
+    assert np.all(tpf.flux[0] != -1 * flux.unit)
+    assert tpf.shape == tpf.flux.shape
+    tpf.quality_mask = tpf.quality_mask.copy()
+    tpf.quality_mask[:10] = False
+    n_cadences = tpf.quality_mask.sum()
+    assert tpf.shape[0] == tpf.flux.shape[0] == len(tpf.time) == n_cadences
+    assert_array_equal(tpf.flux.value, tpf.hdu[1].data["FLUX"][tpf.quality_mask])
+
+    with tpf._cached_columns():
+        assert tpf._get_column("FLUX", copy=False) is tpf._get_column("FLUX", copy=False)
+        tpf.to_lightcurve()
+        assert tpf._column_cache is not None
+    assert tpf._column_cache is None
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_column(cache):
+    tpf = KeplerTargetPixelFile(filename_tpf_tabby_lite, quality_bitmask="hardest")
+    flux = tpf.hdu[1].data["FLUX"][tpf.quality_mask]
+    with tpf._cached_columns():
+        if cache:
+            tpf._get_column("FLUX")
+        assert_array_equal(tpf.read_column("FLUX"), flux)
+        assert_array_equal(tpf.read_column("FLUX", cadences=slice(5, 20)), flux[5:20])
+        assert_array_equal(tpf.read_column("FLUX", cadences=[1, 3, 7]), flux[[1, 3, 7]])
+        mask = tpf.pipeline_mask
+        assert_array_equal(
+            tpf.read_column("FLUX_ERR", cadences=slice(0, 10), aperture_mask=mask),
+            tpf.hdu[1].data["FLUX_ERR"][tpf.quality_mask][:10][:, mask],
+        )
+        assert tpf.read_column("FLUX").dtype.isnative
+
+
 def test_get_keyword():
     tpf = KeplerTargetPixelFile(filename_tpf_one_center)
     assert tpf.get_keyword("TELESCOP") == "Kepler"
@@ -752,6 +792,47 @@ def test_aperture_photometry_nan():
     assert np.isnan(lc.flux_err[2])
 
 
+def test_edit_pixel_data_after_access():
+    """Changes to the pixel data after a first access must be reflected
+    by the properties and by the light curves extracted afterwards."""
+    tpf = read(filename_tpf_one_center)
+    assert np.isfinite(tpf.flux[2]).all()
+    lc = tpf.to_lightcurve(aperture_mask="all")
+    assert np.isfinite(lc.flux[2])
+    tpf.hdu[1].data["FLUX"][2] = np.nan
+    assert np.isnan(tpf.flux[2]).all()
+    assert np.isnan(tpf.to_lightcurve(aperture_mask="all").flux[2])
+    assert np.isnan(tpf.estimate_centroids(aperture_mask="all")[0][2])
+
+
+@pytest.mark.parametrize("flux_method", ["sum", "median", "mean"])
+@pytest.mark.parametrize("centroid_method", ["moments", "quadratic"])
+def test_aperture_photometry_chunked(flux_method, centroid_method):
+    """Chunked aperture photometry must give the same light curve."""
+    for tpf in [
+        KeplerTargetPixelFile(filename_tpf_tabby_lite),
+        TessTargetPixelFile(filename_tess),
+    ]:
+        tpf.hdu[1].data["FLUX"][2] = np.nan
+        lc = tpf.to_lightcurve(flux_method=flux_method, centroid_method=centroid_method)
+        for chunk_size in [1, 7, 1000]:
+            lc_chunked = tpf.to_lightcurve(
+                flux_method=flux_method,
+                centroid_method=centroid_method,
+                chunk_size=chunk_size,
+            )
+            # float32 sums may differ in the last digit depending on the chunk shape
+            for col in ["flux", "flux_err", "centroid_col", "centroid_row"]:
+                assert_allclose(lc_chunked[col].value, lc[col].value, rtol=1e-6)
+            assert lc_chunked.flux.unit == lc.flux.unit
+        bkg = tpf.get_bkg_lightcurve()
+        bkg_chunked = tpf.get_bkg_lightcurve(chunk_size=3)
+        assert_allclose(bkg_chunked.flux.value, bkg.flux.value, rtol=1e-6)
+        assert_allclose(bkg_chunked.flux_err.value, bkg.flux_err.value, rtol=1e-6)
+    with pytest.raises(ValueError):
+        tpf.to_lightcurve(chunk_size=0)
+
+
 #@pytest.mark.remote_data
 @pytest.mark.skip  # At time of writing, the SkyBot API yields too many intermittent HTTP Errors
 def test_SSOs():
@@ -226,5 +226,25 @@ def test_centroid_quadratic_robustness(data_dtype, mask):
         assert np.isfinite(col) & np.isfinite(row)
 
 
+@pytest.mark.parametrize("mask", [None, a_mask])
+def test_centroid_quadratic_cube(mask):
+    """Centroids of a cube must match the frame-by-frame centroids."""
+    rng = np.random.default_rng(42)
+    cube = rng.normal(size=(50, 5, 5))
+    cube[rng.random(cube.shape) < 0.1] = np.nan
+    cube[3] = 0  # degenerate fit
+    cube[7, :, :] = np.nan  # no finite value
+    cols, rows = centroid_quadratic(cube, mask=mask)
+    assert cols.shape == rows.shape == (50,)
+    assert np.isnan(cols[3]) & np.isnan(rows[3])
+    assert np.isnan(cols[7]) & np.isnan(rows[7])
+    for idx in set(range(50)) - {7}:
+        col, row = centroid_quadratic(cube[idx], mask=mask)
+        assert np.isclose(col, cols[idx], equal_nan=True)
+        assert np.isclose(row, rows[idx], equal_nan=True)
+    with pytest.raises(ValueError):
+        centroid_quadratic(cube[7])
+
+
 def test_show_citation_instructions():
     show_citation_instructions()